@@ -1,26 +1,43 @@
 import scipy.stats as ss
-from scipy.special import gammaln as lgamma
-from . import statlib.fexact as f
 from .statlib.fexact import fisher_exact as f_exact
-from .statlib.asa159 import rcont2
-from .statlib.asa205 import enum as rcont
+from .logfact import LOGFACT
 import numpy as np
 import logging
+import multiprocessing
 import os
 import random
 
-
-class F2PYSTOP(Exception):
-
-    def __call__(self, status, mes=""):
-        raise self.__class__(mes)
-
-f.f2pystop = F2PYSTOP()
+# maximum number of cells (replicates x table total) simulated at once
+SIM_BATCH_CELLS = 1 << 22
+# maximum number of replicates simulated at once
+SIM_BATCH_SIZE = 500
+# bounds of the hash table size (number of keys) used by fexact
+MIN_KEYSPACE = 500
+MAX_KEYSPACE = 1 << 14
+# largest past path lengths table (LDSTP) tried by fexact before giving up,
+# about 670 MB of workspace
+MAX_PATHSPACE = 1 << 24
+# number of partial tables above which _midp gives up to fexact (about a
+# second, only reached by far tail tables with large counts)
+MIDP_MAX_PATHS = 1 << 21
+
+# error codes returned by fexact
+FEXACT_ERRORS = {
+    1: "NROW must be less than or equal to LDTABL",
+    2: "All elements of TABLE must be positive",
+    3: "All elements of TABLE are zero",
+    4: "NCOL must be greater than 1",
+    5: "The hash table key cannot be computed, table is too large",
+    6: "LDKEY is too small for this problem",
+    7: "LDSTP is too small for this problem",
+    30: "Stack length exceeded in f3xact",
+    40: "Workspace could not be allocated"
+}
 
 
 def fisher_exact(table, alternative="two-sided", hybrid=False, midP=False,
                  simulate_pval=False, replicate=2000, workspace=300,
-                 attempt=2, seed=None):
+                 attempt=2, seed=None, alpha=None, workers=1):
     """Performs a Fisher exact test on a 2x2 contingency table.
     Parameters
     ----------
@@ -37,9 +54,12 @@ def fisher_exact(table, alternative="two-sided", hybrid=False, midP=False,
     hybrid : bool
         Only used for larger than 2 x 2 tables, in which cases it indicates
         whether the exact probabilities (default) or a hybrid approximation
-        thereof should be computed.
+        thereof should be computed. With midP, the r x 2 and 2 x c tables
+        are still computed exactly, unless they are too large.
     midP : bool
-        Use this to enable mid-P correction. Could lead to slow computation.
+        Use this to enable mid-P correction. r x 2 and 2 x c tables use a
+        fast dedicated algorithm, other tables (and r x 2 tables with large
+        counts far in the tail) could lead to slow computation.
         This is not applicable for simulation p-values. `alternative` cannot
         be used if you enable midpoint correction.
     simulate_pval : bool
@@ -50,14 +70,26 @@ def fisher_exact(table, alternative="two-sided", hybrid=False, midP=False,
         test.
     workspace : int
         An integer specifying the workspace size. Default value is 300.
+        The hash table size of the network algorithm is estimated from the
+        table margins, and the past path lengths table is never smaller
+        than workspace * 500.
     attempt : int
-        Number of attempts to try, if the workspace size is not enough.
-        On each attempt, the workspace size is doubled.
+        Minimum number of attempts to try, if the workspace size is not
+        enough. On each attempt, the part of the workspace that was too
+        small is doubled, and fexact keeps trying while the past path
+        lengths table is smaller than MAX_PATHSPACE.
     seed : int
         Random number to use as seed. If a seed isn't provided. 4 bytes will be
         read from os.urandom. If this fail, getrandbits of the random module
         (with 32 random bits) will be used. In the particular case where both
         failed, the current time will be used
+    alpha : float
+        Only used for simulated p-values. If set, the simulation stops as soon
+        as the p-value is clearly above or below alpha, instead of running
+        all the replicates.
+    workers : int
+        Only used for simulated p-values. Number of processes used for the
+        simulation. The p-value does not depend on the number of workers.
 
     Returns
     -------
@@ -106,88 +138,116 @@ def fisher_exact(table, alternative="two-sided", hybrid=False, midP=False,
 
     nr, nc = c.shape
 
-    if (nr == 2 and nc == 2):
-        # I'm not sure what the fisher_exact module of ss do.
-        # So use my own function if midp is asked
-        if not midP:
-            # in this case, just use the default scipy
-            # could remove this in the future
-            return ss.fisher_exact(c, alternative)[1]
-        else:
-            return _midp(c)
+    if (nr == 2 and nc == 2) and not midP:
+        # in this case, just use the default scipy
+        # could remove this in the future
+        return ss.fisher_exact(c, alternative)[1]
 
+    if midP and min(nr, nc) == 2 and not simulate_pval:
+        # r x 2 and 2 x c tables use the network algorithm in _midp, the
+        # ones that are too large go to fexact
+        try:
+            return _midp(c)
+        except ValueError:
+            logging.debug("Table too large for _midp, using fexact instead")
+
+    pval = None
+    if simulate_pval:
+        sr = c.sum(axis=1)
+        sc = c.sum(axis=0)
+        # The zero colums and rows are droped here, see R function
+        c = c[sr > 0, :][:, sc > 0]
+        nr, nc = c.shape
+        if nr < 2 or nc < 2:
+            raise ValueError(
+                'Less than 2 non-zero column or row marginal,\n %s' % c)
+
+        statistic = -np.sum(LOGFACT(c))
+        almost = 1 + 64 * np.finfo(np.double).eps
+        tmp_res = _fisher_sim(c, replicate, seed, statistic / almost,
+                              alpha, workers)
+        pval = (1 + np.sum(tmp_res <= statistic / almost)) / \
+            (len(tmp_res) + 1.)
+    elif hybrid:
+        expect, percnt, emin = 5, 80, 1  # this is the cochran condition
+        pval = _execute_fexact(nr, nc, c, nr, expect,
+                               percnt, emin, workspace, attempt, midP)
     else:
-        pval = None
-        if simulate_pval:
-            sr = c.sum(axis=1)
-            sc = c.sum(axis=0)
-            # The zero colums and rows are droped here, see R function
-            c = c[sr > 0, :][:, sc > 0]
-            nr, nc = c.shape
-            if nr < 2 or nc < 2:
-                raise ValueError(
-                    'Less than 2 non-zero column or row marginal,\n %s' % c)
-
-            statistic = -np.sum(lgamma(c + 1))
-            tmp_res = _fisher_sim(c, replicate, seed)
-            almost = 1 + 64 * np.finfo(np.double).eps
-            pval = (1 + np.sum(tmp_res <= statistic / almost)) / \
-                (replicate + 1.)
-        elif hybrid:
-            expect, percnt, emin = 5, 80, 1  # this is the cochran condition
-            pval = _execute_fexact(nr, nc, c, nr, expect,
-                                   percnt, emin, workspace, attempt, midP)
-        else:
-            expect, percnt, emin = -1, 100, 0
-            pval = _execute_fexact(nr, nc, c, nr, expect,
-                                   percnt, emin, workspace, attempt, midP)
+        expect, percnt, emin = -1, 100, 0
+        pval = _execute_fexact(nr, nc, c, nr, expect,
+                               percnt, emin, workspace, attempt, midP)
+
+    return pval
 
-        return pval
+
+def _fexact_keyspace(c):
+    """Estimate the hash table size needed by fexact for a table.
+    The keys of a stage of the network are the row margins of the
+    remaining sub-tables, so there are at most prod(r_i + 1) of them, r_i
+    being the margins of the smallest dimension"""
+    margins = min(c.sum(axis=1), c.sum(axis=0), key=len)
+    keys = 1
+    for m in margins:
+        keys *= int(m) + 1
+        if keys >= MAX_KEYSPACE:
+            return MAX_KEYSPACE
+    return max(MIN_KEYSPACE, keys)
 
 
 def _execute_fexact(nr, nc, c, nnr, expect, percnt, emin, workspace,
                     attempt=2, midP=False):
-    """Execute fexact using the fortran routine"""
-
-    # find required workspace
-    # pval = None
-    # success = False
-    # ntot = np.sum(c)+1
-    # nco = max(nr, nc)
-    # nro = nr +nc - nco
-    # allocated = _iwork(0, ntot, 'double')
-    # allocated = _iwork(allocated, nco) *3
-    # allocated = _iwork(allocated, nco) *2
-    # k =  nro + nco +1
-    # kk = k*nco
-    # allocated = _iwork(allocated, max(k*5 + (kk<<1), nco*7 + 800))
-    # allocated =  _iwork(allocated, max(nco+401, k))
-    # iwkmax = 2e+05
-    # numb = (18 + 10 * 30)
-    # ldk = (iwkmax - allocated) / numb -1
-    success = False
+    """Execute fexact using the fortran routine.
+    The routine releases the GIL and returns an error code instead of
+    raising, so it can be called from several threads"""
+    ldkey = _fexact_keyspace(c)
+    # past path lengths table (LDSTP = mult * LDKEY) at least as large as
+    # the one of the original fexact (workspace * 500)
+    mult = max(30, -(-workspace * MIN_KEYSPACE // ldkey))
     ntry = 0
-    wk = workspace
-    while not (success or ntry >= attempt):
+    while True:
         ntry += 1
-        try:
-            pval = f_exact.fexact(nr, nc, c, nnr, expect, percnt, emin, wk)
-            success = True
-        except F2PYSTOP as error:
-            logging.warning(error.mes)
-        except Exception as e:
-            logging.warning(
-                "Workspace is not enough. You should increase it.")
-        wk = wk << 1  # double workspace
-    if not success:
-        raise ValueError('Could not execute fexact, increase workspace')
-    if midP:
-        return pval[1] - pval[0] * 0.5
-    else:
-        return pval[1]
-
-
-def _fisher_sim(c, replicate, seed=None):
+        prt, pre, ifault = f_exact.fexact(nr, nc, c, nnr, expect, percnt,
+                                          emin, mult, ldkey)
+        if ifault == 0:
+            if midP:
+                # the hybrid approximation can go below P(obs) / 2
+                return max(pre - prt * 0.5, prt * 0.5)
+            return pre
+        mes = FEXACT_ERRORS.get(ifault, "Unknown error %d" % ifault)
+        if ifault == 6:
+            # LDSTP grows with LDKEY
+            ldkey <<= 1
+        elif ifault == 7:
+            mult <<= 1
+        else:
+            raise ValueError('Could not execute fexact : %s' % mes)
+        if ntry >= attempt and mult * ldkey > MAX_PATHSPACE:
+            raise ValueError('Could not execute fexact, increase workspace')
+        logging.warning("%s, doubling it" % mes.split(' is ')[0])
+
+
+def _sim_chunk(args):
+    """Simulate `size` tables with the same margins and return their
+    statistic. The tables are obtained by random permutations of the column
+    labels of the table cases"""
+    rowlab, collab, nr, nc, size, seed, chunk, logfact = args
+    rs = np.random.RandomState([seed, chunk])
+    perm = np.argsort(rs.random_sample((size, len(collab))), axis=1)
+    cells = rowlab[None, :] * nc + collab[perm]
+    cells += np.arange(size)[:, None] * (nr * nc)
+    tables = np.bincount(cells.ravel(), minlength=size * nr * nc)
+    return -logfact[tables.reshape(size, nr * nc)].sum(axis=1)
+
+
+def _stop_early(extreme, nsim, alpha, z=3.0, minsim=100):
+    """Check if the simulated p-value is clearly different from alpha"""
+    if nsim < minsim:
+        return False
+    pval = (1. + extreme) / (nsim + 1.)
+    return abs(pval - alpha) > z * np.sqrt(pval * (1 - pval) / nsim)
+
+
+def _fisher_sim(c, replicate, seed=None, observed=None, alpha=None, workers=1):
     """Performs a simulation with `replicate` replicates in order to find an
     alternative contingency test with the same margin.
     Parameters
@@ -199,48 +259,60 @@ def _fisher_sim(c, replicate, seed=None):
 
     seed : int
         A random number to be used as seed
+    observed : float
+        Statistic of the observed table, used for early stopping
+    alpha : float
+        Stop the simulation once the p-value is clearly above or below alpha
+    workers : int
+        Number of processes used for the simulation
+
+    Replicates are simulated in batches, each batch with its own random
+    stream derived from the seed, so the results only depend on the seed.
     """
     if seed is None:
         try:
-            seed = os.urandom(4)
-            seed = int(seed.encode('hex'), 16)
+            seed = int.from_bytes(os.urandom(4), 'big')
         except:
             try:
                 seed = int(random.getrandbits(32))
             except:
                 import time
                 seed = int(time.time())
+    seed = int(seed) % (1 << 32)
 
-    seed = np.array([seed], dtype='int32')
-    key = np.array([False], dtype=bool)
-    ierror = np.array([0], dtype='int32')
-    sr, sc = c.sum(axis=1).astype('int32'), c.sum(axis=0).astype('int32')
+    sr, sc = c.sum(axis=1), c.sum(axis=0)
     nr, nc = len(sr), len(sc)
-    n = np.sum(sr)
-    results = np.zeros(replicate)
-
-    fact = np.zeros(n + 1)
-    for i in range(2, n + 1):
-        fact[i] = fact[i - 1] + np.log(i)
-
-    observed = np.zeros((nr, nc), dtype="int32", order='F')
-    for it in range(replicate):
-        rcont2(nrow=nr, ncol=nc, nrowt=sr, ncolt=sc, key=key,
-               seed=seed, matrix=observed, ierror=ierror)
-        # if we do not have an error, make spcial action
-        ans = 0.
-        tmp_observed = observed.ravel()
-        if ierror[0] != 0:
-            raise ValueError("Fortran subroutine rcont2 return an error !")
-        for j in range(nc):
-            i = 0
-            ii = j * nr
-            while(i < nr):
-                ans -= fact[tmp_observed[ii]]
-                i += 1
-                ii += 1
-        results[it] = ans
-    return results
+    n = int(np.sum(sr))
+    rowlab = np.repeat(np.arange(nr), sr)
+    collab = np.repeat(np.arange(nc), sc)
+    logfact = LOGFACT.table(n)
+
+    batch = max(1, min(replicate, SIM_BATCH_SIZE, SIM_BATCH_CELLS // max(n, 1)))
+    sizes = [min(batch, replicate - start) for start in range(0, replicate, batch)]
+    tasks = ((rowlab, collab, nr, nc, size, seed, i, logfact)
+             for i, size in enumerate(sizes))
+
+    pool = None
+    if workers > 1 and len(sizes) > 1:
+        pool = multiprocessing.Pool(min(workers, len(sizes)))
+        chunks = pool.imap(_sim_chunk, tasks)
+    else:
+        chunks = map(_sim_chunk, tasks)
+
+    results = []
+    nsim, extreme = 0, 0
+    try:
+        for res in chunks:
+            results.append(res)
+            if alpha is not None and observed is not None:
+                nsim += len(res)
+                extreme += np.sum(res <= observed)
+                if _stop_early(extreme, nsim, alpha):
+                    break
+    finally:
+        if pool is not None:
+            pool.terminate()
+    return np.concatenate(results) if results else np.zeros(0)
 
 
 def __iwork(allocated, number, itype='int'):
@@ -255,46 +327,150 @@ def __iwork(allocated, number, itype='int'):
     return allocated
 
 
-def _midp(c):
-    """Performs Fisher's Exact test with midp correction
+def _network_bounds(rows, c1, logchoose):
+    """Return hi, lo where hi[k][m] (lo[k][m]) is the largest (smallest) log
+    weight sum(log(C(r_i, x_i))) of the rows k.. with a first column total
+    of m, -inf (inf) if there is no such table"""
+    nrow = len(rows)
+    hi = [None] * (nrow + 1)
+    lo = [None] * (nrow + 1)
+    hi[nrow] = np.full(c1 + 1, -np.inf)
+    lo[nrow] = np.full(c1 + 1, np.inf)
+    hi[nrow][0] = lo[nrow][0] = 0
+    for k in range(nrow - 1, -1, -1):
+        lc = logchoose(rows[k], np.arange(min(rows[k], c1) + 1))
+        h = np.full(c1 + 1, -np.inf)
+        l = np.full(c1 + 1, np.inf)
+        for x in range(len(lc)):
+            np.maximum(h[x:], lc[x] + hi[k + 1][:c1 + 1 - x], out=h[x:])
+            np.minimum(l[x:], lc[x] + lo[k + 1][:c1 + 1 - x], out=l[x:])
+        hi[k], lo[k] = h, l
+    return hi, lo
+
+
+def _last_two(ra, rb, m, u, logchoose):
+    """Return the log of the sum of C(ra, x) C(rb, m - x) over the x where
+    its log is <= u, for each threshold of the array u (-inf if empty).
+    The log weight is concave in x, so both of its sides are sorted"""
+    x = np.arange(max(0, m - rb), min(ra, m) + 1)
+    f = logchoose(ra, x) + logchoose(rb, m - x)
+    top = np.argmax(f)
+    left, right = f[:top + 1], f[top + 1:][::-1]
+    res = np.full(len(u), -np.inf)
+    for side in (left, right):
+        if len(side):
+            ind = np.searchsorted(side, u, side='right')
+            ok = ind > 0
+            res[ok] = np.logaddexp(
+                res[ok], np.logaddexp.accumulate(side)[ind[ok] - 1])
+    return res
+
+
+def _midp(c, reltol=1e-7, maxpaths=MIDP_MAX_PATHS, eps=1e-9):
+    """Performs Fisher's Exact test with midp correction on a r x 2 (or 2 x c)
+    table. The first column values are enumerated row by row (network
+    algorithm), merging the partial tables with the same total and weight.
+    A partial table is resolved at once when all or none of its completions
+    are as extreme as the observed table (the sum over all the completions
+    is a binomial coefficient), and the last two rows are summed in closed
+    form.
     Parameters
     ----------
     c : array_like of ints
-        A m x n contingency table. Elements should be non-negative integers.
+        A r x 2 contingency table. Elements should be non-negative integers.
+    reltol : float
+        Relative tolerance used to compare a table probability to the
+        probability of the observed table
+    maxpaths : int
+        Maximum number of partial tables enumerated. A ValueError is raised
+        if the table is too large
+    eps : float
+        Partial tables with a total probability below eps times the
+        p-value are dropped
     """
-    sr, sc = c.sum(axis=1).astype('int32'), c.sum(axis=0).astype('int32')
-    nr, nc = len(sr), len(sc)
-    n = np.sum(sr)
-    global result
-    result = []
-    logfact = np.zeros(n + 1)
-    for i in range(2, n + 1):
-        logfact[i] = logfact[i - 1] + np.log(i)
-
-    def callback(iflag, table, m, n, rowsum, colsum, prob, mult):
-        global result
-        if iflag == 2 or (isinstance(iflag, list) and iflag[0] == 2):
-            tmp = np.asarray(table.tolist())
-            if not np.all(c == tmp):
-                # only add table that are different from the original that we
-                # had
-                result.append(tmp.ravel())
-
-    def table_prob(table, sr, sc, n):
-        num = np.sum([logfact[i] for i in sr]) + \
-            np.sum([logfact[j] for j in sc])
-        den = logfact[n] + np.sum([logfact[i] for i in table])
-        return np.exp(num - den)
-
-    # After this call, all the result should be in result
-    rcont(sr, sc, callback, 0)
-    problist = []
-    for rtable in result:
-        # compute the probability of each table
-        problist.append(table_prob(rtable, sr, sc, n))
-
-    problist = np.asarray(problist)
-    problist.sort()
-    cur_prob = table_prob(c.ravel(), sr, sc, n)
-    pval = np.sum(problist[problist <= cur_prob])
-    return pval + cur_prob * 0.5
+    c = np.asarray(c, dtype=np.int64)
+    if c.shape[1] != 2:
+        c = c.T
+    if c.shape[1] != 2:
+        raise ValueError("_midp expects a r x 2 or a 2 x c table")
+    c = c[c.sum(axis=1) > 0]
+    # enumerate on the column with the smallest total
+    if c[:, 0].sum() > c[:, 1].sum():
+        c = c[:, ::-1]
+    if len(c) < 2:
+        return 0.5
+    # the largest rows are the last ones, summed in closed form
+    c = c[np.argsort(c.sum(axis=1), kind='mergesort')]
+    rows = c.sum(axis=1)
+    nrow = len(rows)
+    n = int(rows.sum())
+    c1 = int(c[:, 0].sum())
+    logfact = LOGFACT.table(n)
+
+    def logchoose(a, b):
+        return logfact[a] - logfact[b] - logfact[a - b]
+
+    lognorm = logchoose(n, c1)
+    logpobs = np.sum(logchoose(rows, c[:, 0])) - lognorm
+    # tables with log(P) <= threshold are counted
+    threshold = logpobs + np.log1p(reltol) + lognorm
+    # mass that can be dropped at each row, the p-value is >= P(obs) / 2
+    logdrop = np.log(eps * 0.5 / nrow) + logpobs + lognorm
+
+    hi, lo = _network_bounds(rows, c1, logchoose)
+    rest = np.append(np.cumsum(rows[::-1])[::-1], 0)
+    placed = np.zeros(1, dtype=np.int64)
+    logw = np.zeros(1)
+    mult = np.ones(1)
+    npaths = 0
+    terms = []
+    for k in range(nrow - 1):
+        m = c1 - placed
+        # all the completions are counted, or none of them
+        allin = logw + hi[k][m] <= threshold
+        terms.append(np.log(mult[allin]) + logw[allin] +
+                     logchoose(rest[k], m[allin]))
+        keep = ~allin & (logw + lo[k][m] <= threshold)
+        placed, logw, mult = placed[keep], logw[keep], mult[keep]
+        # drop the lightest partial tables
+        mass = np.log(mult) + logw + logchoose(rest[k], c1 - placed)
+        order = np.argsort(mass)
+        ndrop = np.searchsorted(np.logaddexp.accumulate(mass[order]),
+                                logdrop, side='right')
+        keep = np.ones(len(placed), dtype=bool)
+        keep[order[:ndrop]] = False
+        placed, logw, mult = placed[keep], logw[keep], mult[keep]
+        if k == nrow - 2 or not len(placed):
+            break
+
+        r = int(rows[k])
+        xmin = np.maximum(0, c1 - placed - rest[k + 1])
+        xmax = np.minimum(r, c1 - placed)
+        cnt = xmax - xmin + 1
+        npaths += cnt.sum()
+        if npaths > maxpaths:
+            raise ValueError("Table too large for the mid-P algorithm")
+        ind = np.repeat(np.arange(len(placed)), cnt)
+        x = np.arange(len(ind)) - np.repeat(np.cumsum(cnt) - cnt, cnt) + \
+            xmin[ind]
+        placed = placed[ind] + x
+        logw = np.round(logw[ind] + logchoose(r, x), 9)
+        mult = mult[ind]
+        # merge the partial tables with the same total and weight
+        order = np.lexsort((logw, placed))
+        placed, logw, mult = placed[order], logw[order], mult[order]
+        first = np.ones(len(placed), dtype=bool)
+        first[1:] = (placed[1:] != placed[:-1]) | (logw[1:] != logw[:-1])
+        mult = np.add.reduceat(mult, np.nonzero(first)[0])
+        placed, logw = placed[first], logw[first]
+
+    m = c1 - placed
+    for mval in np.unique(m):
+        sel = m == mval
+        terms.append(np.log(mult[sel]) + logw[sel] +
+                     _last_two(int(rows[-2]), int(rows[-1]), int(mval),
+                               threshold - logw[sel], logchoose))
+
+    terms = np.concatenate(terms) - lognorm
+    pval = np.exp(terms).sum()
+    return min(1., pval - 0.5 * np.exp(logpobs))
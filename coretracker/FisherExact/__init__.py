@@ -1,2 +1,3 @@
 from .Fisher import fisher_exact
-__all__ = [fisher_exact]
+from .logfact import binom_test, logchoose, logfactorial
+__all__ = ['fisher_exact', 'binom_test', 'logchoose', 'logfactorial']
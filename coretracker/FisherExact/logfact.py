@@ -0,0 +1,74 @@
+import threading
+
+import numpy as np
+from scipy.special import gammaln, xlog1py, xlogy
+
+
+class LogFactorial(object):
+    """Process wide table of log(k!), extended on demand.
+    The table is never modified in place (a larger copy replaces it), so
+    readers do not need to lock it"""
+
+    def __init__(self, size=1024):
+        self._lock = threading.Lock()
+        self._table = self._readonly(gammaln(np.arange(size) + 1.))
+
+    @staticmethod
+    def _readonly(table):
+        table.flags.writeable = False
+        return table
+
+    def table(self, n):
+        """Return an array with log(k!) for at least every k in [0, n]"""
+        table = self._table
+        if n >= len(table):
+            with self._lock:
+                table = self._table
+                if n >= len(table):
+                    size = max(int(n) + 1, 2 * len(table))
+                    table = self._readonly(np.concatenate(
+                        [table, gammaln(np.arange(len(table), size) + 1.)]))
+                    self._table = table
+        return table
+
+    def __call__(self, k):
+        """Return log(k!)"""
+        k = np.asarray(k, dtype=np.int64)
+        return self.table(np.max(k) if k.size else 0)[k]
+
+    def logchoose(self, n, k):
+        """Return log(C(n, k))"""
+        n = np.asarray(n, dtype=np.int64)
+        k = np.asarray(k, dtype=np.int64)
+        table = self.table(np.max(n) if n.size else 0)
+        return table[n] - table[k] - table[n - k]
+
+
+LOGFACT = LogFactorial()
+
+
+def logfactorial(k):
+    """Return log(k!) using the shared table"""
+    return LOGFACT(k)
+
+
+def logchoose(n, k):
+    """Return log(C(n, k)) using the shared table"""
+    return LOGFACT.logchoose(n, k)
+
+
+def binom_test(x, n, p=0.5):
+    """Exact two-sided binomial test (same p-value as scipy.stats.binom_test):
+    sum of the probabilities of the outcomes at most as likely as x"""
+    x, n = int(x), int(n)
+    if x < 0 or x > n:
+        raise ValueError("x should be between 0 and n")
+    if p < 0 or p > 1:
+        raise ValueError("p should be between 0 and 1")
+    if x == p * n:
+        return 1.0
+    k = np.arange(n + 1)
+    logpmf = logchoose(n, k) + xlogy(k, p) + xlog1py(n - k, -p)
+    rerr = 1 + 1e-7
+    pmf = np.exp(logpmf)
+    return min(1.0, np.sum(pmf[pmf <= pmf[x] * rerr]))
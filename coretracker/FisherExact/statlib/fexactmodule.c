@@ -1,11 +1,8 @@
 /* File: fexactmodule.c
- * This file is auto-generated with f2py (version:2).
+ * This file is auto-generated with f2py (version:2.4.6).
  * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
  * written by Pearu Peterson <pearu@cens.ioc.ee>.
- * See http://cens.ioc.ee/projects/f2py2e/
- * Generation date: Wed Feb  8 23:53:19 2017
- * $Revision:$
- * $Date:$
+ * Generation date: Mon Oct 19 01:36:16 2026
  * Do not edit this file directly unless you know what you are doing!!!
  */
 
@@ -13,12 +10,16 @@
 extern "C" {
 #endif
 
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+
+/* Unconditionally included */
+#include <Python.h>
+#include <numpy/npy_os.h>
+
 /*********************** See f2py2e/cfuncs.py: includes ***********************/
-#include "Python.h"
-#include <stdarg.h>
 #include "fortranobject.h"
-#include <string.h>
-#include <setjmp.h>
 #include <math.h>
 
 /**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
@@ -26,29 +27,33 @@ static PyObject *fexact_error;
 static PyObject *fexact_module;
 
 /*********************** See f2py2e/cfuncs.py: typedefs ***********************/
-typedef char * string;
-typedef signed char signed_char;
+/*need_typedefs*/
 
 /****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
-typedef void(*cb_f2pystop_in_prterr__user__routines_typedef)(int *,string,int);
+/*need_typedefs_generated*/
 
 /********************** See f2py2e/cfuncs.py: cppmacros **********************/
-#define pyobj_from_double1(v) (PyFloat_FromDouble(v))
-\
-#define FAILNULL(p) do {                                            \
-    if ((p) == NULL) {                                              \
-        PyErr_SetString(PyExc_MemoryError, "NULL pointer found");   \
-        goto capi_fail;                                             \
-    }                                                               \
-} while (0)
-
-#define STRINGMALLOC(str,len)\
-  if ((str = (string)malloc(sizeof(char)*(len+1))) == NULL) {\
-    PyErr_SetString(PyExc_MemoryError, "out of memory");\
-    goto capi_fail;\
-  } else {\
-    (str)[len] = '\0';\
-  }
+
+/* See fortranobject.h for definitions. The macros here are provided for BC. */
+#define rank f2py_rank
+#define shape f2py_shape
+#define fshape f2py_shape
+#define len f2py_len
+#define flen f2py_flen
+#define slen f2py_slen
+#define size f2py_size
+
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
 
 #ifndef max
 #define max(a,b) ((a > b) ? (a) : (b))
@@ -63,22 +68,6 @@ typedef void(*cb_f2pystop_in_prterr__user__routines_typedef)(int *,string,int);
 #define MIN(a,b) ((a < b) ? (a) : (b))
 #endif
 
-#define PRINTPYOBJERR(obj)\
-  fprintf(stderr,"fexact.error is related to ");\
-  PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
-  fprintf(stderr,"\n");
-
-#define pyobj_from_int1(v) (PyInt_FromLong(v))
-#define pyobj_from_string1size(v,len) (PyUString_FromStringAndSize((char *)v, len))
-#ifdef DEBUGCFUNCS
-#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
-#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
-  PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
-  fprintf(stderr,"\n");
-#else
-#define CFUNCSMESS(mess)
-#define CFUNCSMESSPY(mess,obj)
-#endif
 
 #if defined(PREPEND_FORTRAN)
 #if defined(NO_APPEND_FORTRAN)
@@ -115,344 +104,95 @@ typedef void(*cb_f2pystop_in_prterr__user__routines_typedef)(int *,string,int);
 #define F_FUNC_US(f,F) F_FUNC(f,F)
 #endif
 
-#define rank(var) var ## _Rank
-#define shape(var,dim) var ## _Dims[dim]
-#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
-#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
-#define fshape(var,dim) shape(var,rank(var)-dim-1)
-#define len(var) shape(var,0)
-#define flen(var) fshape(var,0)
-#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
-/* #define index(i) capi_i ## i */
-#define slen(var) capi_ ## var ## _len
-#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
-
-#define SWAP(a,b,t) {\
-  t *c;\
-  c = a;\
-  a = b;\
-  b = c;}
-
-#define STRINGFREE(str) do {if (!(str == NULL)) free(str);} while (0)
-
-/* New SciPy */
-#define TRYPYARRAYTEMPLATECHAR case NPY_STRING: *(char *)(PyArray_DATA(arr))=*v; break;
-#define TRYPYARRAYTEMPLATELONG case NPY_LONG: *(long *)(PyArray_DATA(arr))=*v; break;
-#define TRYPYARRAYTEMPLATEOBJECT case NPY_OBJECT: (PyArray_DESCR(arr)->f->setitem)(pyobj_from_ ## ctype ## 1(*v),PyArray_DATA(arr)); break;
-
-#define TRYPYARRAYTEMPLATE(ctype,typecode) \
-        PyArrayObject *arr = NULL;\
-        if (!obj) return -2;\
-        if (!PyArray_Check(obj)) return -1;\
-        if (!(arr=(PyArrayObject *)obj)) {fprintf(stderr,"TRYPYARRAYTEMPLATE:");PRINTPYOBJERR(obj);return 0;}\
-        if (PyArray_DESCR(arr)->type==typecode)  {*(ctype *)(PyArray_DATA(arr))=*v; return 1;}\
-        switch (PyArray_TYPE(arr)) {\
-                case NPY_DOUBLE: *(double *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_INT: *(int *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_LONG: *(long *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_FLOAT: *(float *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_CDOUBLE: *(double *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_CFLOAT: *(float *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_BOOL: *(npy_bool *)(PyArray_DATA(arr))=(*v!=0); break;\
-                case NPY_UBYTE: *(unsigned char *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_BYTE: *(signed char *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_SHORT: *(short *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_USHORT: *(npy_ushort *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_UINT: *(npy_uint *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_ULONG: *(npy_ulong *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_LONGLONG: *(npy_longlong *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_ULONGLONG: *(npy_ulonglong *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_LONGDOUBLE: *(npy_longdouble *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_CLONGDOUBLE: *(npy_longdouble *)(PyArray_DATA(arr))=*v; break;\
-                case NPY_OBJECT: (PyArray_DESCR(arr)->f->setitem)(pyobj_from_ ## ctype ## 1(*v),PyArray_DATA(arr), arr); break;\
-        default: return -2;\
-        };\
-        return 1
-
-#define STRINGCOPYN(to,from,buf_size)                           \
-    do {                                                        \
-        int _m = (buf_size);                                    \
-        char *_to = (to);                                       \
-        char *_from = (from);                                   \
-        FAILNULL(_to); FAILNULL(_from);                         \
-        (void)strncpy(_to, _from, sizeof(char)*_m);             \
-        _to[_m-1] = '\0';                                      \
-        /* Padding with spaces instead of nulls */              \
-        for (_m -= 2; _m >= 0 && _to[_m] == '\0'; _m--) {      \
-            _to[_m] = ' ';                                      \
-        }                                                       \
-    } while (0)
-
 
 /************************ See f2py2e/cfuncs.py: cfuncs ************************/
-static int f2py_size(PyArrayObject* var, ...)
+
+static int
+int_from_pyobj(int* v, PyObject *obj, const char *errmess)
 {
-  npy_int sz = 0;
-  npy_int dim;
-  npy_int rank;
-  va_list argp;
-  va_start(argp, var);
-  dim = va_arg(argp, npy_int);
-  if (dim==-1)
-    {
-      sz = PyArray_SIZE(var);
+    PyObject* tmp = NULL;
+
+    if (PyLong_Check(obj)) {
+        *v = Npy__PyLong_AsInt(obj);
+        return !(*v == -1 && PyErr_Occurred());
     }
-  else
-    {
-      rank = PyArray_NDIM(var);
-      if (dim>=1 && dim<=rank)
-        sz = PyArray_DIM(var, dim-1);
-      else
-        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+
+    tmp = PyNumber_Long(obj);
+    if (tmp) {
+        *v = Npy__PyLong_AsInt(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1 && PyErr_Occurred());
     }
-  va_end(argp);
-  return sz;
-}
 
-static int create_cb_arglist(PyObject* fun,PyTupleObject* xa,const int maxnofargs,const int nofoptargs,int *nofargs,PyTupleObject **args,const char *errmess) {
-  PyObject *tmp = NULL;
-  PyObject *tmp_fun = NULL;
-  int tot,opt,ext,siz,i,di=0;
-  CFUNCSMESS("create_cb_arglist\n");
-  tot=opt=ext=siz=0;
-  /* Get the total number of arguments */
-  if (PyFunction_Check(fun))
-    tmp_fun = fun;
-  else {
-    di = 1;
-    if (PyObject_HasAttrString(fun,"im_func")) {
-      tmp_fun = PyObject_GetAttrString(fun,"im_func");
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
     }
-    else if (PyObject_HasAttrString(fun,"__call__")) {
-      tmp = PyObject_GetAttrString(fun,"__call__");
-      if (PyObject_HasAttrString(tmp,"im_func"))
-        tmp_fun = PyObject_GetAttrString(tmp,"im_func");
-      else {
-        tmp_fun = fun; /* built-in function */
-        tot = maxnofargs;
-        if (xa != NULL)
-          tot += PyTuple_Size((PyObject *)xa);
-      }
-      Py_XDECREF(tmp);
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
     }
-    else if (PyFortran_Check(fun) || PyFortran_Check1(fun)) {
-      tot = maxnofargs;
-      if (xa != NULL)
-        tot += PyTuple_Size((PyObject *)xa);
-      tmp_fun = fun;
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
     }
-    else if (F2PyCapsule_Check(fun)) {
-      tot = maxnofargs;
-      if (xa != NULL)
-        ext = PyTuple_Size((PyObject *)xa);
-      if(ext>0) {
-        fprintf(stderr,"extra arguments tuple cannot be used with CObject call-back\n");
-        goto capi_fail;
-      }
-      tmp_fun = fun;
+
+    if (tmp) {
+        if (int_from_pyobj(v, tmp, errmess)) {
+            Py_DECREF(tmp);
+            return 1;
+        }
+        Py_DECREF(tmp);
     }
-  }
-if (tmp_fun==NULL) {
-fprintf(stderr,"Call-back argument must be function|instance|instance.__call__|f2py-function but got %s.\n",(fun==NULL?"NULL":Py_TYPE(fun)->tp_name));
-goto capi_fail;
-}
-#if PY_VERSION_HEX >= 0x03000000
-  if (PyObject_HasAttrString(tmp_fun,"__code__")) {
-    if (PyObject_HasAttrString(tmp = PyObject_GetAttrString(tmp_fun,"__code__"),"co_argcount"))
-#else
-  if (PyObject_HasAttrString(tmp_fun,"func_code")) {
-    if (PyObject_HasAttrString(tmp = PyObject_GetAttrString(tmp_fun,"func_code"),"co_argcount"))
-#endif
-      tot = PyInt_AsLong(PyObject_GetAttrString(tmp,"co_argcount")) - di;
-    Py_XDECREF(tmp);
-  }
-  /* Get the number of optional arguments */
-#if PY_VERSION_HEX >= 0x03000000
-  if (PyObject_HasAttrString(tmp_fun,"__defaults__")) {
-    if (PyTuple_Check(tmp = PyObject_GetAttrString(tmp_fun,"__defaults__")))
-#else
-  if (PyObject_HasAttrString(tmp_fun,"func_defaults")) {
-    if (PyTuple_Check(tmp = PyObject_GetAttrString(tmp_fun,"func_defaults")))
-#endif
-      opt = PyTuple_Size(tmp);
-    Py_XDECREF(tmp);
-  }
-  /* Get the number of extra arguments */
-  if (xa != NULL)
-    ext = PyTuple_Size((PyObject *)xa);
-  /* Calculate the size of call-backs argument list */
-  siz = MIN(maxnofargs+ext,tot);
-  *nofargs = MAX(0,siz-ext);
-#ifdef DEBUGCFUNCS
-  fprintf(stderr,"debug-capi:create_cb_arglist:maxnofargs(-nofoptargs),tot,opt,ext,siz,nofargs=%d(-%d),%d,%d,%d,%d,%d\n",maxnofargs,nofoptargs,tot,opt,ext,siz,*nofargs);
-#endif
-  if (siz<tot-opt) {
-    fprintf(stderr,"create_cb_arglist: Failed to build argument list (siz) with enough arguments (tot-opt) required by user-supplied function (siz,tot,opt=%d,%d,%d).\n",siz,tot,opt);
-    goto capi_fail;
-  }
-  /* Initialize argument list */
-  *args = (PyTupleObject *)PyTuple_New(siz);
-  for (i=0;i<*nofargs;i++) {
-    Py_INCREF(Py_None);
-    PyTuple_SET_ITEM((PyObject *)(*args),i,Py_None);
-  }
-  if (xa != NULL)
-    for (i=(*nofargs);i<siz;i++) {
-      tmp = PyTuple_GetItem((PyObject *)xa,i-(*nofargs));
-      Py_INCREF(tmp);
-      PyTuple_SET_ITEM(*args,i,tmp);
+
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = fexact_error;
+        }
+        PyErr_SetString(err, errmess);
     }
-  CFUNCSMESS("create_cb_arglist-end\n");
-  return 1;
-capi_fail:
-  if ((PyErr_Occurred())==NULL)
-    PyErr_SetString(fexact_error,errmess);
-  return 0;
+    return 0;
 }
 
-static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
-  PyObject* tmp = NULL;
-  if (PyInt_Check(obj)) {
-    *v = (int)PyInt_AS_LONG(obj);
-    return 1;
-  }
-  tmp = PyNumber_Int(obj);
-  if (tmp) {
-    *v = PyInt_AS_LONG(tmp);
-    Py_DECREF(tmp);
-    return 1;
-  }
-  if (PyComplex_Check(obj))
-    tmp = PyObject_GetAttrString(obj,"real");
-  else if (PyString_Check(obj) || PyUnicode_Check(obj))
-    /*pass*/;
-  else if (PySequence_Check(obj))
-    tmp = PySequence_GetItem(obj,0);
-  if (tmp) {
-    PyErr_Clear();
-    if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
-    Py_DECREF(tmp);
-  }
-  {
-    PyObject* err = PyErr_Occurred();
-    if (err==NULL) err = fexact_error;
-    PyErr_SetString(err,errmess);
-  }
-  return 0;
-}
 
-static int string_from_pyobj(string *str,int *len,const string inistr,PyObject *obj,const char *errmess) {
-  PyArrayObject *arr = NULL;
-  PyObject *tmp = NULL;
-#ifdef DEBUGCFUNCS
-fprintf(stderr,"string_from_pyobj(str='%s',len=%d,inistr='%s',obj=%p)\n",(char*)str,*len,(char *)inistr,obj);
-#endif
-  if (obj == Py_None) {
-    if (*len == -1)
-      *len = strlen(inistr); /* Will this cause problems? */
-    STRINGMALLOC(*str,*len);
-    STRINGCOPYN(*str,inistr,*len+1);
-    return 1;
-  }
-  if (PyArray_Check(obj)) {
-    if ((arr = (PyArrayObject *)obj) == NULL)
-      goto capi_fail;
-    if (!ISCONTIGUOUS(arr)) {
-      PyErr_SetString(PyExc_ValueError,"array object is non-contiguous.");
-      goto capi_fail;
-    }
-    if (*len == -1)
-      *len = (PyArray_ITEMSIZE(arr))*PyArray_SIZE(arr);
-    STRINGMALLOC(*str,*len);
-    STRINGCOPYN(*str,PyArray_DATA(arr),*len+1);
-    return 1;
-  }
-  if (PyString_Check(obj)) {
-    tmp = obj;
-    Py_INCREF(tmp);
-  }
-#if PY_VERSION_HEX >= 0x03000000
-  else if (PyUnicode_Check(obj)) {
-    tmp = PyUnicode_AsASCIIString(obj);
-  }
-  else {
-    PyObject *tmp2;
-    tmp2 = PyObject_Str(obj);
-    if (tmp2) {
-      tmp = PyUnicode_AsASCIIString(tmp2);
-      Py_DECREF(tmp2);
-    }
-    else {
-      tmp = NULL;
+static int
+double_from_pyobj(double* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+        *v = PyFloat_AsDouble(obj);
+        return !(*v == -1.0 && PyErr_Occurred());
     }
-  }
-#else
-  else {
-    tmp = PyObject_Str(obj);
-  }
-#endif
-  if (tmp == NULL) goto capi_fail;
-  if (*len == -1)
-    *len = PyString_GET_SIZE(tmp);
-  STRINGMALLOC(*str,*len);
-  STRINGCOPYN(*str,PyString_AS_STRING(tmp),*len+1);
-  Py_DECREF(tmp);
-  return 1;
-capi_fail:
-  Py_XDECREF(tmp);
-  {
-    PyObject* err = PyErr_Occurred();
-    if (err==NULL) err = fexact_error;
-    PyErr_SetString(err,errmess);
-  }
-  return 0;
-}
 
-static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
-  PyObject* tmp = NULL;
-  if (PyFloat_Check(obj)) {
-#ifdef __sgi
-    *v = PyFloat_AsDouble(obj);
-#else
-    *v = PyFloat_AS_DOUBLE(obj);
-#endif
-    return 1;
-  }
-  tmp = PyNumber_Float(obj);
-  if (tmp) {
-#ifdef __sgi
-    *v = PyFloat_AsDouble(tmp);
-#else
-    *v = PyFloat_AS_DOUBLE(tmp);
-#endif
-    Py_DECREF(tmp);
-    return 1;
-  }
-  if (PyComplex_Check(obj))
-    tmp = PyObject_GetAttrString(obj,"real");
-  else if (PyString_Check(obj) || PyUnicode_Check(obj))
-    /*pass*/;
-  else if (PySequence_Check(obj))
-    tmp = PySequence_GetItem(obj,0);
-  if (tmp) {
-    PyErr_Clear();
-    if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
-    Py_DECREF(tmp);
-  }
-  {
-    PyObject* err = PyErr_Occurred();
-    if (err==NULL) err = fexact_error;
-    PyErr_SetString(err,errmess);
-  }
-  return 0;
-}
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+        *v = PyFloat_AsDouble(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
 
-static int try_pyarr_from_double(PyObject* obj,double* v) {
-  TRYPYARRAYTEMPLATE(double,'d');
-}
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
 
-static int try_pyarr_from_int(PyObject* obj,int* v) {
-  TRYPYARRAYTEMPLATE(int,'i');
+    if (tmp) {
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = fexact_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
 }
 
 
@@ -463,254 +203,19 @@ static int try_pyarr_from_int(PyObject* obj,int* v) {
 
 
 /* See f2py2e/rules.py */
-extern void F_FUNC(prterr,PRTERR)(int*,string,size_t);
 /*eof externroutines*/
 
 /******************** See f2py2e/capi_rules.py: usercode1 ********************/
 
 
 /******************* See f2py2e/cb_rules.py: buildcallback *******************/
-
-/******************* cb_f2pystop_in_prterr__user__routines *******************/
-PyObject *cb_f2pystop_in_prterr__user__routines_capi = NULL;/*was Py_None*/
-PyTupleObject *cb_f2pystop_in_prterr__user__routines_args_capi = NULL;
-int cb_f2pystop_in_prterr__user__routines_nofargs = 0;
-jmp_buf cb_f2pystop_in_prterr__user__routines_jmpbuf;
-/*typedef void(*cb_f2pystop_in_prterr__user__routines_typedef)(int *,string,int);*/
-extern void F_FUNC(f2pystop,F2PYSTOP) (int *icode_cb_capi,string mes,int mes_cb_len) {
-  PyTupleObject *capi_arglist = cb_f2pystop_in_prterr__user__routines_args_capi;
-  PyObject *capi_return = NULL;
-  PyObject *capi_tmp = NULL;
-  int capi_j,capi_i = 0;
-  int capi_longjmp_ok = 1;
-/*decl*/
-  int icode=(*icode_cb_capi);
-#ifdef F2PY_REPORT_ATEXIT
-f2py_cb_start_clock();
-#endif
-  CFUNCSMESS("cb:Call-back function cb_f2pystop_in_prterr__user__routines (maxnofargs=2(-0))\n");
-  CFUNCSMESSPY("cb:cb_f2pystop_in_prterr__user__routines_capi=",cb_f2pystop_in_prterr__user__routines_capi);
-  if (cb_f2pystop_in_prterr__user__routines_capi==NULL) {
-    capi_longjmp_ok = 0;
-    cb_f2pystop_in_prterr__user__routines_capi = PyObject_GetAttrString(fexact_module,"f2pystop");
-  }
-  if (cb_f2pystop_in_prterr__user__routines_capi==NULL) {
-    PyErr_SetString(fexact_error,"cb: Callback f2pystop not defined (as an argument or module fexact attribute).\n");
-    goto capi_fail;
-  }
-  if (F2PyCapsule_Check(cb_f2pystop_in_prterr__user__routines_capi)) {
-  cb_f2pystop_in_prterr__user__routines_typedef cb_f2pystop_in_prterr__user__routines_cptr;
-  cb_f2pystop_in_prterr__user__routines_cptr = F2PyCapsule_AsVoidPtr(cb_f2pystop_in_prterr__user__routines_capi);
-  (*cb_f2pystop_in_prterr__user__routines_cptr)(icode_cb_capi,mes,mes_cb_len);
-  return;
-  }
-  if (capi_arglist==NULL) {
-    capi_longjmp_ok = 0;
-    capi_tmp = PyObject_GetAttrString(fexact_module,"f2pystop_extra_args");
-    if (capi_tmp) {
-      capi_arglist = (PyTupleObject *)PySequence_Tuple(capi_tmp);
-      if (capi_arglist==NULL) {
-        PyErr_SetString(fexact_error,"Failed to convert fexact.f2pystop_extra_args to tuple.\n");
-        goto capi_fail;
-      }
-    } else {
-      PyErr_Clear();
-      capi_arglist = (PyTupleObject *)Py_BuildValue("()");
-    }
-  }
-  if (capi_arglist == NULL) {
-    PyErr_SetString(fexact_error,"Callback f2pystop argument list is not set.\n");
-    goto capi_fail;
-  }
-/*setdims*/
-/*pyobjfrom*/
-  if (cb_f2pystop_in_prterr__user__routines_nofargs>capi_i)
-    if (PyTuple_SetItem((PyObject *)capi_arglist,capi_i++,pyobj_from_int1(icode)))
-      goto capi_fail;
-  if (cb_f2pystop_in_prterr__user__routines_nofargs>capi_i)
-    if (PyTuple_SetItem((PyObject *)capi_arglist,capi_i++,pyobj_from_string1size(mes,mes_cb_len)))
-      goto capi_fail;
-  CFUNCSMESSPY("cb:capi_arglist=",capi_arglist);
-  CFUNCSMESS("cb:Call-back calling Python function f2pystop.\n");
-#ifdef F2PY_REPORT_ATEXIT
-f2py_cb_start_call_clock();
-#endif
-  capi_return = PyObject_CallObject(cb_f2pystop_in_prterr__user__routines_capi,(PyObject *)capi_arglist);
-#ifdef F2PY_REPORT_ATEXIT
-f2py_cb_stop_call_clock();
-#endif
-  CFUNCSMESSPY("cb:capi_return=",capi_return);
-  if (capi_return == NULL) {
-    fprintf(stderr,"capi_return is NULL\n");
-    goto capi_fail;
-  }
-  if (capi_return == Py_None) {
-    Py_DECREF(capi_return);
-    capi_return = Py_BuildValue("()");
-  }
-  else if (!PyTuple_Check(capi_return)) {
-    capi_return = Py_BuildValue("(N)",capi_return);
-  }
-  capi_j = PyTuple_Size(capi_return);
-  capi_i = 0;
-/*frompyobj*/
-  CFUNCSMESS("cb:cb_f2pystop_in_prterr__user__routines:successful\n");
-  Py_DECREF(capi_return);
-#ifdef F2PY_REPORT_ATEXIT
-f2py_cb_stop_clock();
-#endif
-  goto capi_return_pt;
-capi_fail:
-  fprintf(stderr,"Call-back cb_f2pystop_in_prterr__user__routines failed.\n");
-  Py_XDECREF(capi_return);
-  if (capi_longjmp_ok)
-    longjmp(cb_f2pystop_in_prterr__user__routines_jmpbuf,-1);
-capi_return_pt:
-  ;
-return;
-}
-/**************** end of cb_f2pystop_in_prterr__user__routines ****************/
-
+/*need_callbacks*/
 
 /*********************** See f2py2e/rules.py: buildapi ***********************/
 
-/*********************************** prterr ***********************************/
-static char doc_f2py_rout_fexact_prterr[] = "\
-prterr(icode,mes,f2pystop,[f2pystop_extra_args])\n\nWrapper for ``prterr``.\
-\n\nParameters\n----------\n"
-"icode : input int\n"
-"mes : input string(len=-1)\n"
-"f2pystop : call-back function\n"
-"\nOther Parameters\n----------------\n"
-"f2pystop_extra_args : input tuple, optional\n    Default: ()\n"
-"\nNotes\n-----\nCall-back functions::\n\n"
-"  def f2pystop(icode,mes): return \n\
-  Required arguments:\n"
-"    icode : input int\n"
-"    mes : input string(len=-1)";
-/* extern void F_FUNC(prterr,PRTERR)(int*,string,size_t); */
-static PyObject *f2py_rout_fexact_prterr(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,string,size_t)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  int icode = 0;
-  PyObject *icode_capi = Py_None;
-  string mes = NULL;
-  int slen(mes);
-  PyObject *mes_capi = Py_None;
-  PyObject *f2pystop_capi = Py_None;
-  PyTupleObject *f2pystop_xa_capi = NULL;
-  PyTupleObject *f2pystop_args_capi = NULL;
-  int f2pystop_nofargs_capi = 0;
-  static char *capi_kwlist[] = {"icode","mes","f2pystop","f2pystop_extra_args",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOO|O!:fexact.prterr",\
-    capi_kwlist,&icode_capi,&mes_capi,&f2pystop_capi,&PyTuple_Type,&f2pystop_xa_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable f2pystop */
-if (f2pystop_capi==Py_None) {
-  f2pystop_capi = PyObject_GetAttrString(fexact_module,"f2pystop");
-  if (f2pystop_capi) {
-    if (f2pystop_xa_capi==NULL) {
-      if (PyObject_HasAttrString(fexact_module,"f2pystop_extra_args")) {
-        PyObject* capi_tmp = PyObject_GetAttrString(fexact_module,"f2pystop_extra_args");
-        if (capi_tmp)
-          f2pystop_xa_capi = (PyTupleObject *)PySequence_Tuple(capi_tmp);
-        else
-          f2pystop_xa_capi = (PyTupleObject *)Py_BuildValue("()");
-        if (f2pystop_xa_capi==NULL) {
-          PyErr_SetString(fexact_error,"Failed to convert fexact.f2pystop_extra_args to tuple.\n");
-          return NULL;
-        }
-      }
-    }
-  }
-  if (f2pystop_capi==NULL) {
-    PyErr_SetString(fexact_error,"Callback f2pystop not defined (as an argument or module fexact attribute).\n");
-    return NULL;
-  }
-}
-
-  f2pystop_nofargs_capi = cb_f2pystop_in_prterr__user__routines_nofargs;
-  if (create_cb_arglist(f2pystop_capi,f2pystop_xa_capi,2,0,&cb_f2pystop_in_prterr__user__routines_nofargs,&f2pystop_args_capi,"failed in processing argument list for call-back f2pystop.")) {
-    jmp_buf f2pystop_jmpbuf;
-    CFUNCSMESS("Saving jmpbuf for `f2pystop`.\n");
-    SWAP(f2pystop_capi,cb_f2pystop_in_prterr__user__routines_capi,PyObject);
-    SWAP(f2pystop_args_capi,cb_f2pystop_in_prterr__user__routines_args_capi,PyTupleObject);
-    memcpy(&f2pystop_jmpbuf,&cb_f2pystop_in_prterr__user__routines_jmpbuf,sizeof(jmp_buf));
-  /* Processing variable icode */
-    f2py_success = int_from_pyobj(&icode,icode_capi,"fexact.prterr() 1st argument (icode) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable mes */
-  slen(mes) = -1;
-  f2py_success = string_from_pyobj(&mes,&slen(mes),"",mes_capi,"string_from_pyobj failed in converting 2nd argument `mes' of fexact.prterr to C string");
-  if (f2py_success) {
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-    if ((setjmp(cb_f2pystop_in_prterr__user__routines_jmpbuf))) {
-      f2py_success = 0;
-    } else {
-        (*f2py_func)(&icode,mes,slen(mes));
-    }
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-    STRINGFREE(mes);
-  }  /*if (f2py_success) of mes*/
-  /* End of cleaning variable mes */
-  } /*if (f2py_success) of icode*/
-  /* End of cleaning variable icode */
-    CFUNCSMESS("Restoring jmpbuf for `f2pystop`.\n");
-    cb_f2pystop_in_prterr__user__routines_capi = f2pystop_capi;
-    Py_DECREF(cb_f2pystop_in_prterr__user__routines_args_capi);
-    cb_f2pystop_in_prterr__user__routines_args_capi = f2pystop_args_capi;
-    cb_f2pystop_in_prterr__user__routines_nofargs = f2pystop_nofargs_capi;
-    memcpy(&cb_f2pystop_in_prterr__user__routines_jmpbuf,&f2pystop_jmpbuf,sizeof(jmp_buf));
-  }
-  /* End of cleaning variable f2pystop */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of prterr *******************************/
-
 /*********************************** fexact ***********************************/
 static char doc_f2py_rout_fexact_fisher_exact_fexact[] = "\
-prt,pre = fexact(nrow,ncol,table,ldtabl,expect,percnt,emin,[wkspace])\n\nWrapper for ``fexact``.\
+prt,pre,ifault = fexact(nrow,ncol,table,ldtabl,expect,percnt,emin,[wkspace,keyspace])\n\nWrapper for ``fexact``.\
 \n\nParameters\n----------\n"
 "nrow : input int\n"
 "ncol : input int\n"
@@ -721,2326 +226,203 @@ prt,pre = fexact(nrow,ncol,table,ldtabl,expect,percnt,emin,[wkspace])\n\nWrapper
 "emin : input float\n"
 "\nOther Parameters\n----------------\n"
 "wkspace : input int\n"
+"keyspace : input int\n"
 "\nReturns\n-------\n"
 "prt : float\n"
-"pre : float";
+"pre : float\n"
+"ifault : int";
 /* #declfortranroutine# */
 static PyObject *f2py_rout_fexact_fisher_exact_fexact(const PyObject *capi_self,
                            PyObject *capi_args,
                            PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,double*,int*,double*,double*,double*,int*,double*,double*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
+                           void (*f2py_func)(int*,int*,double*,int*,double*,double*,double*,int*,int*,double*,double*,int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
 /*decl*/
 
-  int nrow = 0;
-  PyObject *nrow_capi = Py_None;
-  int ncol = 0;
-  PyObject *ncol_capi = Py_None;
-  double *table = NULL;
-  npy_intp table_Dims[2] = {-1, -1};
-  const int table_Rank = 2;
-  PyArrayObject *capi_table_tmp = NULL;
-  int capi_table_intent = 0;
-  PyObject *table_capi = Py_None;
-  int ldtabl = 0;
-  PyObject *ldtabl_capi = Py_None;
-  double expect = 0;
-  PyObject *expect_capi = Py_None;
-  double percnt = 0;
-  PyObject *percnt_capi = Py_None;
-  double emin = 0;
-  PyObject *emin_capi = Py_None;
-  int wkspace = 0;
-  PyObject *wkspace_capi = Py_None;
-  double prt = 0;
-  double pre = 0;
-  int f2py_table_d0 = 0;
-  int f2py_table_d1 = 0;
-  static char *capi_kwlist[] = {"nrow","ncol","table","ldtabl","expect","percnt","emin","wkspace",NULL};
+    int nrow = 0;
+    PyObject *nrow_capi = Py_None;
+    int ncol = 0;
+    PyObject *ncol_capi = Py_None;
+    double *table = NULL;
+    npy_intp table_Dims[2] = {-1, -1};
+    const int table_Rank = 2;
+    PyArrayObject *capi_table_as_array = NULL;
+    int capi_table_intent = 0;
+    PyObject *table_capi = Py_None;
+    int ldtabl = 0;
+    PyObject *ldtabl_capi = Py_None;
+    double expect = 0;
+    PyObject *expect_capi = Py_None;
+    double percnt = 0;
+    PyObject *percnt_capi = Py_None;
+    double emin = 0;
+    PyObject *emin_capi = Py_None;
+    int wkspace = 0;
+    PyObject *wkspace_capi = Py_None;
+    int keyspace = 0;
+    PyObject *keyspace_capi = Py_None;
+    double prt = 0;
+    double pre = 0;
+    int ifault = 0;
+    int f2py_table_d0 = 0;
+    int f2py_table_d1 = 0;
+    static char *capi_kwlist[] = {"nrow","ncol","table","ldtabl","expect","percnt","emin","wkspace","keyspace",NULL};
 
 /*routdebugenter*/
 #ifdef F2PY_REPORT_ATEXIT
 f2py_start_clock();
 #endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOOOO|O:fexact.fisher_exact.fexact",\
-    capi_kwlist,&nrow_capi,&ncol_capi,&table_capi,&ldtabl_capi,&expect_capi,&percnt_capi,&emin_capi,&wkspace_capi))
-    return NULL;
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOO|OO:fexact.fisher_exact.fexact",\
+        capi_kwlist,&nrow_capi,&ncol_capi,&table_capi,&ldtabl_capi,&expect_capi,&percnt_capi,&emin_capi,&wkspace_capi,&keyspace_capi))
+        return NULL;
 /*frompyobj*/
-  /* Processing variable pre */
-  /* Processing variable nrow */
-    f2py_success = int_from_pyobj(&nrow,nrow_capi,"fexact.fisher_exact.fexact() 1st argument (nrow) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable emin */
-    f2py_success = double_from_pyobj(&emin,emin_capi,"fexact.fisher_exact.fexact() 7th argument (emin) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable prt */
-  /* Processing variable ncol */
-    f2py_success = int_from_pyobj(&ncol,ncol_capi,"fexact.fisher_exact.fexact() 2nd argument (ncol) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable ldtabl */
-    f2py_success = int_from_pyobj(&ldtabl,ldtabl_capi,"fexact.fisher_exact.fexact() 4th argument (ldtabl) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable table */
-  ;
-  capi_table_intent |= F2PY_INTENT_IN;
-  capi_table_tmp = array_from_pyobj(NPY_DOUBLE,table_Dims,table_Rank,capi_table_intent,table_capi);
-  if (capi_table_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 3rd argument `table' of fexact.fisher_exact.fexact to C/Fortran array" );
-  } else {
-    table = (double *)(PyArray_DATA(capi_table_tmp));
-
-  /* Processing variable percnt */
-    f2py_success = double_from_pyobj(&percnt,percnt_capi,"fexact.fisher_exact.fexact() 6th argument (percnt) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable wkspace */
-  if (wkspace_capi != Py_None)
-    f2py_success = int_from_pyobj(&wkspace,wkspace_capi,"fexact.fisher_exact.fexact() 1st keyword (wkspace) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable expect */
-    f2py_success = double_from_pyobj(&expect,expect_capi,"fexact.fisher_exact.fexact() 5th argument (expect) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable f2py_table_d0 */
-  f2py_table_d0 = shape(table, 0);
-  /* Processing variable f2py_table_d1 */
-  f2py_table_d1 = shape(table, 1);
+    /* Processing variable nrow */
+        f2py_success = int_from_pyobj(&nrow,nrow_capi,"fexact.fisher_exact.fexact() 1st argument (nrow) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable ncol */
+        f2py_success = int_from_pyobj(&ncol,ncol_capi,"fexact.fisher_exact.fexact() 2nd argument (ncol) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable table */
+    ;
+    capi_table_intent |= F2PY_INTENT_IN;
+    const char capi_errmess[] = "fexact.fexact.fisher_exact.fexact: failed to create array from the 3rd argument `table`";
+    capi_table_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,table_Dims,table_Rank,  capi_table_intent,table_capi,capi_errmess);
+    if (capi_table_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = fexact_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        table = (double *)(PyArray_DATA(capi_table_as_array));
+
+    /* Processing variable ldtabl */
+        f2py_success = int_from_pyobj(&ldtabl,ldtabl_capi,"fexact.fisher_exact.fexact() 4th argument (ldtabl) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable expect */
+        f2py_success = double_from_pyobj(&expect,expect_capi,"fexact.fisher_exact.fexact() 5th argument (expect) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable percnt */
+        f2py_success = double_from_pyobj(&percnt,percnt_capi,"fexact.fisher_exact.fexact() 6th argument (percnt) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable emin */
+        f2py_success = double_from_pyobj(&emin,emin_capi,"fexact.fisher_exact.fexact() 7th argument (emin) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable wkspace */
+    if (wkspace_capi != Py_None)
+        f2py_success = int_from_pyobj(&wkspace,wkspace_capi,"fexact.fisher_exact.fexact() 1st keyword (wkspace) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable keyspace */
+    if (keyspace_capi != Py_None)
+        f2py_success = int_from_pyobj(&keyspace,keyspace_capi,"fexact.fisher_exact.fexact() 2nd keyword (keyspace) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable prt */
+    /* Processing variable pre */
+    /* Processing variable ifault */
+    /* Processing variable f2py_table_d0 */
+    f2py_table_d0 = shape(table, 0);
+    /* Processing variable f2py_table_d1 */
+    f2py_table_d1 = shape(table, 1);
 /*end of frompyobj*/
 #ifdef F2PY_REPORT_ATEXIT
 f2py_start_call_clock();
 #endif
 /*callfortranroutine*/
-  (*f2py_func)(&nrow,&ncol,table,&ldtabl,&expect,&percnt,&emin,&wkspace,&prt,&pre,&f2py_table_d0,&f2py_table_d1);
+    Py_BEGIN_ALLOW_THREADS
+    (*f2py_func)(&nrow,&ncol,table,&ldtabl,&expect,&percnt,&emin,&wkspace,&keyspace,&prt,&pre,&ifault,&f2py_table_d0,&f2py_table_d1);
+    Py_END_ALLOW_THREADS
 if (PyErr_Occurred())
   f2py_success = 0;
 #ifdef F2PY_REPORT_ATEXIT
 f2py_stop_call_clock();
 #endif
 /*end of callfortranroutine*/
-    if (f2py_success) {
+        if (f2py_success) {
 /*pyobjfrom*/
 /*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("dd",prt,pre);
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("ddi",prt,pre,ifault);
 /*closepyobjfrom*/
 /*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
+        } /*if (f2py_success) after callfortranroutine*/
 /*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_table_d1 */
-  /* End of cleaning variable f2py_table_d0 */
-  } /*if (f2py_success) of expect*/
-  /* End of cleaning variable expect */
-  } /*if (f2py_success) of wkspace*/
-  /* End of cleaning variable wkspace */
-  } /*if (f2py_success) of percnt*/
-  /* End of cleaning variable percnt */
-  if((PyObject *)capi_table_tmp!=table_capi) {
-    Py_XDECREF(capi_table_tmp); }
-  }  /*if (capi_table_tmp == NULL) ... else of table*/
-  /* End of cleaning variable table */
-  } /*if (f2py_success) of ldtabl*/
-  /* End of cleaning variable ldtabl */
-  } /*if (f2py_success) of ncol*/
-  /* End of cleaning variable ncol */
-  /* End of cleaning variable prt */
-  } /*if (f2py_success) of emin*/
-  /* End of cleaning variable emin */
-  } /*if (f2py_success) of nrow*/
-  /* End of cleaning variable nrow */
-  /* End of cleaning variable pre */
+    /* End of cleaning variable f2py_table_d1 */
+    /* End of cleaning variable f2py_table_d0 */
+    /* End of cleaning variable ifault */
+    /* End of cleaning variable pre */
+    /* End of cleaning variable prt */
+    } /*if (f2py_success) of keyspace*/
+    /* End of cleaning variable keyspace */
+    } /*if (f2py_success) of wkspace*/
+    /* End of cleaning variable wkspace */
+    } /*if (f2py_success) of emin*/
+    /* End of cleaning variable emin */
+    } /*if (f2py_success) of percnt*/
+    /* End of cleaning variable percnt */
+    } /*if (f2py_success) of expect*/
+    /* End of cleaning variable expect */
+    } /*if (f2py_success) of ldtabl*/
+    /* End of cleaning variable ldtabl */
+    if((PyObject *)capi_table_as_array!=table_capi) {
+        Py_XDECREF(capi_table_as_array); }
+    }  /* if (capi_table_as_array == NULL) ... else of table */
+    /* End of cleaning variable table */
+    } /*if (f2py_success) of ncol*/
+    /* End of cleaning variable ncol */
+    } /*if (f2py_success) of nrow*/
+    /* End of cleaning variable nrow */
 /*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
+    if (capi_buildvalue == NULL) {
 /*routdebugfailure*/
-  } else {
+    } else {
 /*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
+    }
+    CFUNCSMESS("Freeing memory.\n");
 /*freemem*/
 #ifdef F2PY_REPORT_ATEXIT
 f2py_stop_clock();
 #endif
-  return capi_buildvalue;
+    return capi_buildvalue;
 }
 /******************************* end of fexact *******************************/
+/*eof body*/
 
-/*********************************** f2xact ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f2xact[] = "\
-f2xact(nrow,ncol,table,ldtabl,expect,percnt,emin,prt,pre,ldkey,ldstp,ntotal,ncols,nrows)\n\nWrapper for ``f2xact``.\
-\n\nParameters\n----------\n"
-"nrow : input int\n"
-"ncol : input int\n"
-"table : input rank-2 array('d') with bounds (f2py_table_d0,f2py_table_d1)\n"
-"ldtabl : input int\n"
-"expect : input float\n"
-"percnt : input float\n"
-"emin : input float\n"
-"prt : input float\n"
-"pre : input float\n"
-"ldkey : input int\n"
-"ldstp : input int\n"
-"ntotal : input int\n"
-"ncols : input int\n"
-"nrows : input int";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f2xact(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,double*,int*,double*,double*,double*,double*,double*,int*,int*,int*,int*,int*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
 
-  int nrow = 0;
-  PyObject *nrow_capi = Py_None;
-  int ncol = 0;
-  PyObject *ncol_capi = Py_None;
-  double *table = NULL;
-  npy_intp table_Dims[2] = {-1, -1};
-  const int table_Rank = 2;
-  PyArrayObject *capi_table_tmp = NULL;
-  int capi_table_intent = 0;
-  PyObject *table_capi = Py_None;
-  int ldtabl = 0;
-  PyObject *ldtabl_capi = Py_None;
-  double expect = 0;
-  PyObject *expect_capi = Py_None;
-  double percnt = 0;
-  PyObject *percnt_capi = Py_None;
-  double emin = 0;
-  PyObject *emin_capi = Py_None;
-  double prt = 0;
-  PyObject *prt_capi = Py_None;
-  double pre = 0;
-  PyObject *pre_capi = Py_None;
-  int ldkey = 0;
-  PyObject *ldkey_capi = Py_None;
-  int ldstp = 0;
-  PyObject *ldstp_capi = Py_None;
-  int ntotal = 0;
-  PyObject *ntotal_capi = Py_None;
-  int ncols = 0;
-  PyObject *ncols_capi = Py_None;
-  int nrows = 0;
-  PyObject *nrows_capi = Py_None;
-  int f2py_table_d0 = 0;
-  int f2py_table_d1 = 0;
-  static char *capi_kwlist[] = {"nrow","ncol","table","ldtabl","expect","percnt","emin","prt","pre","ldkey","ldstp","ntotal","ncols","nrows",NULL};
+static FortranDataDef f2py_types_def[] = {
+  {"dp",0,{{-1}},NPY_INT, 1},
+  {NULL}
+};
 
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOOOOOOOOOOO:fexact.fisher_exact.f2xact",\
-    capi_kwlist,&nrow_capi,&ncol_capi,&table_capi,&ldtabl_capi,&expect_capi,&percnt_capi,&emin_capi,&prt_capi,&pre_capi,&ldkey_capi,&ldstp_capi,&ntotal_capi,&ncols_capi,&nrows_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable pre */
-    f2py_success = double_from_pyobj(&pre,pre_capi,"fexact.fisher_exact.f2xact() 9th argument (pre) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable ldkey */
-    f2py_success = int_from_pyobj(&ldkey,ldkey_capi,"fexact.fisher_exact.f2xact() 10th argument (ldkey) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable nrow */
-    f2py_success = int_from_pyobj(&nrow,nrow_capi,"fexact.fisher_exact.f2xact() 1st argument (nrow) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable ncols */
-    f2py_success = int_from_pyobj(&ncols,ncols_capi,"fexact.fisher_exact.f2xact() 13rd argument (ncols) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable emin */
-    f2py_success = double_from_pyobj(&emin,emin_capi,"fexact.fisher_exact.f2xact() 7th argument (emin) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable ntotal */
-    f2py_success = int_from_pyobj(&ntotal,ntotal_capi,"fexact.fisher_exact.f2xact() 12nd argument (ntotal) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable nrows */
-    f2py_success = int_from_pyobj(&nrows,nrows_capi,"fexact.fisher_exact.f2xact() 14th argument (nrows) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable prt */
-    f2py_success = double_from_pyobj(&prt,prt_capi,"fexact.fisher_exact.f2xact() 8th argument (prt) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable ldstp */
-    f2py_success = int_from_pyobj(&ldstp,ldstp_capi,"fexact.fisher_exact.f2xact() 11st argument (ldstp) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable ncol */
-    f2py_success = int_from_pyobj(&ncol,ncol_capi,"fexact.fisher_exact.f2xact() 2nd argument (ncol) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable ldtabl */
-    f2py_success = int_from_pyobj(&ldtabl,ldtabl_capi,"fexact.fisher_exact.f2xact() 4th argument (ldtabl) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable table */
-  ;
-  capi_table_intent |= F2PY_INTENT_IN;
-  capi_table_tmp = array_from_pyobj(NPY_DOUBLE,table_Dims,table_Rank,capi_table_intent,table_capi);
-  if (capi_table_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 3rd argument `table' of fexact.fisher_exact.f2xact to C/Fortran array" );
-  } else {
-    table = (double *)(PyArray_DATA(capi_table_tmp));
-
-  /* Processing variable percnt */
-    f2py_success = double_from_pyobj(&percnt,percnt_capi,"fexact.fisher_exact.f2xact() 6th argument (percnt) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable expect */
-    f2py_success = double_from_pyobj(&expect,expect_capi,"fexact.fisher_exact.f2xact() 5th argument (expect) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable f2py_table_d0 */
-  f2py_table_d0 = shape(table, 0);
-  /* Processing variable f2py_table_d1 */
-  f2py_table_d1 = shape(table, 1);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&nrow,&ncol,table,&ldtabl,&expect,&percnt,&emin,&prt,&pre,&ldkey,&ldstp,&ntotal,&ncols,&nrows,&f2py_table_d0,&f2py_table_d1);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_table_d1 */
-  /* End of cleaning variable f2py_table_d0 */
-  } /*if (f2py_success) of expect*/
-  /* End of cleaning variable expect */
-  } /*if (f2py_success) of percnt*/
-  /* End of cleaning variable percnt */
-  if((PyObject *)capi_table_tmp!=table_capi) {
-    Py_XDECREF(capi_table_tmp); }
-  }  /*if (capi_table_tmp == NULL) ... else of table*/
-  /* End of cleaning variable table */
-  } /*if (f2py_success) of ldtabl*/
-  /* End of cleaning variable ldtabl */
-  } /*if (f2py_success) of ncol*/
-  /* End of cleaning variable ncol */
-  } /*if (f2py_success) of ldstp*/
-  /* End of cleaning variable ldstp */
-  } /*if (f2py_success) of prt*/
-  /* End of cleaning variable prt */
-  } /*if (f2py_success) of nrows*/
-  /* End of cleaning variable nrows */
-  } /*if (f2py_success) of ntotal*/
-  /* End of cleaning variable ntotal */
-  } /*if (f2py_success) of emin*/
-  /* End of cleaning variable emin */
-  } /*if (f2py_success) of ncols*/
-  /* End of cleaning variable ncols */
-  } /*if (f2py_success) of nrow*/
-  /* End of cleaning variable nrow */
-  } /*if (f2py_success) of ldkey*/
-  /* End of cleaning variable ldkey */
-  } /*if (f2py_success) of pre*/
-  /* End of cleaning variable pre */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
+static void f2py_setup_types(char *dp) {
+  int i_f2py=0;
+  f2py_types_def[i_f2py++].data = dp;
+}
+extern void F_FUNC(f2pyinittypes,F2PYINITTYPES)(void (*)(char*));
+static void f2py_init_types(void) {
+  F_FUNC(f2pyinittypes,F2PYINITTYPES)(f2py_setup_types);
 }
-/******************************* end of f2xact *******************************/
 
-/*********************************** f3xact ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f3xact[] = "\
-f3xact(nrow,irow,ncol,icol,dlp,mm,fact,tol)\n\nWrapper for ``f3xact``.\
-\n\nParameters\n----------\n"
-"nrow : input int\n"
-"irow : input rank-1 array('i') with bounds (f2py_irow_d0)\n"
-"ncol : input int\n"
-"icol : input rank-1 array('i') with bounds (f2py_icol_d0)\n"
-"dlp : input float\n"
-"mm : input int\n"
-"fact : input rank-1 array('d') with bounds (1)\n"
-"tol : input float";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f3xact(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,int*,int*,double*,int*,double*,double*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
 
-  int nrow = 0;
-  PyObject *nrow_capi = Py_None;
-  int *irow = NULL;
-  npy_intp irow_Dims[1] = {-1};
-  const int irow_Rank = 1;
-  PyArrayObject *capi_irow_tmp = NULL;
-  int capi_irow_intent = 0;
-  PyObject *irow_capi = Py_None;
-  int ncol = 0;
-  PyObject *ncol_capi = Py_None;
-  int *icol = NULL;
-  npy_intp icol_Dims[1] = {-1};
-  const int icol_Rank = 1;
-  PyArrayObject *capi_icol_tmp = NULL;
-  int capi_icol_intent = 0;
-  PyObject *icol_capi = Py_None;
-  double dlp = 0;
-  PyObject *dlp_capi = Py_None;
-  int mm = 0;
-  PyObject *mm_capi = Py_None;
-  double *fact = NULL;
-  npy_intp fact_Dims[1] = {-1};
-  const int fact_Rank = 1;
-  PyArrayObject *capi_fact_tmp = NULL;
-  int capi_fact_intent = 0;
-  PyObject *fact_capi = Py_None;
-  double tol = 0;
-  PyObject *tol_capi = Py_None;
-  int f2py_irow_d0 = 0;
-  int f2py_icol_d0 = 0;
-  static char *capi_kwlist[] = {"nrow","irow","ncol","icol","dlp","mm","fact","tol",NULL};
+static FortranDataDef f2py_fisher_exact_def[] = {
+  {"fexact",-1,{{-1}},0,0,NULL,(void *)f2py_rout_fexact_fisher_exact_fexact,doc_f2py_rout_fexact_fisher_exact_fexact},
+  {NULL}
+};
 
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOOOOO:fexact.fisher_exact.f3xact",\
-    capi_kwlist,&nrow_capi,&irow_capi,&ncol_capi,&icol_capi,&dlp_capi,&mm_capi,&fact_capi,&tol_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable nrow */
-    f2py_success = int_from_pyobj(&nrow,nrow_capi,"fexact.fisher_exact.f3xact() 1st argument (nrow) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable mm */
-    f2py_success = int_from_pyobj(&mm,mm_capi,"fexact.fisher_exact.f3xact() 6th argument (mm) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable irow */
-  ;
-  capi_irow_intent |= F2PY_INTENT_IN;
-  capi_irow_tmp = array_from_pyobj(NPY_INT,irow_Dims,irow_Rank,capi_irow_intent,irow_capi);
-  if (capi_irow_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 2nd argument `irow' of fexact.fisher_exact.f3xact to C/Fortran array" );
-  } else {
-    irow = (int *)(PyArray_DATA(capi_irow_tmp));
-
-  /* Processing variable dlp */
-    f2py_success = double_from_pyobj(&dlp,dlp_capi,"fexact.fisher_exact.f3xact() 5th argument (dlp) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable ncol */
-    f2py_success = int_from_pyobj(&ncol,ncol_capi,"fexact.fisher_exact.f3xact() 3rd argument (ncol) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable tol */
-    f2py_success = double_from_pyobj(&tol,tol_capi,"fexact.fisher_exact.f3xact() 8th argument (tol) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable icol */
-  ;
-  capi_icol_intent |= F2PY_INTENT_IN;
-  capi_icol_tmp = array_from_pyobj(NPY_INT,icol_Dims,icol_Rank,capi_icol_intent,icol_capi);
-  if (capi_icol_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 4th argument `icol' of fexact.fisher_exact.f3xact to C/Fortran array" );
-  } else {
-    icol = (int *)(PyArray_DATA(capi_icol_tmp));
-
-  /* Processing variable fact */
-  fact_Dims[0]=1;
-  capi_fact_intent |= F2PY_INTENT_IN;
-  capi_fact_tmp = array_from_pyobj(NPY_DOUBLE,fact_Dims,fact_Rank,capi_fact_intent,fact_capi);
-  if (capi_fact_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 7th argument `fact' of fexact.fisher_exact.f3xact to C/Fortran array" );
-  } else {
-    fact = (double *)(PyArray_DATA(capi_fact_tmp));
-
-  /* Processing variable f2py_irow_d0 */
-  f2py_irow_d0 = shape(irow, 0);
-  /* Processing variable f2py_icol_d0 */
-  f2py_icol_d0 = shape(icol, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&nrow,irow,&ncol,icol,&dlp,&mm,fact,&tol,&f2py_irow_d0,&f2py_icol_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_icol_d0 */
-  /* End of cleaning variable f2py_irow_d0 */
-  if((PyObject *)capi_fact_tmp!=fact_capi) {
-    Py_XDECREF(capi_fact_tmp); }
-  }  /*if (capi_fact_tmp == NULL) ... else of fact*/
-  /* End of cleaning variable fact */
-  if((PyObject *)capi_icol_tmp!=icol_capi) {
-    Py_XDECREF(capi_icol_tmp); }
-  }  /*if (capi_icol_tmp == NULL) ... else of icol*/
-  /* End of cleaning variable icol */
-  } /*if (f2py_success) of tol*/
-  /* End of cleaning variable tol */
-  } /*if (f2py_success) of ncol*/
-  /* End of cleaning variable ncol */
-  } /*if (f2py_success) of dlp*/
-  /* End of cleaning variable dlp */
-  if((PyObject *)capi_irow_tmp!=irow_capi) {
-    Py_XDECREF(capi_irow_tmp); }
-  }  /*if (capi_irow_tmp == NULL) ... else of irow*/
-  /* End of cleaning variable irow */
-  } /*if (f2py_success) of mm*/
-  /* End of cleaning variable mm */
-  } /*if (f2py_success) of nrow*/
-  /* End of cleaning variable nrow */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
+static void f2py_setup_fisher_exact(char *fexact) {
+  int i_f2py=0;
+  f2py_fisher_exact_def[i_f2py++].data = fexact;
+}
+extern void F_FUNC_US(f2pyinitfisher_exact,F2PYINITFISHER_EXACT)(void (*)(char *));
+static void f2py_init_fisher_exact(void) {
+  F_FUNC_US(f2pyinitfisher_exact,F2PYINITFISHER_EXACT)(f2py_setup_fisher_exact);
 }
-/******************************* end of f3xact *******************************/
 
-/*********************************** f4xact ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f4xact[] = "\
-f4xact(nrow,irow,ncol,icol,dsp,fact,tol)\n\nWrapper for ``f4xact``.\
-\n\nParameters\n----------\n"
-"nrow : input int\n"
-"irow : input rank-1 array('i') with bounds (f2py_irow_d0)\n"
-"ncol : input int\n"
-"icol : input rank-1 array('i') with bounds (f2py_icol_d0)\n"
-"dsp : in/output rank-0 array(float,'d')\n"
-"fact : input rank-1 array('d') with bounds (1)\n"
-"tol : input float";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f4xact(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,int*,int*,double*,double*,double*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
+/*need_f90modhooks*/
 
-  int nrow = 0;
-  PyObject *nrow_capi = Py_None;
-  int *irow = NULL;
-  npy_intp irow_Dims[1] = {-1};
-  const int irow_Rank = 1;
-  PyArrayObject *capi_irow_tmp = NULL;
-  int capi_irow_intent = 0;
-  PyObject *irow_capi = Py_None;
-  int ncol = 0;
-  PyObject *ncol_capi = Py_None;
-  int *icol = NULL;
-  npy_intp icol_Dims[1] = {-1};
-  const int icol_Rank = 1;
-  PyArrayObject *capi_icol_tmp = NULL;
-  int capi_icol_intent = 0;
-  PyObject *icol_capi = Py_None;
-  double dsp = 0;
-  PyObject *dsp_capi = Py_None;
-  double *fact = NULL;
-  npy_intp fact_Dims[1] = {-1};
-  const int fact_Rank = 1;
-  PyArrayObject *capi_fact_tmp = NULL;
-  int capi_fact_intent = 0;
-  PyObject *fact_capi = Py_None;
-  double tol = 0;
-  PyObject *tol_capi = Py_None;
-  int f2py_irow_d0 = 0;
-  int f2py_icol_d0 = 0;
-  static char *capi_kwlist[] = {"nrow","irow","ncol","icol","dsp","fact","tol",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOOOO:fexact.fisher_exact.f4xact",\
-    capi_kwlist,&nrow_capi,&irow_capi,&ncol_capi,&icol_capi,&dsp_capi,&fact_capi,&tol_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable ncol */
-    f2py_success = int_from_pyobj(&ncol,ncol_capi,"fexact.fisher_exact.f4xact() 3rd argument (ncol) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable tol */
-    f2py_success = double_from_pyobj(&tol,tol_capi,"fexact.fisher_exact.f4xact() 7th argument (tol) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable nrow */
-    f2py_success = int_from_pyobj(&nrow,nrow_capi,"fexact.fisher_exact.f4xact() 1st argument (nrow) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable fact */
-  fact_Dims[0]=1;
-  capi_fact_intent |= F2PY_INTENT_IN;
-  capi_fact_tmp = array_from_pyobj(NPY_DOUBLE,fact_Dims,fact_Rank,capi_fact_intent,fact_capi);
-  if (capi_fact_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 6th argument `fact' of fexact.fisher_exact.f4xact to C/Fortran array" );
-  } else {
-    fact = (double *)(PyArray_DATA(capi_fact_tmp));
-
-  /* Processing variable icol */
-  ;
-  capi_icol_intent |= F2PY_INTENT_IN;
-  capi_icol_tmp = array_from_pyobj(NPY_INT,icol_Dims,icol_Rank,capi_icol_intent,icol_capi);
-  if (capi_icol_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 4th argument `icol' of fexact.fisher_exact.f4xact to C/Fortran array" );
-  } else {
-    icol = (int *)(PyArray_DATA(capi_icol_tmp));
-
-  /* Processing variable dsp */
-    f2py_success = double_from_pyobj(&dsp,dsp_capi,"fexact.fisher_exact.f4xact() 5th argument (dsp) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable irow */
-  ;
-  capi_irow_intent |= F2PY_INTENT_IN;
-  capi_irow_tmp = array_from_pyobj(NPY_INT,irow_Dims,irow_Rank,capi_irow_intent,irow_capi);
-  if (capi_irow_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 2nd argument `irow' of fexact.fisher_exact.f4xact to C/Fortran array" );
-  } else {
-    irow = (int *)(PyArray_DATA(capi_irow_tmp));
-
-  /* Processing variable f2py_irow_d0 */
-  f2py_irow_d0 = shape(irow, 0);
-  /* Processing variable f2py_icol_d0 */
-  f2py_icol_d0 = shape(icol, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&nrow,irow,&ncol,icol,&dsp,fact,&tol,&f2py_irow_d0,&f2py_icol_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-  f2py_success = try_pyarr_from_double(dsp_capi,&dsp);
-  if (f2py_success) {
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-  } /*if (f2py_success) of dsp pyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_icol_d0 */
-  /* End of cleaning variable f2py_irow_d0 */
-  if((PyObject *)capi_irow_tmp!=irow_capi) {
-    Py_XDECREF(capi_irow_tmp); }
-  }  /*if (capi_irow_tmp == NULL) ... else of irow*/
-  /* End of cleaning variable irow */
-  } /*if (f2py_success) of dsp*/
-  /* End of cleaning variable dsp */
-  if((PyObject *)capi_icol_tmp!=icol_capi) {
-    Py_XDECREF(capi_icol_tmp); }
-  }  /*if (capi_icol_tmp == NULL) ... else of icol*/
-  /* End of cleaning variable icol */
-  if((PyObject *)capi_fact_tmp!=fact_capi) {
-    Py_XDECREF(capi_fact_tmp); }
-  }  /*if (capi_fact_tmp == NULL) ... else of fact*/
-  /* End of cleaning variable fact */
-  } /*if (f2py_success) of nrow*/
-  /* End of cleaning variable nrow */
-  } /*if (f2py_success) of tol*/
-  /* End of cleaning variable tol */
-  } /*if (f2py_success) of ncol*/
-  /* End of cleaning variable ncol */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of f4xact *******************************/
-
-/*********************************** f5xact ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f5xact[] = "\
-f5xact(pastp,tol,kval,key,ldkey,ipoin,stp,ldstp,ifrq,npoin,nr,nl,ifreq,itop,ipsh)\n\nWrapper for ``f5xact``.\
-\n\nParameters\n----------\n"
-"pastp : input float\n"
-"tol : input float\n"
-"kval : input int\n"
-"key : input rank-1 array('i') with bounds (f2py_key_d0)\n"
-"ldkey : input int\n"
-"ipoin : input rank-1 array('i') with bounds (f2py_ipoin_d0)\n"
-"stp : input rank-1 array('d') with bounds (f2py_stp_d0)\n"
-"ldstp : input int\n"
-"ifrq : input rank-1 array('i') with bounds (f2py_ifrq_d0)\n"
-"npoin : input rank-1 array('i') with bounds (f2py_npoin_d0)\n"
-"nr : input rank-1 array('i') with bounds (f2py_nr_d0)\n"
-"nl : input rank-1 array('i') with bounds (f2py_nl_d0)\n"
-"ifreq : input int\n"
-"itop : in/output rank-0 array(int,'i')\n"
-"ipsh : input int";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f5xact(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(double*,double*,int*,int*,int*,int*,double*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  double pastp = 0;
-  PyObject *pastp_capi = Py_None;
-  double tol = 0;
-  PyObject *tol_capi = Py_None;
-  int kval = 0;
-  PyObject *kval_capi = Py_None;
-  int *key = NULL;
-  npy_intp key_Dims[1] = {-1};
-  const int key_Rank = 1;
-  PyArrayObject *capi_key_tmp = NULL;
-  int capi_key_intent = 0;
-  PyObject *key_capi = Py_None;
-  int ldkey = 0;
-  PyObject *ldkey_capi = Py_None;
-  int *ipoin = NULL;
-  npy_intp ipoin_Dims[1] = {-1};
-  const int ipoin_Rank = 1;
-  PyArrayObject *capi_ipoin_tmp = NULL;
-  int capi_ipoin_intent = 0;
-  PyObject *ipoin_capi = Py_None;
-  double *stp = NULL;
-  npy_intp stp_Dims[1] = {-1};
-  const int stp_Rank = 1;
-  PyArrayObject *capi_stp_tmp = NULL;
-  int capi_stp_intent = 0;
-  PyObject *stp_capi = Py_None;
-  int ldstp = 0;
-  PyObject *ldstp_capi = Py_None;
-  int *ifrq = NULL;
-  npy_intp ifrq_Dims[1] = {-1};
-  const int ifrq_Rank = 1;
-  PyArrayObject *capi_ifrq_tmp = NULL;
-  int capi_ifrq_intent = 0;
-  PyObject *ifrq_capi = Py_None;
-  int *npoin = NULL;
-  npy_intp npoin_Dims[1] = {-1};
-  const int npoin_Rank = 1;
-  PyArrayObject *capi_npoin_tmp = NULL;
-  int capi_npoin_intent = 0;
-  PyObject *npoin_capi = Py_None;
-  int *nr = NULL;
-  npy_intp nr_Dims[1] = {-1};
-  const int nr_Rank = 1;
-  PyArrayObject *capi_nr_tmp = NULL;
-  int capi_nr_intent = 0;
-  PyObject *nr_capi = Py_None;
-  int *nl = NULL;
-  npy_intp nl_Dims[1] = {-1};
-  const int nl_Rank = 1;
-  PyArrayObject *capi_nl_tmp = NULL;
-  int capi_nl_intent = 0;
-  PyObject *nl_capi = Py_None;
-  int ifreq = 0;
-  PyObject *ifreq_capi = Py_None;
-  int itop = 0;
-  PyObject *itop_capi = Py_None;
-  int ipsh = 0;
-  PyObject *ipsh_capi = Py_None;
-  int f2py_key_d0 = 0;
-  int f2py_ipoin_d0 = 0;
-  int f2py_stp_d0 = 0;
-  int f2py_ifrq_d0 = 0;
-  int f2py_npoin_d0 = 0;
-  int f2py_nr_d0 = 0;
-  int f2py_nl_d0 = 0;
-  static char *capi_kwlist[] = {"pastp","tol","kval","key","ldkey","ipoin","stp","ldstp","ifrq","npoin","nr","nl","ifreq","itop","ipsh",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOOOOOOOOOOOO:fexact.fisher_exact.f5xact",\
-    capi_kwlist,&pastp_capi,&tol_capi,&kval_capi,&key_capi,&ldkey_capi,&ipoin_capi,&stp_capi,&ldstp_capi,&ifrq_capi,&npoin_capi,&nr_capi,&nl_capi,&ifreq_capi,&itop_capi,&ipsh_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable ipoin */
-  ;
-  capi_ipoin_intent |= F2PY_INTENT_IN;
-  capi_ipoin_tmp = array_from_pyobj(NPY_INT,ipoin_Dims,ipoin_Rank,capi_ipoin_intent,ipoin_capi);
-  if (capi_ipoin_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 6th argument `ipoin' of fexact.fisher_exact.f5xact to C/Fortran array" );
-  } else {
-    ipoin = (int *)(PyArray_DATA(capi_ipoin_tmp));
-
-  /* Processing variable kval */
-    f2py_success = int_from_pyobj(&kval,kval_capi,"fexact.fisher_exact.f5xact() 3rd argument (kval) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable key */
-  ;
-  capi_key_intent |= F2PY_INTENT_IN;
-  capi_key_tmp = array_from_pyobj(NPY_INT,key_Dims,key_Rank,capi_key_intent,key_capi);
-  if (capi_key_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 4th argument `key' of fexact.fisher_exact.f5xact to C/Fortran array" );
-  } else {
-    key = (int *)(PyArray_DATA(capi_key_tmp));
-
-  /* Processing variable pastp */
-    f2py_success = double_from_pyobj(&pastp,pastp_capi,"fexact.fisher_exact.f5xact() 1st argument (pastp) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable ifreq */
-    f2py_success = int_from_pyobj(&ifreq,ifreq_capi,"fexact.fisher_exact.f5xact() 13rd argument (ifreq) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable ldstp */
-    f2py_success = int_from_pyobj(&ldstp,ldstp_capi,"fexact.fisher_exact.f5xact() 8th argument (ldstp) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable nr */
-  ;
-  capi_nr_intent |= F2PY_INTENT_IN;
-  capi_nr_tmp = array_from_pyobj(NPY_INT,nr_Dims,nr_Rank,capi_nr_intent,nr_capi);
-  if (capi_nr_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 11st argument `nr' of fexact.fisher_exact.f5xact to C/Fortran array" );
-  } else {
-    nr = (int *)(PyArray_DATA(capi_nr_tmp));
-
-  /* Processing variable ldkey */
-    f2py_success = int_from_pyobj(&ldkey,ldkey_capi,"fexact.fisher_exact.f5xact() 5th argument (ldkey) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable itop */
-    f2py_success = int_from_pyobj(&itop,itop_capi,"fexact.fisher_exact.f5xact() 14th argument (itop) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable stp */
-  ;
-  capi_stp_intent |= F2PY_INTENT_IN;
-  capi_stp_tmp = array_from_pyobj(NPY_DOUBLE,stp_Dims,stp_Rank,capi_stp_intent,stp_capi);
-  if (capi_stp_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 7th argument `stp' of fexact.fisher_exact.f5xact to C/Fortran array" );
-  } else {
-    stp = (double *)(PyArray_DATA(capi_stp_tmp));
-
-  /* Processing variable npoin */
-  ;
-  capi_npoin_intent |= F2PY_INTENT_IN;
-  capi_npoin_tmp = array_from_pyobj(NPY_INT,npoin_Dims,npoin_Rank,capi_npoin_intent,npoin_capi);
-  if (capi_npoin_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 10th argument `npoin' of fexact.fisher_exact.f5xact to C/Fortran array" );
-  } else {
-    npoin = (int *)(PyArray_DATA(capi_npoin_tmp));
-
-  /* Processing variable tol */
-    f2py_success = double_from_pyobj(&tol,tol_capi,"fexact.fisher_exact.f5xact() 2nd argument (tol) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable nl */
-  ;
-  capi_nl_intent |= F2PY_INTENT_IN;
-  capi_nl_tmp = array_from_pyobj(NPY_INT,nl_Dims,nl_Rank,capi_nl_intent,nl_capi);
-  if (capi_nl_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 12nd argument `nl' of fexact.fisher_exact.f5xact to C/Fortran array" );
-  } else {
-    nl = (int *)(PyArray_DATA(capi_nl_tmp));
-
-  /* Processing variable ipsh */
-    ipsh = (int)PyObject_IsTrue(ipsh_capi);
-    f2py_success = 1;
-  if (f2py_success) {
-  /* Processing variable ifrq */
-  ;
-  capi_ifrq_intent |= F2PY_INTENT_IN;
-  capi_ifrq_tmp = array_from_pyobj(NPY_INT,ifrq_Dims,ifrq_Rank,capi_ifrq_intent,ifrq_capi);
-  if (capi_ifrq_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 9th argument `ifrq' of fexact.fisher_exact.f5xact to C/Fortran array" );
-  } else {
-    ifrq = (int *)(PyArray_DATA(capi_ifrq_tmp));
-
-  /* Processing variable f2py_key_d0 */
-  f2py_key_d0 = shape(key, 0);
-  /* Processing variable f2py_ipoin_d0 */
-  f2py_ipoin_d0 = shape(ipoin, 0);
-  /* Processing variable f2py_stp_d0 */
-  f2py_stp_d0 = shape(stp, 0);
-  /* Processing variable f2py_ifrq_d0 */
-  f2py_ifrq_d0 = shape(ifrq, 0);
-  /* Processing variable f2py_npoin_d0 */
-  f2py_npoin_d0 = shape(npoin, 0);
-  /* Processing variable f2py_nr_d0 */
-  f2py_nr_d0 = shape(nr, 0);
-  /* Processing variable f2py_nl_d0 */
-  f2py_nl_d0 = shape(nl, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&pastp,&tol,&kval,key,&ldkey,ipoin,stp,&ldstp,ifrq,npoin,nr,nl,&ifreq,&itop,&ipsh,&f2py_key_d0,&f2py_ipoin_d0,&f2py_stp_d0,&f2py_ifrq_d0,&f2py_npoin_d0,&f2py_nr_d0,&f2py_nl_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-  f2py_success = try_pyarr_from_int(itop_capi,&itop);
-  if (f2py_success) {
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-  } /*if (f2py_success) of itop pyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_nl_d0 */
-  /* End of cleaning variable f2py_nr_d0 */
-  /* End of cleaning variable f2py_npoin_d0 */
-  /* End of cleaning variable f2py_ifrq_d0 */
-  /* End of cleaning variable f2py_stp_d0 */
-  /* End of cleaning variable f2py_ipoin_d0 */
-  /* End of cleaning variable f2py_key_d0 */
-  if((PyObject *)capi_ifrq_tmp!=ifrq_capi) {
-    Py_XDECREF(capi_ifrq_tmp); }
-  }  /*if (capi_ifrq_tmp == NULL) ... else of ifrq*/
-  /* End of cleaning variable ifrq */
-  } /*if (f2py_success) of ipsh*/
-  /* End of cleaning variable ipsh */
-  if((PyObject *)capi_nl_tmp!=nl_capi) {
-    Py_XDECREF(capi_nl_tmp); }
-  }  /*if (capi_nl_tmp == NULL) ... else of nl*/
-  /* End of cleaning variable nl */
-  } /*if (f2py_success) of tol*/
-  /* End of cleaning variable tol */
-  if((PyObject *)capi_npoin_tmp!=npoin_capi) {
-    Py_XDECREF(capi_npoin_tmp); }
-  }  /*if (capi_npoin_tmp == NULL) ... else of npoin*/
-  /* End of cleaning variable npoin */
-  if((PyObject *)capi_stp_tmp!=stp_capi) {
-    Py_XDECREF(capi_stp_tmp); }
-  }  /*if (capi_stp_tmp == NULL) ... else of stp*/
-  /* End of cleaning variable stp */
-  } /*if (f2py_success) of itop*/
-  /* End of cleaning variable itop */
-  } /*if (f2py_success) of ldkey*/
-  /* End of cleaning variable ldkey */
-  if((PyObject *)capi_nr_tmp!=nr_capi) {
-    Py_XDECREF(capi_nr_tmp); }
-  }  /*if (capi_nr_tmp == NULL) ... else of nr*/
-  /* End of cleaning variable nr */
-  } /*if (f2py_success) of ldstp*/
-  /* End of cleaning variable ldstp */
-  } /*if (f2py_success) of ifreq*/
-  /* End of cleaning variable ifreq */
-  } /*if (f2py_success) of pastp*/
-  /* End of cleaning variable pastp */
-  if((PyObject *)capi_key_tmp!=key_capi) {
-    Py_XDECREF(capi_key_tmp); }
-  }  /*if (capi_key_tmp == NULL) ... else of key*/
-  /* End of cleaning variable key */
-  } /*if (f2py_success) of kval*/
-  /* End of cleaning variable kval */
-  if((PyObject *)capi_ipoin_tmp!=ipoin_capi) {
-    Py_XDECREF(capi_ipoin_tmp); }
-  }  /*if (capi_ipoin_tmp == NULL) ... else of ipoin*/
-  /* End of cleaning variable ipoin */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of f5xact *******************************/
-
-/*********************************** f6xact ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f6xact[] = "\
-f6xact(nrow,irow,iflag,kyy,key,ldkey,last,ipn)\n\nWrapper for ``f6xact``.\
-\n\nParameters\n----------\n"
-"nrow : input int\n"
-"irow : input rank-1 array('i') with bounds (f2py_irow_d0)\n"
-"iflag : input int\n"
-"kyy : input rank-1 array('i') with bounds (f2py_kyy_d0)\n"
-"key : in/output rank-1 array('i') with bounds (f2py_key_d0)\n"
-"ldkey : input int\n"
-"last : in/output rank-0 array(int,'i')\n"
-"ipn : input int";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f6xact(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  int nrow = 0;
-  PyObject *nrow_capi = Py_None;
-  int *irow = NULL;
-  npy_intp irow_Dims[1] = {-1};
-  const int irow_Rank = 1;
-  PyArrayObject *capi_irow_tmp = NULL;
-  int capi_irow_intent = 0;
-  PyObject *irow_capi = Py_None;
-  int iflag = 0;
-  PyObject *iflag_capi = Py_None;
-  int *kyy = NULL;
-  npy_intp kyy_Dims[1] = {-1};
-  const int kyy_Rank = 1;
-  PyArrayObject *capi_kyy_tmp = NULL;
-  int capi_kyy_intent = 0;
-  PyObject *kyy_capi = Py_None;
-  int *key = NULL;
-  npy_intp key_Dims[1] = {-1};
-  const int key_Rank = 1;
-  PyArrayObject *capi_key_tmp = NULL;
-  int capi_key_intent = 0;
-  PyObject *key_capi = Py_None;
-  int ldkey = 0;
-  PyObject *ldkey_capi = Py_None;
-  int last = 0;
-  PyObject *last_capi = Py_None;
-  int ipn = 0;
-  PyObject *ipn_capi = Py_None;
-  int f2py_irow_d0 = 0;
-  int f2py_kyy_d0 = 0;
-  int f2py_key_d0 = 0;
-  static char *capi_kwlist[] = {"nrow","irow","iflag","kyy","key","ldkey","last","ipn",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOOOOO:fexact.fisher_exact.f6xact",\
-    capi_kwlist,&nrow_capi,&irow_capi,&iflag_capi,&kyy_capi,&key_capi,&ldkey_capi,&last_capi,&ipn_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable last */
-    f2py_success = int_from_pyobj(&last,last_capi,"fexact.fisher_exact.f6xact() 7th argument (last) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable nrow */
-    f2py_success = int_from_pyobj(&nrow,nrow_capi,"fexact.fisher_exact.f6xact() 1st argument (nrow) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable ipn */
-    f2py_success = int_from_pyobj(&ipn,ipn_capi,"fexact.fisher_exact.f6xact() 8th argument (ipn) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable iflag */
-    f2py_success = int_from_pyobj(&iflag,iflag_capi,"fexact.fisher_exact.f6xact() 3rd argument (iflag) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable irow */
-  ;
-  capi_irow_intent |= F2PY_INTENT_IN;
-  capi_irow_tmp = array_from_pyobj(NPY_INT,irow_Dims,irow_Rank,capi_irow_intent,irow_capi);
-  if (capi_irow_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 2nd argument `irow' of fexact.fisher_exact.f6xact to C/Fortran array" );
-  } else {
-    irow = (int *)(PyArray_DATA(capi_irow_tmp));
-
-  /* Processing variable ldkey */
-    f2py_success = int_from_pyobj(&ldkey,ldkey_capi,"fexact.fisher_exact.f6xact() 6th argument (ldkey) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable kyy */
-  ;
-  capi_kyy_intent |= F2PY_INTENT_IN;
-  capi_kyy_tmp = array_from_pyobj(NPY_INT,kyy_Dims,kyy_Rank,capi_kyy_intent,kyy_capi);
-  if (capi_kyy_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 4th argument `kyy' of fexact.fisher_exact.f6xact to C/Fortran array" );
-  } else {
-    kyy = (int *)(PyArray_DATA(capi_kyy_tmp));
-
-  /* Processing variable key */
-  ;
-  capi_key_intent |= F2PY_INTENT_INOUT;
-  capi_key_tmp = array_from_pyobj(NPY_INT,key_Dims,key_Rank,capi_key_intent,key_capi);
-  if (capi_key_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 5th argument `key' of fexact.fisher_exact.f6xact to C/Fortran array" );
-  } else {
-    key = (int *)(PyArray_DATA(capi_key_tmp));
-
-  /* Processing variable f2py_irow_d0 */
-  f2py_irow_d0 = shape(irow, 0);
-  /* Processing variable f2py_kyy_d0 */
-  f2py_kyy_d0 = shape(kyy, 0);
-  /* Processing variable f2py_key_d0 */
-  f2py_key_d0 = shape(key, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&nrow,irow,&iflag,kyy,key,&ldkey,&last,&ipn,&f2py_irow_d0,&f2py_kyy_d0,&f2py_key_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-  f2py_success = try_pyarr_from_int(last_capi,&last);
-  if (f2py_success) {
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-  } /*if (f2py_success) of last pyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_key_d0 */
-  /* End of cleaning variable f2py_kyy_d0 */
-  /* End of cleaning variable f2py_irow_d0 */
-  if((PyObject *)capi_key_tmp!=key_capi) {
-    Py_XDECREF(capi_key_tmp); }
-  }  /*if (capi_key_tmp == NULL) ... else of key*/
-  /* End of cleaning variable key */
-  if((PyObject *)capi_kyy_tmp!=kyy_capi) {
-    Py_XDECREF(capi_kyy_tmp); }
-  }  /*if (capi_kyy_tmp == NULL) ... else of kyy*/
-  /* End of cleaning variable kyy */
-  } /*if (f2py_success) of ldkey*/
-  /* End of cleaning variable ldkey */
-  if((PyObject *)capi_irow_tmp!=irow_capi) {
-    Py_XDECREF(capi_irow_tmp); }
-  }  /*if (capi_irow_tmp == NULL) ... else of irow*/
-  /* End of cleaning variable irow */
-  } /*if (f2py_success) of iflag*/
-  /* End of cleaning variable iflag */
-  } /*if (f2py_success) of ipn*/
-  /* End of cleaning variable ipn */
-  } /*if (f2py_success) of nrow*/
-  /* End of cleaning variable nrow */
-  } /*if (f2py_success) of last*/
-  /* End of cleaning variable last */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of f6xact *******************************/
-
-/*********************************** f7xact ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f7xact[] = "\
-f7xact(nrow,imax,idif,k,ks,iflag)\n\nWrapper for ``f7xact``.\
-\n\nParameters\n----------\n"
-"nrow : input int\n"
-"imax : input rank-1 array('i') with bounds (f2py_imax_d0)\n"
-"idif : in/output rank-1 array('i') with bounds (f2py_idif_d0)\n"
-"k : in/output rank-0 array(int,'i')\n"
-"ks : in/output rank-0 array(int,'i')\n"
-"iflag : input int";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f7xact(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,int*,int*,int*,int*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  int nrow = 0;
-  PyObject *nrow_capi = Py_None;
-  int *imax = NULL;
-  npy_intp imax_Dims[1] = {-1};
-  const int imax_Rank = 1;
-  PyArrayObject *capi_imax_tmp = NULL;
-  int capi_imax_intent = 0;
-  PyObject *imax_capi = Py_None;
-  int *idif = NULL;
-  npy_intp idif_Dims[1] = {-1};
-  const int idif_Rank = 1;
-  PyArrayObject *capi_idif_tmp = NULL;
-  int capi_idif_intent = 0;
-  PyObject *idif_capi = Py_None;
-  int k = 0;
-  PyObject *k_capi = Py_None;
-  int ks = 0;
-  PyObject *ks_capi = Py_None;
-  int iflag = 0;
-  PyObject *iflag_capi = Py_None;
-  int f2py_imax_d0 = 0;
-  int f2py_idif_d0 = 0;
-  static char *capi_kwlist[] = {"nrow","imax","idif","k","ks","iflag",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOOO:fexact.fisher_exact.f7xact",\
-    capi_kwlist,&nrow_capi,&imax_capi,&idif_capi,&k_capi,&ks_capi,&iflag_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable ks */
-    f2py_success = int_from_pyobj(&ks,ks_capi,"fexact.fisher_exact.f7xact() 5th argument (ks) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable iflag */
-    f2py_success = int_from_pyobj(&iflag,iflag_capi,"fexact.fisher_exact.f7xact() 6th argument (iflag) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable imax */
-  ;
-  capi_imax_intent |= F2PY_INTENT_IN;
-  capi_imax_tmp = array_from_pyobj(NPY_INT,imax_Dims,imax_Rank,capi_imax_intent,imax_capi);
-  if (capi_imax_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 2nd argument `imax' of fexact.fisher_exact.f7xact to C/Fortran array" );
-  } else {
-    imax = (int *)(PyArray_DATA(capi_imax_tmp));
-
-  /* Processing variable nrow */
-    f2py_success = int_from_pyobj(&nrow,nrow_capi,"fexact.fisher_exact.f7xact() 1st argument (nrow) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable k */
-    f2py_success = int_from_pyobj(&k,k_capi,"fexact.fisher_exact.f7xact() 4th argument (k) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable idif */
-  ;
-  capi_idif_intent |= F2PY_INTENT_INOUT;
-  capi_idif_tmp = array_from_pyobj(NPY_INT,idif_Dims,idif_Rank,capi_idif_intent,idif_capi);
-  if (capi_idif_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 3rd argument `idif' of fexact.fisher_exact.f7xact to C/Fortran array" );
-  } else {
-    idif = (int *)(PyArray_DATA(capi_idif_tmp));
-
-  /* Processing variable f2py_imax_d0 */
-  f2py_imax_d0 = shape(imax, 0);
-  /* Processing variable f2py_idif_d0 */
-  f2py_idif_d0 = shape(idif, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&nrow,imax,idif,&k,&ks,&iflag,&f2py_imax_d0,&f2py_idif_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-  f2py_success = try_pyarr_from_int(k_capi,&k);
-  if (f2py_success) {
-  f2py_success = try_pyarr_from_int(ks_capi,&ks);
-  if (f2py_success) {
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-  } /*if (f2py_success) of ks pyobjfrom*/
-  } /*if (f2py_success) of k pyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_idif_d0 */
-  /* End of cleaning variable f2py_imax_d0 */
-  if((PyObject *)capi_idif_tmp!=idif_capi) {
-    Py_XDECREF(capi_idif_tmp); }
-  }  /*if (capi_idif_tmp == NULL) ... else of idif*/
-  /* End of cleaning variable idif */
-  } /*if (f2py_success) of k*/
-  /* End of cleaning variable k */
-  } /*if (f2py_success) of nrow*/
-  /* End of cleaning variable nrow */
-  if((PyObject *)capi_imax_tmp!=imax_capi) {
-    Py_XDECREF(capi_imax_tmp); }
-  }  /*if (capi_imax_tmp == NULL) ... else of imax*/
-  /* End of cleaning variable imax */
-  } /*if (f2py_success) of iflag*/
-  /* End of cleaning variable iflag */
-  } /*if (f2py_success) of ks*/
-  /* End of cleaning variable ks */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of f7xact *******************************/
-
-/*********************************** f8xact ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f8xact[] = "\
-f8xact(irow,is,i1,izero,new_bn)\n\nWrapper for ``f8xact``.\
-\n\nParameters\n----------\n"
-"irow : input rank-1 array('i') with bounds (f2py_irow_d0)\n"
-"is : input int\n"
-"i1 : input int\n"
-"izero : input int\n"
-"new_bn : input rank-1 array('i') with bounds (f2py_new_bn_d0)";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f8xact(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,int*,int*,int*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  int *irow = NULL;
-  npy_intp irow_Dims[1] = {-1};
-  const int irow_Rank = 1;
-  PyArrayObject *capi_irow_tmp = NULL;
-  int capi_irow_intent = 0;
-  PyObject *irow_capi = Py_None;
-  int is = 0;
-  PyObject *is_capi = Py_None;
-  int i1 = 0;
-  PyObject *i1_capi = Py_None;
-  int izero = 0;
-  PyObject *izero_capi = Py_None;
-  int *new_bn = NULL;
-  npy_intp new_bn_Dims[1] = {-1};
-  const int new_bn_Rank = 1;
-  PyArrayObject *capi_new_bn_tmp = NULL;
-  int capi_new_bn_intent = 0;
-  PyObject *new_bn_capi = Py_None;
-  int f2py_irow_d0 = 0;
-  int f2py_new_bn_d0 = 0;
-  static char *capi_kwlist[] = {"irow","is","i1","izero","new_bn",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOO:fexact.fisher_exact.f8xact",\
-    capi_kwlist,&irow_capi,&is_capi,&i1_capi,&izero_capi,&new_bn_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable i1 */
-    f2py_success = int_from_pyobj(&i1,i1_capi,"fexact.fisher_exact.f8xact() 3rd argument (i1) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable is */
-    f2py_success = int_from_pyobj(&is,is_capi,"fexact.fisher_exact.f8xact() 2nd argument (is) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable new_bn */
-  ;
-  capi_new_bn_intent |= F2PY_INTENT_IN;
-  capi_new_bn_tmp = array_from_pyobj(NPY_INT,new_bn_Dims,new_bn_Rank,capi_new_bn_intent,new_bn_capi);
-  if (capi_new_bn_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 5th argument `new_bn' of fexact.fisher_exact.f8xact to C/Fortran array" );
-  } else {
-    new_bn = (int *)(PyArray_DATA(capi_new_bn_tmp));
-
-  /* Processing variable izero */
-    f2py_success = int_from_pyobj(&izero,izero_capi,"fexact.fisher_exact.f8xact() 4th argument (izero) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable irow */
-  ;
-  capi_irow_intent |= F2PY_INTENT_IN;
-  capi_irow_tmp = array_from_pyobj(NPY_INT,irow_Dims,irow_Rank,capi_irow_intent,irow_capi);
-  if (capi_irow_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 1st argument `irow' of fexact.fisher_exact.f8xact to C/Fortran array" );
-  } else {
-    irow = (int *)(PyArray_DATA(capi_irow_tmp));
-
-  /* Processing variable f2py_irow_d0 */
-  f2py_irow_d0 = shape(irow, 0);
-  /* Processing variable f2py_new_bn_d0 */
-  f2py_new_bn_d0 = shape(new_bn, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(irow,&is,&i1,&izero,new_bn,&f2py_irow_d0,&f2py_new_bn_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_new_bn_d0 */
-  /* End of cleaning variable f2py_irow_d0 */
-  if((PyObject *)capi_irow_tmp!=irow_capi) {
-    Py_XDECREF(capi_irow_tmp); }
-  }  /*if (capi_irow_tmp == NULL) ... else of irow*/
-  /* End of cleaning variable irow */
-  } /*if (f2py_success) of izero*/
-  /* End of cleaning variable izero */
-  if((PyObject *)capi_new_bn_tmp!=new_bn_capi) {
-    Py_XDECREF(capi_new_bn_tmp); }
-  }  /*if (capi_new_bn_tmp == NULL) ... else of new_bn*/
-  /* End of cleaning variable new_bn */
-  } /*if (f2py_success) of is*/
-  /* End of cleaning variable is */
-  } /*if (f2py_success) of i1*/
-  /* End of cleaning variable i1 */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of f8xact *******************************/
-
-/*********************************** f9xact ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f9xact[] = "\
-fn_val = f9xact(n,mm,ir,fact)\n\nWrapper for ``f9xact``.\
-\n\nParameters\n----------\n"
-"n : input int\n"
-"mm : input int\n"
-"ir : input rank-1 array('i') with bounds (f2py_ir_d0)\n"
-"fact : input rank-1 array('d') with bounds (1)\n"
-"\nReturns\n-------\n"
-"fn_val : float";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f9xact(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(double*,int*,int*,int*,double*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  double f9xact = 0;
-  int n = 0;
-  PyObject *n_capi = Py_None;
-  int mm = 0;
-  PyObject *mm_capi = Py_None;
-  int *ir = NULL;
-  npy_intp ir_Dims[1] = {-1};
-  const int ir_Rank = 1;
-  PyArrayObject *capi_ir_tmp = NULL;
-  int capi_ir_intent = 0;
-  PyObject *ir_capi = Py_None;
-  double *fact = NULL;
-  npy_intp fact_Dims[1] = {-1};
-  const int fact_Rank = 1;
-  PyArrayObject *capi_fact_tmp = NULL;
-  int capi_fact_intent = 0;
-  PyObject *fact_capi = Py_None;
-  int f2py_ir_d0 = 0;
-  static char *capi_kwlist[] = {"n","mm","ir","fact",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOO:fexact.fisher_exact.f9xact",\
-    capi_kwlist,&n_capi,&mm_capi,&ir_capi,&fact_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable mm */
-    f2py_success = int_from_pyobj(&mm,mm_capi,"fexact.fisher_exact.f9xact() 2nd argument (mm) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable ir */
-  ;
-  capi_ir_intent |= F2PY_INTENT_IN;
-  capi_ir_tmp = array_from_pyobj(NPY_INT,ir_Dims,ir_Rank,capi_ir_intent,ir_capi);
-  if (capi_ir_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 3rd argument `ir' of fexact.fisher_exact.f9xact to C/Fortran array" );
-  } else {
-    ir = (int *)(PyArray_DATA(capi_ir_tmp));
-
-  /* Processing variable n */
-    f2py_success = int_from_pyobj(&n,n_capi,"fexact.fisher_exact.f9xact() 1st argument (n) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable fact */
-  fact_Dims[0]=1;
-  capi_fact_intent |= F2PY_INTENT_IN;
-  capi_fact_tmp = array_from_pyobj(NPY_DOUBLE,fact_Dims,fact_Rank,capi_fact_intent,fact_capi);
-  if (capi_fact_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 4th argument `fact' of fexact.fisher_exact.f9xact to C/Fortran array" );
-  } else {
-    fact = (double *)(PyArray_DATA(capi_fact_tmp));
-
-  /* Processing variable f9xact */
-  /* Processing variable f2py_ir_d0 */
-  f2py_ir_d0 = shape(ir, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&f9xact,&n,&mm,ir,fact,&f2py_ir_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("d",f9xact);
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_ir_d0 */
-  /* End of cleaning variable f9xact */
-  if((PyObject *)capi_fact_tmp!=fact_capi) {
-    Py_XDECREF(capi_fact_tmp); }
-  }  /*if (capi_fact_tmp == NULL) ... else of fact*/
-  /* End of cleaning variable fact */
-  } /*if (f2py_success) of n*/
-  /* End of cleaning variable n */
-  if((PyObject *)capi_ir_tmp!=ir_capi) {
-    Py_XDECREF(capi_ir_tmp); }
-  }  /*if (capi_ir_tmp == NULL) ... else of ir*/
-  /* End of cleaning variable ir */
-  } /*if (f2py_success) of mm*/
-  /* End of cleaning variable mm */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of f9xact *******************************/
-
-/*********************************** f10act ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f10act[] = "\
-f10act(nrow,irow,ncol,icol,val,xmin,fact,nd,ne,m)\n\nWrapper for ``f10act``.\
-\n\nParameters\n----------\n"
-"nrow : input int\n"
-"irow : input rank-1 array('i') with bounds (f2py_irow_d0)\n"
-"ncol : input int\n"
-"icol : input rank-1 array('i') with bounds (f2py_icol_d0)\n"
-"val : input float\n"
-"xmin : input int\n"
-"fact : input rank-1 array('d') with bounds (1)\n"
-"nd : input rank-1 array('i') with bounds (f2py_nd_d0)\n"
-"ne : input rank-1 array('i') with bounds (f2py_ne_d0)\n"
-"m : input rank-1 array('i') with bounds (f2py_m_d0)";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f10act(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,int*,int*,double*,int*,double*,int*,int*,int*,int*,int*,int*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  int nrow = 0;
-  PyObject *nrow_capi = Py_None;
-  int *irow = NULL;
-  npy_intp irow_Dims[1] = {-1};
-  const int irow_Rank = 1;
-  PyArrayObject *capi_irow_tmp = NULL;
-  int capi_irow_intent = 0;
-  PyObject *irow_capi = Py_None;
-  int ncol = 0;
-  PyObject *ncol_capi = Py_None;
-  int *icol = NULL;
-  npy_intp icol_Dims[1] = {-1};
-  const int icol_Rank = 1;
-  PyArrayObject *capi_icol_tmp = NULL;
-  int capi_icol_intent = 0;
-  PyObject *icol_capi = Py_None;
-  double val = 0;
-  PyObject *val_capi = Py_None;
-  int xmin = 0;
-  PyObject *xmin_capi = Py_None;
-  double *fact = NULL;
-  npy_intp fact_Dims[1] = {-1};
-  const int fact_Rank = 1;
-  PyArrayObject *capi_fact_tmp = NULL;
-  int capi_fact_intent = 0;
-  PyObject *fact_capi = Py_None;
-  int *nd = NULL;
-  npy_intp nd_Dims[1] = {-1};
-  const int nd_Rank = 1;
-  PyArrayObject *capi_nd_tmp = NULL;
-  int capi_nd_intent = 0;
-  PyObject *nd_capi = Py_None;
-  int *ne = NULL;
-  npy_intp ne_Dims[1] = {-1};
-  const int ne_Rank = 1;
-  PyArrayObject *capi_ne_tmp = NULL;
-  int capi_ne_intent = 0;
-  PyObject *ne_capi = Py_None;
-  int *m = NULL;
-  npy_intp m_Dims[1] = {-1};
-  const int m_Rank = 1;
-  PyArrayObject *capi_m_tmp = NULL;
-  int capi_m_intent = 0;
-  PyObject *m_capi = Py_None;
-  int f2py_irow_d0 = 0;
-  int f2py_icol_d0 = 0;
-  int f2py_nd_d0 = 0;
-  int f2py_ne_d0 = 0;
-  int f2py_m_d0 = 0;
-  static char *capi_kwlist[] = {"nrow","irow","ncol","icol","val","xmin","fact","nd","ne","m",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOOOOOOOO:fexact.fisher_exact.f10act",\
-    capi_kwlist,&nrow_capi,&irow_capi,&ncol_capi,&icol_capi,&val_capi,&xmin_capi,&fact_capi,&nd_capi,&ne_capi,&m_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable val */
-    f2py_success = double_from_pyobj(&val,val_capi,"fexact.fisher_exact.f10act() 5th argument (val) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable nrow */
-    f2py_success = int_from_pyobj(&nrow,nrow_capi,"fexact.fisher_exact.f10act() 1st argument (nrow) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable nd */
-  ;
-  capi_nd_intent |= F2PY_INTENT_IN;
-  capi_nd_tmp = array_from_pyobj(NPY_INT,nd_Dims,nd_Rank,capi_nd_intent,nd_capi);
-  if (capi_nd_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 8th argument `nd' of fexact.fisher_exact.f10act to C/Fortran array" );
-  } else {
-    nd = (int *)(PyArray_DATA(capi_nd_tmp));
-
-  /* Processing variable m */
-  ;
-  capi_m_intent |= F2PY_INTENT_IN;
-  capi_m_tmp = array_from_pyobj(NPY_INT,m_Dims,m_Rank,capi_m_intent,m_capi);
-  if (capi_m_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 10th argument `m' of fexact.fisher_exact.f10act to C/Fortran array" );
-  } else {
-    m = (int *)(PyArray_DATA(capi_m_tmp));
-
-  /* Processing variable ne */
-  ;
-  capi_ne_intent |= F2PY_INTENT_IN;
-  capi_ne_tmp = array_from_pyobj(NPY_INT,ne_Dims,ne_Rank,capi_ne_intent,ne_capi);
-  if (capi_ne_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 9th argument `ne' of fexact.fisher_exact.f10act to C/Fortran array" );
-  } else {
-    ne = (int *)(PyArray_DATA(capi_ne_tmp));
-
-  /* Processing variable irow */
-  ;
-  capi_irow_intent |= F2PY_INTENT_IN;
-  capi_irow_tmp = array_from_pyobj(NPY_INT,irow_Dims,irow_Rank,capi_irow_intent,irow_capi);
-  if (capi_irow_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 2nd argument `irow' of fexact.fisher_exact.f10act to C/Fortran array" );
-  } else {
-    irow = (int *)(PyArray_DATA(capi_irow_tmp));
-
-  /* Processing variable ncol */
-    f2py_success = int_from_pyobj(&ncol,ncol_capi,"fexact.fisher_exact.f10act() 3rd argument (ncol) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable xmin */
-    xmin = (int)PyObject_IsTrue(xmin_capi);
-    f2py_success = 1;
-  if (f2py_success) {
-  /* Processing variable icol */
-  ;
-  capi_icol_intent |= F2PY_INTENT_IN;
-  capi_icol_tmp = array_from_pyobj(NPY_INT,icol_Dims,icol_Rank,capi_icol_intent,icol_capi);
-  if (capi_icol_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 4th argument `icol' of fexact.fisher_exact.f10act to C/Fortran array" );
-  } else {
-    icol = (int *)(PyArray_DATA(capi_icol_tmp));
-
-  /* Processing variable fact */
-  fact_Dims[0]=1;
-  capi_fact_intent |= F2PY_INTENT_IN;
-  capi_fact_tmp = array_from_pyobj(NPY_DOUBLE,fact_Dims,fact_Rank,capi_fact_intent,fact_capi);
-  if (capi_fact_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 7th argument `fact' of fexact.fisher_exact.f10act to C/Fortran array" );
-  } else {
-    fact = (double *)(PyArray_DATA(capi_fact_tmp));
-
-  /* Processing variable f2py_irow_d0 */
-  f2py_irow_d0 = shape(irow, 0);
-  /* Processing variable f2py_icol_d0 */
-  f2py_icol_d0 = shape(icol, 0);
-  /* Processing variable f2py_nd_d0 */
-  f2py_nd_d0 = shape(nd, 0);
-  /* Processing variable f2py_ne_d0 */
-  f2py_ne_d0 = shape(ne, 0);
-  /* Processing variable f2py_m_d0 */
-  f2py_m_d0 = shape(m, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&nrow,irow,&ncol,icol,&val,&xmin,fact,nd,ne,m,&f2py_irow_d0,&f2py_icol_d0,&f2py_nd_d0,&f2py_ne_d0,&f2py_m_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_m_d0 */
-  /* End of cleaning variable f2py_ne_d0 */
-  /* End of cleaning variable f2py_nd_d0 */
-  /* End of cleaning variable f2py_icol_d0 */
-  /* End of cleaning variable f2py_irow_d0 */
-  if((PyObject *)capi_fact_tmp!=fact_capi) {
-    Py_XDECREF(capi_fact_tmp); }
-  }  /*if (capi_fact_tmp == NULL) ... else of fact*/
-  /* End of cleaning variable fact */
-  if((PyObject *)capi_icol_tmp!=icol_capi) {
-    Py_XDECREF(capi_icol_tmp); }
-  }  /*if (capi_icol_tmp == NULL) ... else of icol*/
-  /* End of cleaning variable icol */
-  } /*if (f2py_success) of xmin*/
-  /* End of cleaning variable xmin */
-  } /*if (f2py_success) of ncol*/
-  /* End of cleaning variable ncol */
-  if((PyObject *)capi_irow_tmp!=irow_capi) {
-    Py_XDECREF(capi_irow_tmp); }
-  }  /*if (capi_irow_tmp == NULL) ... else of irow*/
-  /* End of cleaning variable irow */
-  if((PyObject *)capi_ne_tmp!=ne_capi) {
-    Py_XDECREF(capi_ne_tmp); }
-  }  /*if (capi_ne_tmp == NULL) ... else of ne*/
-  /* End of cleaning variable ne */
-  if((PyObject *)capi_m_tmp!=m_capi) {
-    Py_XDECREF(capi_m_tmp); }
-  }  /*if (capi_m_tmp == NULL) ... else of m*/
-  /* End of cleaning variable m */
-  if((PyObject *)capi_nd_tmp!=nd_capi) {
-    Py_XDECREF(capi_nd_tmp); }
-  }  /*if (capi_nd_tmp == NULL) ... else of nd*/
-  /* End of cleaning variable nd */
-  } /*if (f2py_success) of nrow*/
-  /* End of cleaning variable nrow */
-  } /*if (f2py_success) of val*/
-  /* End of cleaning variable val */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of f10act *******************************/
-
-/*********************************** f11act ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_f11act[] = "\
-f11act(irow,i1,i2,new_bn)\n\nWrapper for ``f11act``.\
-\n\nParameters\n----------\n"
-"irow : input rank-1 array('i') with bounds (f2py_irow_d0)\n"
-"i1 : input int\n"
-"i2 : input int\n"
-"new_bn : input rank-1 array('i') with bounds (f2py_new_bn_d0)";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_f11act(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,int*,int*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  int *irow = NULL;
-  npy_intp irow_Dims[1] = {-1};
-  const int irow_Rank = 1;
-  PyArrayObject *capi_irow_tmp = NULL;
-  int capi_irow_intent = 0;
-  PyObject *irow_capi = Py_None;
-  int i1 = 0;
-  PyObject *i1_capi = Py_None;
-  int i2 = 0;
-  PyObject *i2_capi = Py_None;
-  int *new_bn = NULL;
-  npy_intp new_bn_Dims[1] = {-1};
-  const int new_bn_Rank = 1;
-  PyArrayObject *capi_new_bn_tmp = NULL;
-  int capi_new_bn_intent = 0;
-  PyObject *new_bn_capi = Py_None;
-  int f2py_irow_d0 = 0;
-  int f2py_new_bn_d0 = 0;
-  static char *capi_kwlist[] = {"irow","i1","i2","new_bn",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OOOO:fexact.fisher_exact.f11act",\
-    capi_kwlist,&irow_capi,&i1_capi,&i2_capi,&new_bn_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable i1 */
-    f2py_success = int_from_pyobj(&i1,i1_capi,"fexact.fisher_exact.f11act() 2nd argument (i1) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable i2 */
-    f2py_success = int_from_pyobj(&i2,i2_capi,"fexact.fisher_exact.f11act() 3rd argument (i2) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable irow */
-  ;
-  capi_irow_intent |= F2PY_INTENT_IN;
-  capi_irow_tmp = array_from_pyobj(NPY_INT,irow_Dims,irow_Rank,capi_irow_intent,irow_capi);
-  if (capi_irow_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 1st argument `irow' of fexact.fisher_exact.f11act to C/Fortran array" );
-  } else {
-    irow = (int *)(PyArray_DATA(capi_irow_tmp));
-
-  /* Processing variable new_bn */
-  ;
-  capi_new_bn_intent |= F2PY_INTENT_IN;
-  capi_new_bn_tmp = array_from_pyobj(NPY_INT,new_bn_Dims,new_bn_Rank,capi_new_bn_intent,new_bn_capi);
-  if (capi_new_bn_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 4th argument `new_bn' of fexact.fisher_exact.f11act to C/Fortran array" );
-  } else {
-    new_bn = (int *)(PyArray_DATA(capi_new_bn_tmp));
-
-  /* Processing variable f2py_irow_d0 */
-  f2py_irow_d0 = shape(irow, 0);
-  /* Processing variable f2py_new_bn_d0 */
-  f2py_new_bn_d0 = shape(new_bn, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(irow,&i1,&i2,new_bn,&f2py_irow_d0,&f2py_new_bn_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_new_bn_d0 */
-  /* End of cleaning variable f2py_irow_d0 */
-  if((PyObject *)capi_new_bn_tmp!=new_bn_capi) {
-    Py_XDECREF(capi_new_bn_tmp); }
-  }  /*if (capi_new_bn_tmp == NULL) ... else of new_bn*/
-  /* End of cleaning variable new_bn */
-  if((PyObject *)capi_irow_tmp!=irow_capi) {
-    Py_XDECREF(capi_irow_tmp); }
-  }  /*if (capi_irow_tmp == NULL) ... else of irow*/
-  /* End of cleaning variable irow */
-  } /*if (f2py_success) of i2*/
-  /* End of cleaning variable i2 */
-  } /*if (f2py_success) of i1*/
-  /* End of cleaning variable i1 */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of f11act *******************************/
-
-/*********************************** isort ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_isort[] = "\
-isort(n,ix)\n\nWrapper for ``isort``.\
-\n\nParameters\n----------\n"
-"n : input int\n"
-"ix : in/output rank-1 array('i') with bounds (f2py_ix_d0)";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_isort(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(int*,int*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  int n = 0;
-  PyObject *n_capi = Py_None;
-  int *ix = NULL;
-  npy_intp ix_Dims[1] = {-1};
-  const int ix_Rank = 1;
-  PyArrayObject *capi_ix_tmp = NULL;
-  int capi_ix_intent = 0;
-  PyObject *ix_capi = Py_None;
-  int f2py_ix_d0 = 0;
-  static char *capi_kwlist[] = {"n","ix",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OO:fexact.fisher_exact.isort",\
-    capi_kwlist,&n_capi,&ix_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable ix */
-  ;
-  capi_ix_intent |= F2PY_INTENT_INOUT;
-  capi_ix_tmp = array_from_pyobj(NPY_INT,ix_Dims,ix_Rank,capi_ix_intent,ix_capi);
-  if (capi_ix_tmp == NULL) {
-    if (!PyErr_Occurred())
-      PyErr_SetString(fexact_error,"failed in converting 2nd argument `ix' of fexact.fisher_exact.isort to C/Fortran array" );
-  } else {
-    ix = (int *)(PyArray_DATA(capi_ix_tmp));
-
-  /* Processing variable n */
-    f2py_success = int_from_pyobj(&n,n_capi,"fexact.fisher_exact.isort() 1st argument (n) can't be converted to int");
-  if (f2py_success) {
-  /* Processing variable f2py_ix_d0 */
-  f2py_ix_d0 = shape(ix, 0);
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&n,ix,&f2py_ix_d0);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("");
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable f2py_ix_d0 */
-  } /*if (f2py_success) of n*/
-  /* End of cleaning variable n */
-  if((PyObject *)capi_ix_tmp!=ix_capi) {
-    Py_XDECREF(capi_ix_tmp); }
-  }  /*if (capi_ix_tmp == NULL) ... else of ix*/
-  /* End of cleaning variable ix */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************** end of isort ********************************/
-
-/*********************************** gammad ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_gammad[] = "\
-fn_val = gammad(x,p)\n\nWrapper for ``gammad``.\
-\n\nParameters\n----------\n"
-"x : input float\n"
-"p : input float\n"
-"\nReturns\n-------\n"
-"fn_val : float";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_gammad(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(double*,double*,double*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  double gammad = 0;
-  double x = 0;
-  PyObject *x_capi = Py_None;
-  double p = 0;
-  PyObject *p_capi = Py_None;
-  static char *capi_kwlist[] = {"x","p",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OO:fexact.fisher_exact.gammad",\
-    capi_kwlist,&x_capi,&p_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable x */
-    f2py_success = double_from_pyobj(&x,x_capi,"fexact.fisher_exact.gammad() 1st argument (x) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable p */
-    f2py_success = double_from_pyobj(&p,p_capi,"fexact.fisher_exact.gammad() 2nd argument (p) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable gammad */
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&gammad,&x,&p);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("d",gammad);
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable gammad */
-  } /*if (f2py_success) of p*/
-  /* End of cleaning variable p */
-  } /*if (f2py_success) of x*/
-  /* End of cleaning variable x */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of gammad *******************************/
-
-/*********************************** alnorm ***********************************/
-static char doc_f2py_rout_fexact_fisher_exact_alnorm[] = "\
-fn_val = alnorm(x,upper)\n\nWrapper for ``alnorm``.\
-\n\nParameters\n----------\n"
-"x : input float\n"
-"upper : input int\n"
-"\nReturns\n-------\n"
-"fn_val : float";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_alnorm(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(double*,double*,int*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  double alnorm = 0;
-  double x = 0;
-  PyObject *x_capi = Py_None;
-  int upper = 0;
-  PyObject *upper_capi = Py_None;
-  static char *capi_kwlist[] = {"x","upper",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "OO:fexact.fisher_exact.alnorm",\
-    capi_kwlist,&x_capi,&upper_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable x */
-    f2py_success = double_from_pyobj(&x,x_capi,"fexact.fisher_exact.alnorm() 1st argument (x) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable upper */
-    upper = (int)PyObject_IsTrue(upper_capi);
-    f2py_success = 1;
-  if (f2py_success) {
-  /* Processing variable alnorm */
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&alnorm,&x,&upper);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("d",alnorm);
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable alnorm */
-  } /*if (f2py_success) of upper*/
-  /* End of cleaning variable upper */
-  } /*if (f2py_success) of x*/
-  /* End of cleaning variable x */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of alnorm *******************************/
-
-/********************************** lngamma **********************************/
-static char doc_f2py_rout_fexact_fisher_exact_lngamma[] = "\
-lanczos = lngamma(z)\n\nWrapper for ``lngamma``.\
-\n\nParameters\n----------\n"
-"z : input float\n"
-"\nReturns\n-------\n"
-"lanczos : float";
-/* #declfortranroutine# */
-static PyObject *f2py_rout_fexact_fisher_exact_lngamma(const PyObject *capi_self,
-                           PyObject *capi_args,
-                           PyObject *capi_keywds,
-                           void (*f2py_func)(double*,double*)) {
-  PyObject * volatile capi_buildvalue = NULL;
-  volatile int f2py_success = 1;
-/*decl*/
-
-  double lngamma = 0;
-  double z = 0;
-  PyObject *z_capi = Py_None;
-  static char *capi_kwlist[] = {"z",NULL};
-
-/*routdebugenter*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_clock();
-#endif
-  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
-    "O:fexact.fisher_exact.lngamma",\
-    capi_kwlist,&z_capi))
-    return NULL;
-/*frompyobj*/
-  /* Processing variable z */
-    f2py_success = double_from_pyobj(&z,z_capi,"fexact.fisher_exact.lngamma() 1st argument (z) can't be converted to double");
-  if (f2py_success) {
-  /* Processing variable lngamma */
-/*end of frompyobj*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_start_call_clock();
-#endif
-/*callfortranroutine*/
-  (*f2py_func)(&lngamma,&z);
-if (PyErr_Occurred())
-  f2py_success = 0;
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_call_clock();
-#endif
-/*end of callfortranroutine*/
-    if (f2py_success) {
-/*pyobjfrom*/
-/*end of pyobjfrom*/
-    CFUNCSMESS("Building return value.\n");
-    capi_buildvalue = Py_BuildValue("d",lngamma);
-/*closepyobjfrom*/
-/*end of closepyobjfrom*/
-    } /*if (f2py_success) after callfortranroutine*/
-/*cleanupfrompyobj*/
-  /* End of cleaning variable lngamma */
-  } /*if (f2py_success) of z*/
-  /* End of cleaning variable z */
-/*end of cleanupfrompyobj*/
-  if (capi_buildvalue == NULL) {
-/*routdebugfailure*/
-  } else {
-/*routdebugleave*/
-  }
-  CFUNCSMESS("Freeing memory.\n");
-/*freemem*/
-#ifdef F2PY_REPORT_ATEXIT
-f2py_stop_clock();
-#endif
-  return capi_buildvalue;
-}
-/******************************* end of lngamma *******************************/
-/*eof body*/
-
-/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
-
-static FortranDataDef f2py_types_def[] = {
-  {"dp",0,{{-1}},NPY_INT},
-  {NULL}
-};
-
-static void f2py_setup_types(char *dp) {
-  int i_f2py=0;
-  f2py_types_def[i_f2py++].data = dp;
-}
-extern void F_FUNC(f2pyinittypes,F2PYINITTYPES)(void (*)(char*));
-static void f2py_init_types(void) {
-  F_FUNC(f2pyinittypes,F2PYINITTYPES)(f2py_setup_types);
-}
-
-
-static FortranDataDef f2py_fisher_exact_def[] = {
-  {"fexact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_fexact,doc_f2py_rout_fexact_fisher_exact_fexact},
-  {"f2xact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f2xact,doc_f2py_rout_fexact_fisher_exact_f2xact},
-  {"f3xact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f3xact,doc_f2py_rout_fexact_fisher_exact_f3xact},
-  {"f4xact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f4xact,doc_f2py_rout_fexact_fisher_exact_f4xact},
-  {"f5xact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f5xact,doc_f2py_rout_fexact_fisher_exact_f5xact},
-  {"f6xact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f6xact,doc_f2py_rout_fexact_fisher_exact_f6xact},
-  {"f7xact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f7xact,doc_f2py_rout_fexact_fisher_exact_f7xact},
-  {"f8xact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f8xact,doc_f2py_rout_fexact_fisher_exact_f8xact},
-  {"f9xact",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f9xact,doc_f2py_rout_fexact_fisher_exact_f9xact},
-  {"f10act",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f10act,doc_f2py_rout_fexact_fisher_exact_f10act},
-  {"f11act",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_f11act,doc_f2py_rout_fexact_fisher_exact_f11act},
-  {"isort",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_isort,doc_f2py_rout_fexact_fisher_exact_isort},
-  {"gammad",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_gammad,doc_f2py_rout_fexact_fisher_exact_gammad},
-  {"alnorm",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_alnorm,doc_f2py_rout_fexact_fisher_exact_alnorm},
-  {"lngamma",-1,{{-1}},0,NULL,(void *)f2py_rout_fexact_fisher_exact_lngamma,doc_f2py_rout_fexact_fisher_exact_lngamma},
-  {NULL}
-};
-
-static void f2py_setup_fisher_exact(char *fexact,char *f2xact,char *f3xact,char *f4xact,char *f5xact,char *f6xact,char *f7xact,char *f8xact,char *f9xact,char *f10act,char *f11act,char *isort,char *gammad,char *alnorm,char *lngamma) {
-  int i_f2py=0;
-  f2py_fisher_exact_def[i_f2py++].data = fexact;
-  f2py_fisher_exact_def[i_f2py++].data = f2xact;
-  f2py_fisher_exact_def[i_f2py++].data = f3xact;
-  f2py_fisher_exact_def[i_f2py++].data = f4xact;
-  f2py_fisher_exact_def[i_f2py++].data = f5xact;
-  f2py_fisher_exact_def[i_f2py++].data = f6xact;
-  f2py_fisher_exact_def[i_f2py++].data = f7xact;
-  f2py_fisher_exact_def[i_f2py++].data = f8xact;
-  f2py_fisher_exact_def[i_f2py++].data = f9xact;
-  f2py_fisher_exact_def[i_f2py++].data = f10act;
-  f2py_fisher_exact_def[i_f2py++].data = f11act;
-  f2py_fisher_exact_def[i_f2py++].data = isort;
-  f2py_fisher_exact_def[i_f2py++].data = gammad;
-  f2py_fisher_exact_def[i_f2py++].data = alnorm;
-  f2py_fisher_exact_def[i_f2py++].data = lngamma;
-}
-extern void F_FUNC_US(f2pyinitfisher_exact,F2PYINITFISHER_EXACT)(void (*)(char *,char *,char *,char *,char *,char *,char *,char *,char *,char *,char *,char *,char *,char *,char *));
-static void f2py_init_fisher_exact(void) {
-  F_FUNC_US(f2pyinitfisher_exact,F2PYINITFISHER_EXACT)(f2py_setup_fisher_exact);
-}
-
-/*need_f90modhooks*/
-
-/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
 
 /******************* See f2py2e/common_rules.py: buildhooks *******************/
 
@@ -3049,80 +431,60 @@ static void f2py_init_fisher_exact(void) {
 /**************************** See f2py2e/rules.py ****************************/
 
 static FortranDataDef f2py_routine_defs[] = {
-  {"prterr",-1,{{-1}},0,(char *)F_FUNC(prterr,PRTERR),(f2py_init_func)f2py_rout_fexact_prterr,doc_f2py_rout_fexact_prterr},
 
 /*eof routine_defs*/
-  {NULL}
+    {NULL}
 };
 
 static PyMethodDef f2py_module_methods[] = {
 
-  {NULL,NULL}
+    {NULL,NULL}
 };
 
-#if PY_VERSION_HEX >= 0x03000000
 static struct PyModuleDef moduledef = {
-  PyModuleDef_HEAD_INIT,
-  "fexact",
-  NULL,
-  -1,
-  f2py_module_methods,
-  NULL,
-  NULL,
-  NULL,
-  NULL
+    PyModuleDef_HEAD_INIT,
+    "fexact",
+    NULL,
+    -1,
+    f2py_module_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
 };
-#endif
 
-#if PY_VERSION_HEX >= 0x03000000
-#define RETVAL m
 PyMODINIT_FUNC PyInit_fexact(void) {
-#else
-#define RETVAL
-PyMODINIT_FUNC initfexact(void) {
-#endif
-  int i;
-  PyObject *m,*d, *s;
-#if PY_VERSION_HEX >= 0x03000000
-  m = fexact_module = PyModule_Create(&moduledef);
-#else
-  m = fexact_module = Py_InitModule("fexact", f2py_module_methods);
-#endif
-  Py_TYPE(&PyFortran_Type) = &PyType_Type;
-  import_array();
-  if (PyErr_Occurred())
-    {PyErr_SetString(PyExc_ImportError, "can't initialize module fexact (failed to import numpy)"); return RETVAL;}
-  d = PyModule_GetDict(m);
-  s = PyString_FromString("$Revision: $");
-  PyDict_SetItemString(d, "__version__", s);
-#if PY_VERSION_HEX >= 0x03000000
-  s = PyUnicode_FromString(
-#else
-  s = PyString_FromString(
-#endif
-    "This module 'fexact' is auto-generated with f2py (version:2).\nFunctions:\n"
-"  prterr(icode,mes,f2pystop,f2pystop_extra_args=())\n"
-"Fortran 90/95 modules:\n""  types --- dp""  fisher_exact --- fexact(),f2xact(),f3xact(),f4xact(),f5xact(),f6xact(),f7xact(),f8xact(),f9xact(),f10act(),f11act(),isort(),gammad(),alnorm(),lngamma()"".");
-  PyDict_SetItemString(d, "__doc__", s);
-  fexact_error = PyErr_NewException ("fexact.error", NULL, NULL);
-  Py_DECREF(s);
-  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
-    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+    int i;
+    PyObject *m,*d, *s, *tmp;
+    m = fexact_module = PyModule_Create(&moduledef);
+    Py_SET_TYPE(&PyFortran_Type, &PyType_Type);
+    import_array();
+    if (PyErr_Occurred())
+        {PyErr_SetString(PyExc_ImportError, "can't initialize module fexact (failed to import numpy)"); return m;}
+    d = PyModule_GetDict(m);
+    s = PyUnicode_FromString("2.4.6");
+    PyDict_SetItemString(d, "__version__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString(
+        "This module 'fexact' is auto-generated with f2py (version:2.4.6).\nFunctions:\n"
+"Fortran 90/95 modules:\n""  types --- dp""  fisher_exact --- fexact()"".");
+    PyDict_SetItemString(d, "__doc__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString("2.4.6");
+    PyDict_SetItemString(d, "__f2py_numpy_version__", s);
+    Py_DECREF(s);
+    fexact_error = PyErr_NewException ("fexact.error", NULL, NULL);
+    /*
+     * Store the error object inside the dict, so that it could get deallocated.
+     * (in practice, this is a module, so it likely will not and cannot.)
+     */
+    PyDict_SetItemString(d, "_fexact_error", fexact_error);
+    Py_DECREF(fexact_error);
+    for(i=0;f2py_routine_defs[i].name!=NULL;i++) {
+        tmp = PyFortranObject_NewAsAttr(&f2py_routine_defs[i]);
+        PyDict_SetItemString(d, f2py_routine_defs[i].name, tmp);
+        Py_DECREF(tmp);
+    }
 
 /*eof initf2pywraphooks*/
   PyDict_SetItemString(d, "fisher_exact", PyFortranObject_New(f2py_fisher_exact_def,f2py_init_fisher_exact));
@@ -3132,12 +494,21 @@ PyMODINIT_FUNC initfexact(void) {
 /*eof initcommonhooks*/
 
 
+#ifdef Py_GIL_DISABLED
+    // signal whether this module supports running with the GIL disabled
+    PyUnstable_Module_SetGIL(m , Py_MOD_GIL_USED);
+#endif
+
 #ifdef F2PY_REPORT_ATEXIT
-  if (! PyErr_Occurred())
-    on_exit(f2py_report_on_exit,(void*)"fexact");
+    if (! PyErr_Occurred())
+        on_exit(f2py_report_on_exit,(void*)"fexact");
 #endif
 
-  return RETVAL;
+    if (PyType_Ready(&PyFortran_Type) < 0) {
+        return NULL;
+    }
+
+    return m;
 }
 #ifdef __cplusplus
 }
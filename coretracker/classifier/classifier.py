@@ -97,6 +97,12 @@ class Classifier(object):
         """Return probability for each class prediction"""
         return self.clf.predict_proba(X)
 
+    def predict_with_proba(self, X):
+        """Return the predicted class and the probability of each class.
+        The class is the most probable one, so the model is run only once"""
+        pred_prob = self.predict_proba(X)
+        return self.clf.classes_[np.argmax(pred_prob, axis=1)], pred_prob
+
     def feature_importance(self, outfile="importance.png", features_list=[]):
         """Show each feature importance"""
         if (self.method in ['rf', 'etc']):
@@ -193,6 +199,26 @@ def read_from_json(data, labels=None, use_global=True, use_pvalue=True):
     if labels and isinstance(labels, str):
         with open(labels) as jfile2:
             labels = json.load(jfile2)
+    X = []
+    X_label = []
+    Y = []
+    for aa2, val in list(data['aa'].items()):
+        for aa1, glist in list(val.items()):
+            pX, pX_label, pY = get_pair_features(aa2, aa1, glist, data['genome'], labels,
+                                                 use_global=use_global, use_pvalue=use_pvalue)
+            X.extend(pX)
+            X_label.extend(pX_label)
+            Y.extend(pY)
+    if labels:
+        assert (len(X) == len(
+            Y)), "We should not have different length for data and for input"
+    return np.array(X), np.asarray(X_label), np.array(Y)
+
+
+def get_pair_features(aa2, aa1, glist, genome_data, labels=None, use_global=True, use_pvalue=True):
+    """Parse the X rows of the reassignment aa2 to aa1 from the data of each
+    genome (glist). genome_data is the 'genome' entry of the json data.
+    Return the lists X, X_label and Y"""
     # matrice format
     # global
     min_value = np.finfo(np.float).min
@@ -209,83 +235,102 @@ def read_from_json(data, labels=None, use_global=True, use_pvalue=True):
     # each entry format :
     # [fitch, suspected, gene_frac, rea_frac, used_frac, subs_count, codon_lik_for_rea_aa]
 
-    for aa2, val in list(data['aa'].items()):
-        for aa1, glist in list(val.items()):
-            for genome, gdata in list(glist.items()):
-                type_check = gdata[dtype]
-                codon_total = gdata['codons'][dtype]
-                fitch = gdata['fitch']
-                suspected = gdata['suspected'] < 0.05
-                rea_codon = type_check['rea_codon']
-                mixte_codon = type_check['mixte_codon']
-                used_codon = type_check['used_codon']
-                # gene_in_genome = data['genes'][genome]
-                was_lost = gdata['lost'][fisher_type]
-                total_aa = np.sum(list(codon_total.values()))
-                # mixte_codon = type_check['mixte_codon']
-                subs_count = type_check['count']
-                for codon in list(codon_total.keys()):
-                    gene_count = 0
-                    total_gene_count = 0
-                    try:
-                        gene_count = len(type_check[
-                            'rea_distribution'].get(codon, []))
-                        total_gene_count = len(type_check[
-                            'total_rea_distribution'].get(codon, []))
-                    except:
-                        gene_count = type_check[
-                            'rea_distribution'].get(codon, 0)
-                        total_gene_count = type_check[
-                            'total_rea_distribution'].get(codon, 0)
+    for genome, gdata in list(glist.items()):
+        type_check = gdata[dtype]
+        codon_total = gdata['codons'][dtype]
+        fitch = gdata['fitch']
+        suspected = gdata['suspected'] < 0.05
+        rea_codon = type_check['rea_codon']
+        mixte_codon = type_check['mixte_codon']
+        used_codon = type_check['used_codon']
+        # gene_in_genome = data['genes'][genome]
+        was_lost = gdata['lost'][fisher_type]
+        total_aa = np.sum(list(codon_total.values()))
+        # mixte_codon = type_check['mixte_codon']
+        subs_count = type_check['count']
+        for codon in list(codon_total.keys()):
+            gene_count = 0
+            total_gene_count = 0
+            try:
+                gene_count = len(type_check[
+                    'rea_distribution'].get(codon, []))
+                total_gene_count = len(type_check[
+                    'total_rea_distribution'].get(codon, []))
+            except:
+                gene_count = type_check[
+                    'rea_distribution'].get(codon, 0)
+                total_gene_count = type_check[
+                    'total_rea_distribution'].get(codon, 0)
 
-                    codon_count = codon_total[codon]
+            codon_count = codon_total[codon]
+            try:
+                codon_lik = gdata['score'][
+                    dtype].get(codon, min_value)
+                if codon_lik == np.inf:
+                    codon_lik = min_value
+            except:
+                codon_lik = min_value
+
+            # si il y a mutation, frequence d'utilisation du codon
+            rea_frac = rea_codon.get(
+                codon, 0) * (1.0 / codon_count) if codon_count > 0 else 0
+            # frequence d'utilisation du codon dans les positions
+            # ou l'acide amine est predo
+            used_frac = used_codon.get(
+                codon, 0) * (1.0 / codon_count) if codon_count > 0 else 0
+            mixte_frac = mixte_codon.get(
+                codon, 0) * (1.0 / codon_count) if codon_count > 0 else 0
+            gene_frac = gene_count * \
+                (1.0 / total_gene_count) if total_gene_count > 0 else 0
+            codon_id = codon_identifier[codon.replace('U', 'T')]
+            genome_len = genome_data[dtype][genome]
+            # only add codon that are reassigned else it does not
+            # make sense, right?
+
+            if rea_codon.get(codon, 0) > 0:
+                entry = [fitch, suspected, was_lost, gene_frac, rea_frac, used_frac,
+                         codon_count * 1.0 / total_aa, subs_count * 1.0 / total_aa, genome_len,
+                         codon_lik, mixte_frac, codon_id]
+                X.append(entry)
+                X_label.append([genome, codon, aa2, aa1])
+                codon_mapper = None
+                if labels:
                     try:
-                        codon_lik = gdata['score'][
-                            dtype].get(codon, min_value)
-                        if codon_lik == np.inf:
-                            codon_lik = min_value
+                        codon_mapper = labels[genome][codon]
                     except:
-                        codon_lik = min_value
-
-                    # si il y a mutation, frequence d'utilisation du codon
-                    rea_frac = rea_codon.get(
-                        codon, 0) * (1.0 / codon_count) if codon_count > 0 else 0
-                    # frequence d'utilisation du codon dans les positions
-                    # ou l'acide amine est predo
-                    used_frac = used_codon.get(
-                        codon, 0) * (1.0 / codon_count) if codon_count > 0 else 0
-                    mixte_frac = mixte_codon.get(
-                        codon, 0) * (1.0 / codon_count) if codon_count > 0 else 0
-                    gene_frac = gene_count * \
-                        (1.0 / total_gene_count) if total_gene_count > 0 else 0
-                    codon_id = codon_identifier[codon.replace('U', 'T')]
-                    genome_len = data["genome"][dtype][genome]
-                    # only add codon that are reassigned else it does not
-                    # make sense, right?
-
-                    if rea_codon.get(codon, 0) > 0:
-                        entry = [fitch, suspected, was_lost, gene_frac, rea_frac, used_frac,
-                                 codon_count * 1.0 / total_aa, subs_count * 1.0 / total_aa, genome_len,
-                                 codon_lik, mixte_frac, codon_id]
-                        X.append(entry)
-                        X_label.append([genome, codon, aa2, aa1])
-                        codon_mapper = None
-                        if labels:
-                            try:
-                                codon_mapper = labels[genome][codon]
-                            except:
-                                pass
-                            if codon_mapper is None:
-                                Y.append(-1)
-                            else:
-                                Y.append(codon_mapper.get(aa1, -1))
-                                # keep only what is well defined
-                                # anything else will have a class of -1 to
-                                # mean unsure
-    if labels:
-        assert (len(X) == len(
-            Y)), "We should not have different length for data and for input"
-    return np.array(X), np.asarray(X_label), np.array(Y)
+                        pass
+                    if codon_mapper is None:
+                        Y.append(-1)
+                    else:
+                        Y.append(codon_mapper.get(aa1, -1))
+                        # keep only what is well defined
+                        # anything else will have a class of -1 to
+                        # mean unsure
+    return X, X_label, Y
+
+
+def batch_classify(clf, model, blocks):
+    """Classify the X rows of several reassignments at once. blocks is a
+    list of (X, X_label) as returned by get_pair_features. The rows are
+    stacked so the model is run once on all of them.
+    Return for each block (X_data, X_dataprint, selected_et, X_label,
+    pred, pred_prob), X_data and X_dataprint being formatted by model"""
+    nfeat = len(model.etiquette)
+    sizes = [len(X) for X, _ in blocks]
+    X = np.zeros((sum(sizes), nfeat))
+    if X.shape[0]:
+        X = np.vstack([np.asarray(pX, dtype=float).reshape(-1, nfeat) for pX, _ in blocks])
+    X_data, X_dataprint, selected_et = model.format_data(X)
+    classes = clf.clf.classes_
+    pred, pred_prob = classes[:0], np.zeros((0, len(classes)))
+    if X.shape[0]:
+        pred, pred_prob = clf.predict_with_proba(X_data)
+    bounds = np.cumsum([0] + sizes)
+    results = []
+    for (_, pX_label), start, end in zip(blocks, bounds[:-1], bounds[1:]):
+        results.append((X_data[start:end], X_dataprint[start:end], selected_et,
+                        np.asarray(pX_label).reshape(-1, 4), pred[start:end], pred_prob[start:end]))
+    return results
 
 
 def get_labels_from_csvfile(csvfile, genetic_code):
@@ -1,9 +1,12 @@
 from abc import ABCMeta, abstractmethod
 from . import utils
-from collections import defaultdict, Counter
+from collections import defaultdict
+from functools import partial
 import numpy as np
-import operator
+import string
+from scipy.linalg import expm
 from .letterconfig import *
+from .treearray import ArrayTree
 
 
 def init_back_table(dct):
@@ -14,10 +17,34 @@ def init_back_table(dct):
     return back_table
 
 
+# states of the reconstructions are encoded as bitmasks over this alphabet
+STATE_ALPHABET = sorted(string.ascii_uppercase + '*-.')
+_STATE_INDEX = dict((st, i) for i, st in enumerate(STATE_ALPHABET))
+
+
+def encode_states(states, alphabet=STATE_ALPHABET):
+    """Return the bitmask of a set of states"""
+    index = _STATE_INDEX if alphabet is STATE_ALPHABET else \
+        dict((st, i) for i, st in enumerate(alphabet))
+    mask = 0
+    for st in states:
+        try:
+            mask |= 1 << index[st]
+        except KeyError:
+            raise ValueError("Unknown state %s" % str(st))
+    return mask
+
+
+def decode_states(mask, alphabet=STATE_ALPHABET):
+    """Return the set of states of a bitmask"""
+    return set(st for i, st in enumerate(alphabet) if (int(mask) >> i) & 1)
+
+
 class AbsAncest(metaclass=ABCMeta):
-    def __init__(self, tree, nodestates):
+    def __init__(self, tree, nodestates, alphabet=STATE_ALPHABET):
         self.tree = tree
         self.nodestates = nodestates
+        self.alphabet = alphabet
         self._set_tree()
 
     def _set_tree(self):
@@ -32,17 +59,42 @@ class AbsAncest(metaclass=ABCMeta):
                 node.add_features(state=tmp_dct)
         # add total node count as a feature at the root
         self.tree.add_features(node_count=nnode)
+        # same postorder numbering as the ind feature
+        self.atree = ArrayTree(self.tree)
 
     @abstractmethod
     def label_internal(self, state_mat, **kwargs):
         pass
 
+    def _set_state_mat(self, state_mat):
+        """Keep state_mat as a (characters, nodes) matrix of state bitmasks,
+        encoding it if it is a matrix of sets"""
+        state_mat = np.asarray(state_mat)
+        if state_mat.dtype == object:
+            state_mat = np.vectorize(partial(encode_states, alphabet=self.alphabet),
+                                     otypes=[np.int64])(state_mat)
+        self.state_mat = state_mat.astype(np.int64)
+
+    def _state_bits(self, *masks):
+        """Return the bits used by the state masks"""
+        used = 0
+        for mask in masks:
+            used |= int(np.bitwise_or.reduce(mask, axis=None)) if np.size(mask) else 0
+        return np.array([i for i in range(len(self.alphabet)) if (used >> i) & 1], dtype=np.int64)
+
+    def _subtree_state_counts(self, bits):
+        """Number of leaves of each subtree having each state :
+        a (bits, characters, nodes) array computed in one postorder pass"""
+        leaves = np.where(self.atree.is_leaf, self.state_mat, 0)
+        has_state = (leaves[np.newaxis] >> bits[:, np.newaxis, np.newaxis]) & 1
+        return self.atree.subtree_sum(has_state)
+
     def mat_to_dict(self, charlist, ignore_this={}):
         """Return a dict from the mat"""
         mat_val = utils.makehash(1, list)
         for node in self.tree.traverse():
             for i, val in enumerate(charlist):
-                for st in self.state_mat[i, node.ind]:
+                for st in decode_states(self.state_mat[i, node.ind], self.alphabet):
                     ignore_corr = (ignore_this.get(val, "") == st)
                     if not ignore_corr:
                         mat_val[node.name][st].append(val)
@@ -63,58 +115,197 @@ class AbsAncest(metaclass=ABCMeta):
 
     @classmethod
     def make_codonrea_matrice(clc, tree, nodestates, alphmap={}):
+        """Return the (codons, nodes) matrix of leaf state bitmasks"""
         new_dict, codon_map = clc.flip_rea_forward(nodestates)
         codon_list = sorted(codon_map.keys())
-        # each entry will be a set
-        # hmm not the best way, but hey I'm out of time
         tree_err = "Tree should be root and have total node count as feature"
         assert tree.is_root() and 'node_count' in tree.features, tree_err
         state_mat = np.zeros(
-            (len(codon_list), tree.node_count), dtype='object')
-        state_mat.fill(set([]))
+            (len(codon_list), tree.node_count), dtype=np.int64)
         # looking only at leaf node
         for leaf in tree:
             leaf_state = new_dict[leaf.name]
-            for (icod, state) in [(icod, set(leaf_state.get(cod, alphmap[cod]))) for icod, cod in enumerate(codon_list)]:
-                state_mat[icod, leaf.ind] = state
+            for icod, cod in enumerate(codon_list):
+                state_mat[icod, leaf.ind] = encode_states(
+                    leaf_state.get(cod, alphmap[cod]))
         return state_mat, codon_map, codon_list
 
 
 class LKLBasedAns(AbsAncest):
+    """Likelihood based ancestral reconstruction of all the characters at
+    once, with Felsenstein pruning on the ArrayTree. The model is Mk (equal
+    rates and frequencies over the K states found in the leaves) unless a
+    rate matrix is given.
+    The marginal reconstruction gives each internal node its most probable
+    state (posteriors are kept in self.posteriors), the joint one the most
+    probable assignment of all the internal nodes (Pupko et al., 2000)"""
 
     class MLtype(object):
         marginal = 'margin'
         join = 'join'
         accepted_attr = [marginal, join]
 
+    # maximum number of float in the temporary arrays of the joint method
+    CHUNK_SIZE = 1 << 18
+
     def __init__(self, tree, nodestates, mltype=MLtype.marginal):
         super(LKLBasedAns, self).__init__(tree, nodestates)
         if mltype not in LKLBasedAns.MLtype.accepted_attr:
-            mltype = MLtype.marginal
+            mltype = LKLBasedAns.MLtype.marginal
         self.mltype = mltype
-
-    def label_internal(self, state_mat, **kwargs):
-        self.state_mat = state_mat
-        if self.mltype == MLtype.marginal:
-            return self._margin()
+        self.rate_mat = None
+        self._pcache = {}
+
+    def label_internal(self, state_mat, rate_mat=None, freqs=None, **kwargs):
+        """rate_mat is a KxK rate matrix over the states of the leaves, in
+        the order of the alphabet, and freqs their equilibrium frequencies"""
+        self._set_state_mat(state_mat)
+        self.bits = self._state_bits(np.where(self.atree.is_leaf, self.state_mat, 0))
+        if not len(self.bits):
+            return self.state_mat
+        self._set_model(rate_mat, freqs)
+        if self.mltype == LKLBasedAns.MLtype.marginal:
+            self._margin()
         else:
-            return self._join()
-        raise NotImplemented(
-            "Likelihood based methods are not implemented yet")
+            self._join()
+        return self.state_mat
+
+    def _set_model(self, rate_mat, freqs):
+        k = len(self.bits)
+        if rate_mat is None:
+            rate_mat = (np.ones((k, k)) - k * np.eye(k)) / max(k - 1, 1)
+        rate_mat = np.asarray(rate_mat, dtype=float)
+        if rate_mat.shape != (k, k):
+            raise ValueError("rate_mat should be a %dx%d matrix" % (k, k))
+        self.freqs = np.full(k, 1. / k) if freqs is None else np.asarray(freqs, dtype=float)
+        # transition matrices are cached by branch length for a rate matrix
+        if self.rate_mat is None or not np.array_equal(rate_mat, self.rate_mat):
+            self._pcache = {}
+        self.rate_mat = rate_mat
+
+    def _transition(self, t):
+        t = float(t)
+        if t not in self._pcache:
+            self._pcache[t] = expm(self.rate_mat * t)
+        return self._pcache[t]
+
+    def _transitions(self):
+        """(nodes, K, K) transition matrices of the branch above each node"""
+        return np.stack([self._transition(t) for t in self.atree.dist])
+
+    def _leaf_partials(self):
+        """(characters, nodes, K) indicator of the leaf states, leaves
+        without state can have any state"""
+        partials = ((self.state_mat[..., np.newaxis] >> self.bits) & 1).astype(float)
+        partials[partials.sum(axis=-1) == 0] = 1.
+        return partials
+
+    def _to_state_mat(self, best):
+        """Set the internal nodes of state_mat from state indexes"""
+        internal = self.atree.internal
+        self.state_mat[:, internal] = np.left_shift(1, self.bits[best[:, internal]])
+
+    def _pruning(self, trans):
+        """Felsenstein pruning : scaled likelihood of each subtree given the
+        node state, message sent by each node to its parent, and the log of
+        the scaling factors of each subtree"""
+        atree = self.atree
+        partials = self._leaf_partials()
+        messages = np.empty_like(partials)
+        leaves = atree.leaves
+        messages[:, leaves] = np.einsum('nij,cnj->cni', trans[leaves], partials[:, leaves])
+        logscale = np.zeros(partials.shape[:2])
+        for level, children, offsets in atree.levels:
+            prod = np.multiply.reduceat(messages[:, children], offsets, axis=1)
+            scale = prod.max(axis=-1)
+            scale[scale == 0] = 1.
+            partials[:, level] = prod / scale[..., np.newaxis]
+            logscale[:, level] = np.add.reduceat(
+                logscale[:, children], offsets, axis=1) + np.log(scale)
+            messages[:, level] = np.einsum('nij,cnj->cni', trans[level], partials[:, level])
+        return partials, messages, logscale
+
+    def _sibling_products(self, messages):
+        """Product of the messages of the siblings of each node"""
+        atree = self.atree
+        siblings = np.ones_like(messages)
+        internal = atree.internal
+        nchild = atree.child_ptr[internal + 1] - atree.child_ptr[internal]
+        maxchild = nchild.max() if len(internal) else 0
+        for j in range(maxchild):
+            for k in range(maxchild):
+                parents = internal[(nchild > max(j, k))]
+                if j != k and len(parents):
+                    siblings[:, atree.child_idx[atree.child_ptr[parents] + j]] *= \
+                        messages[:, atree.child_idx[atree.child_ptr[parents] + k]]
+        scale = siblings.max(axis=-1, keepdims=True)
+        return siblings / np.where(scale > 0, scale, 1.)
 
     def _margin(self):
-        print('margin')
-        pass
+        """Marginal reconstruction : posterior of each node state from the
+        likelihood of its subtree and of the rest of the tree"""
+        atree = self.atree
+        trans = self._transitions()
+        partials, messages, logscale = self._pruning(trans)
+        root = atree.root
+        self.loglik = np.log(partials[:, root].dot(self.freqs)) + logscale[:, root]
+        siblings = self._sibling_products(messages)
+        # likelihood of the data out of the subtree, given the node state
+        upper = np.empty_like(partials)
+        upper[:, root] = self.freqs
+        for level in atree.depth_levels:
+            above = upper[:, atree.parent[level]] * siblings[:, level]
+            up = np.einsum('cni,nij->cnj', above, trans[level])
+            scale = up.max(axis=-1, keepdims=True)
+            upper[:, level] = up / np.where(scale > 0, scale, 1.)
+        posteriors = upper * partials
+        total = posteriors.sum(axis=-1, keepdims=True)
+        self.posteriors = posteriors / np.where(total > 0, total, 1.)
+        self._to_state_mat(np.argmax(self.posteriors, axis=-1))
 
     def _join(self):
-        print('join')
-        pass
+        """Joint reconstruction (Pupko et al., 2000) : the best state of
+        each node given the state of its parent is kept during the bottom
+        up pass, and read from the root to the leaves"""
+        atree = self.atree
+        with np.errstate(divide='ignore'):
+            logtrans = np.log(self._transitions())
+            logfreqs = np.log(self.freqs)
+            # best log likelihood of the subtree given the node state
+            logsub = np.log(self._leaf_partials())
+        nchar, k = logsub.shape[0], len(self.bits)
+        best_msg = np.empty_like(logsub)
+        choice = np.zeros(logsub.shape, dtype=np.intp)
+        step = max(1, self.CHUNK_SIZE // (nchar * k * k))
+
+        def send(nodes):
+            for i in range(0, len(nodes), step):
+                chunk = nodes[i:i + step]
+                cand = logtrans[chunk] + logsub[:, chunk, np.newaxis, :]
+                best = np.argmax(cand, axis=-1)
+                choice[:, chunk] = best
+                best_msg[:, chunk] = np.take_along_axis(cand, best[..., np.newaxis], axis=-1)[..., 0]
+
+        send(atree.leaves)
+        for level, children, offsets in atree.levels:
+            logsub[:, level] = np.add.reduceat(best_msg[:, children], offsets, axis=1)
+            send(level)
+        root = logfreqs + logsub[:, atree.root]
+        self.loglik = np.max(root, axis=-1)
+        best = np.zeros((nchar, atree.size), dtype=np.intp)
+        best[:, atree.root] = np.argmax(root, axis=-1)
+        for level in atree.depth_levels:
+            parent_state = best[:, atree.parent[level]]
+            best[:, level] = np.take_along_axis(
+                choice[:, level], parent_state[..., np.newaxis], axis=-1)[..., 0]
+        self._to_state_mat(best)
 
 
 class DolloParsimony(AbsAncest):
 
     def __init__(self, tree, nodestates, binary_mode=False, enforce_order=False, sort_by_size=False):
-        super(DolloParsimony, self).__init__(tree, nodestates)
+        alphabet = [0, 1] if binary_mode else STATE_ALPHABET
+        super(DolloParsimony, self).__init__(tree, nodestates, alphabet)
         self.binary_mode = binary_mode
         self.enforce_order = enforce_order
         self.sort_by_size = sort_by_size
@@ -125,72 +316,61 @@ class DolloParsimony(AbsAncest):
             raise ValueError(
                 "header_list and header_map are needed in non binary_mode")
 
-        self.state_mat = state_mat
+        self._set_state_mat(state_mat)
         self.header_list = header_list
         self.header_map = header_map
         self.null_map = null_map
         self._build_internal_label()
         return self.state_mat
 
-    def __const_term_state(self, term_list, smat, char_states, nullstate):
-        is_valid_for_c = {}
-        if self.enforce_order:
-            # here we suppose that
-            char_states = reversed(sorted(list(char_states)))
-        for c in char_states:
-            # only consider positive state
-            if c and c != nullstate:
-                tmp_c = [sum([1 for x in smat[nlist] if c in x])
-                         for nlist in term_list]
-                if len([x for x in tmp_c if x > 0]) >= 2:
-                    is_valid_for_c[c] = tmp_c
-
-        # sort, whether by total number
-        if self.enforce_order:
-            return [(x, is_valid_for_c[x]) for x in char_states if x in list(is_valid_for_c.keys())]
-        if self.sort_by_size:
-            possible_order = sorted([(x, np.count_nonzero(y)) for x, y in list(is_valid_for_c.items(
-            ))], key=operator.itemgetter(1), reverse=True)
-        else:
-            # here we sort by subtree weight, ignoring excluded subgroup
-            possible_order = sorted([(x, y[-1]) for x, y in list(is_valid_for_c.items())],
-                                    key=operator.itemgetter(1), reverse=True)
-        return possible_order
+    def _char_masks(self, nchar):
+        """Return the bitmask of the states that can be chosen for each
+        character and the bitmask of their null state"""
+        if self.binary_mode:
+            return np.full(nchar, 2, dtype=np.int64), np.ones(nchar, dtype=np.int64)
+        nullstates = np.array([encode_states([self.null_map[c]], self.alphabet)
+                               for c in self.header_list], dtype=np.int64)
+        allowed = np.array([encode_states([x for x in self.header_map[c] if x], self.alphabet)
+                            for c in self.header_list], dtype=np.int64)
+        return allowed & ~nullstates, nullstates
 
     def _build_internal_label(self):
         """Build internal state for dollo model
         see Farris, 1997 : http://sysbio.oxfordjournals.org/content/26/1/77.abstract
+        A state is possible for a node if at least two of the groups it
+        separates (its children subtrees and T-A, the rest of the tree)
+        have a leaf with that state. The leaf counts of each group are taken
+        from the subtree state counts.
         """
-
-        leaves_list_ind = set([l.ind for l in self.tree])
-        get_poss_states = (lambda x: [0, 1]) if self.binary_mode else (
-            lambda x: x[1][x[0]])
-
-        def get_excluded_node_set(node):
-            """ this function serve to get T-A according to Farris
-            algorithm"""
-            return list(leaves_list_ind - set([l.ind for l in node]))
-
-        nullstate = 0
-        for char_i, cur_char in enumerate(self.header_list):
-            char_states = get_poss_states((cur_char, self.header_map))
-            if not self.binary_mode:
-                nullstate = self.null_map[cur_char]
-            for node in self.tree.traverse("postorder"):
-                # dollo look only at internal nodes
-                if not node.is_leaf():
-                    group_list = [[n.ind for n in child]
-                                  for child in node.get_children()]
-                    group_list.append(get_excluded_node_set(node))
-                    pos_state = self.__const_term_state(group_list, self.state_mat[
-                                                        char_i, :], char_states, nullstate)
-                    # choose first state directly
-                    # modify this to consider all potential solutions
-                    chosen_state = {nullstate}
-                    if pos_state:
-                        chosen_state = {pos_state[0][0]}
-                    # print chosen_state, node.name, node.ind, char_i, cur_char
-                    self.state_mat[char_i, node.ind] = chosen_state
+        atree = self.atree
+        internal = atree.internal
+        allowed, nullstates = self._char_masks(self.state_mat.shape[0])
+        bits = self._state_bits(allowed)
+        if not len(internal):
+            return
+        if not len(bits):
+            self.state_mat[:, internal] = nullstates[:, np.newaxis]
+            return
+        # (bits, characters, nodes)
+        in_subtree = self._subtree_state_counts(bits)
+        outside = in_subtree[..., atree.root:] - in_subtree[..., internal]
+        ngroups = atree.children_reduce(np.add, (in_subtree > 0).astype(np.int64)) + (outside > 0)
+        valid = (ngroups >= 2) & (((allowed[np.newaxis] >> bits[:, np.newaxis]) & 1) > 0)[..., np.newaxis]
+
+        # rank the valid states, ties are broken by state order
+        nbits = len(self.alphabet)
+        order = bits[:, np.newaxis, np.newaxis]
+        if self.enforce_order:
+            key = order
+        elif self.sort_by_size:
+            key = ngroups * nbits - order
+        else:
+            # here we sort by subtree weight, ignoring excluded subgroup
+            key = outside * nbits - order
+        key = np.where(valid, key, np.iinfo(np.int64).min)
+        best = np.argmax(key, axis=0)
+        chosen = np.where(valid.any(axis=0), np.left_shift(1, bits[best]), nullstates[:, np.newaxis])
+        self.state_mat[:, internal] = chosen
 
 
 class FitchParsimony(AbsAncest):
@@ -199,61 +379,158 @@ class FitchParsimony(AbsAncest):
         super(FitchParsimony, self).__init__(tree, nodestates)
 
     def label_internal(self, state_mat, header_list=None, header_map=None, null_map=None, **kwargs):
-        self.state_mat, self.header_list = state_mat, header_list
-        # self.state_mat, self.codon_list = self.make_codonrea_matrice(self.tree, self.nodestates, self.alphmap)
+        self._set_state_mat(state_mat)
+        self.header_list = header_list
         self._bottomup()
         self._updown()
         return self.state_mat
 
     def _bottomup(self):
-        for i, st in enumerate(self.header_list):
-            for node in self.tree.traverse("postorder"):
-                if node.is_leaf():
-                    # case previously resolved
-                    pass
-                else:
-                    intersect = set.intersection(
-                        *(self.state_mat[i, child.ind] for child in node.get_children()))
-                    union = set.union(*(self.state_mat[i, child.ind]
-                                        for child in node.get_children()))
-                    if intersect:
-                        self.state_mat[i, node.ind] = intersect
-                    else:
-                        self.state_mat[i, node.ind] = union
-
-    def _get_node_optimal_state(self, node, ichar):
-        accepted_state = self.state_mat[ichar, node.ind]
-        char_score = {}
-        for c in accepted_state:
-            in_subtree = sum(
-                [(1 if c in self.state_mat[ichar, n.ind] else 0) for n in node])
-            out_subtree = sum([(1 if c in self.state_mat[ichar, n.ind] else 0)
-                               for n in node.get_tree_root() if n not in node])
-            char_score[c] = in_subtree - out_subtree
-        return {Counter(char_score).most_common()[0][0]}
+        """Intersection of the children states if not empty, else union,
+        for all the characters at once"""
+        def merge(children, offsets):
+            intersect = np.bitwise_and.reduceat(children, offsets, axis=-1)
+            union = np.bitwise_or.reduceat(children, offsets, axis=-1)
+            return np.where(intersect != 0, intersect, union)
+        self.atree.bottom_up(self.state_mat, merge)
+
+    def _get_optimal_states(self):
+        """Best state of each node among its states : the one with the most
+        leaves in the subtree minus the leaves out of the subtree"""
+        bits = self._state_bits(self.state_mat)
+        optimal = np.zeros_like(self.state_mat)
+        if not len(bits):
+            return optimal
+        in_subtree = self._subtree_state_counts(bits)
+        score = 2 * in_subtree - in_subtree[..., self.atree.root:]
+        accepted = ((self.state_mat[np.newaxis] >> bits[:, np.newaxis, np.newaxis]) & 1) > 0
+        score = np.where(accepted, score, np.iinfo(score.dtype).min)
+        best = np.argmax(score, axis=0)
+        return np.where(accepted.any(axis=0), np.left_shift(1, bits[best]), 0)
 
     def _updown(self):
-        for ichar, st in enumerate(self.header_list):
-            # choose state for root
-            if len(self.state_mat[ichar, self.tree.ind]) > 1:
-                rstate = self._get_node_optimal_state(self.tree, ichar)
-                self.state_mat[ichar, self.tree.ind] = rstate
-
-            for node in self.tree.iter_descendants("preorder"):
-                parent_state = self.state_mat[ichar, node.up.ind]
-                if parent_state.intersection(self.state_mat[ichar, node.ind]):
-                    self.state_mat[ichar, node.ind] = parent_state
-                else:
-                    self.state_mat[ichar, node.ind] = self._get_node_optimal_state(
-                        node, ichar)
+        atree = self.atree
+        optimal = self._get_optimal_states()
+        bottomup = self.state_mat.copy()
+        # choose state for root
+        root_state = bottomup[:, atree.root]
+        multiple = (root_state & (root_state - 1)) != 0
+        self.state_mat[:, atree.root] = np.where(multiple, optimal[:, atree.root], root_state)
+
+        def update(nodes, parent_state):
+            return np.where((parent_state & bottomup[:, nodes]) != 0, parent_state, optimal[:, nodes])
+        atree.top_down(self.state_mat, update)
+
+
+class BitsetRec(object):
+    """Fitch or Dollo reconstruction of many binary characters at once,
+    e.g. one per reassignment (aa1, aa2) or one per codon.
+    Leaf states are packed as bit vectors over the characters (8 per byte),
+    and each pass is a single vectorized sweep over the levels of an
+    ArrayTree. reassigned holds the node states as bitmasks ({0} --> 1,
+    {1} --> 2, {0, 1} --> 3) and distances the number of nodes between a
+    node and its closest reassigned ancestor (itself included)"""
+
+    def __init__(self, atree, leaf_states, mode="fitch"):
+        """leaf_states is a (characters, leaves) boolean array, the leaves
+        being in the order of atree.leaves"""
+        if mode not in ("fitch", "dollo"):
+            raise NotImplementedError(
+                "The method %s you asked for is not implemented" % mode)
+        self.atree = atree
+        self.mode = mode
+        leaf_states = np.asarray(leaf_states, dtype=bool).reshape(-1, len(atree.leaves))
+        self.nchar = leaf_states.shape[0]
+        states = np.zeros((self.nchar, atree.size), dtype=bool)
+        states[:, atree.leaves] = leaf_states
+        dest = np.packbits(states, axis=0)
+        ori = np.packbits(~states & atree.is_leaf, axis=0)
+        if mode == "fitch":
+            ori, dest = self._fitch(atree, ori, dest)
+        else:
+            ori, dest = self._dollo(atree, ori, dest)
+        ori = np.unpackbits(ori, axis=0, count=self.nchar)
+        dest = np.unpackbits(dest, axis=0, count=self.nchar)
+        self.reassigned = ori | (dest << 1)
+        self.distances = self._distances(atree, dest.astype(bool))
+
+    @classmethod
+    def from_species(clc, atree, species_lists, mode="fitch"):
+        """Reconstruct one character per list of reassigned species"""
+        leaf_states = np.zeros((len(species_lists), len(atree.leaves)), dtype=bool)
+        rank = dict((atree.names[x], i) for i, x in enumerate(atree.leaves))
+        for i, species in enumerate(species_lists):
+            leaf_states[i, [rank[x] for x in species if x in rank]] = True
+        return clc(atree, leaf_states, mode)
+
+    @classmethod
+    def _fitch(clc, atree, ori, dest):
+        """Fitch bottom up pass : intersection of the children states
+        if it is not empty, else their union"""
+        def merge(children, offsets):
+            intersect = np.bitwise_and.reduceat(children, offsets, axis=-1)
+            union = np.bitwise_or.reduceat(children, offsets, axis=-1)
+            empty = ~(intersect[0] | intersect[1])
+            return intersect | (union & empty)
+        values = atree.bottom_up(np.stack([ori, dest]), merge)
+        return values[0], values[1]
+
+    @classmethod
+    def _dollo(clc, atree, ori, dest):
+        """Dollo pass : an internal node is reassigned if at least two of the
+        groups it separates (its children subtrees and the rest of the
+        tree) contain a reassigned leaf"""
+        in_subtree = atree.bottom_up(
+            dest.copy(), lambda children, offsets: np.bitwise_or.reduceat(children, offsets, axis=-1))
+        # with the postorder numbering, the rest of the tree of node i
+        # is made of the nodes before first[i] and after i
+        prefix = np.zeros((dest.shape[0], atree.size + 1), dtype=dest.dtype)
+        np.bitwise_or.accumulate(dest, axis=-1, out=prefix[:, 1:])
+        suffix = np.zeros_like(prefix)
+        suffix[:, :-1] = np.bitwise_or.accumulate(dest[:, ::-1], axis=-1)[:, ::-1]
+        internal = atree.internal
+        outside = prefix[:, atree.first[internal]] | suffix[:, internal + 1]
+        # bits seen in at least one / two of the groups
+        seen_once = outside
+        seen_twice = np.zeros_like(outside)
+        nchild = atree.child_ptr[internal + 1] - atree.child_ptr[internal]
+        for j in range(nchild.max() if len(internal) else 0):
+            sel = nchild > j
+            child = in_subtree[:, atree.child_idx[atree.child_ptr[internal[sel]] + j]]
+            seen_twice[:, sel] |= seen_once[:, sel] & child
+            seen_once[:, sel] |= child
+        dest = dest.copy()
+        ori = ori.copy()
+        dest[:, internal] = seen_twice
+        ori[:, internal] = ~seen_twice
+        return ori, dest
+
+    @classmethod
+    def _distances(clc, atree, reassigned):
+        """Distance of each node to its closest reassigned ancestor"""
+        distances = np.zeros(reassigned.shape, dtype=np.intp)
+        distances[..., atree.root] = np.where(reassigned[..., atree.root], 0, 1)
+        return atree.top_down(distances, lambda nodes, parent_dist:
+                              np.where(reassigned[..., nodes], 0, parent_dist + 1))
 
 
 class SingleNaiveRec(object):
-    """A NaiveFitch algorithm for finding the most parcimonious solution"""
+    """A NaiveFitch algorithm for finding the most parcimonious solution.
+    The reconstruction is done by BitsetRec on the arrays of an ArrayTree,
+    both can be shared by all reassignments. The ete3 tree (self.tree) is
+    only built when it is needed, for rendering"""
+
+    # node states are bitmasks : {0} --> 1, {1} --> 2, {0, 1} --> 3
+    ORI, DEST = 1, 2
 
-    def __init__(self, tree, reassigned, ori_aa, dest_aa, dct, codon_rea=(None, None), mode="fitch"):
+    def __init__(self, tree, reassigned, ori_aa, dest_aa, dct, codon_rea=(None, None), mode="fitch", recon=None):
+        """recon is an optional (BitsetRec, row) with the reconstruction
+        of the reassigned species"""
         self.id = {}
-        self.tree = tree
+        if not isinstance(tree, ArrayTree):
+            tree = ArrayTree(tree)
+        self.atree = tree
+        self._tree = None
         self.corr = {'0': ori_aa, '1': dest_aa}
         self.codon_rea_global, self.codon_rea_filtered = codon_rea
         colors = ['#a6cee3', '#1f78b4', '#b2df8a',
@@ -262,30 +539,93 @@ class SingleNaiveRec(object):
         self.back_table = init_back_table(dct)
         codon_list = self.back_table[aa_letters_3to1[ori_aa]]
         self.colors = dict(list(zip(codon_list, colors)))
-        for leaf in tree:
-            if leaf.name in reassigned:
-                leaf.add_features(reassigned={1})
-                leaf.add_features(rea=self.corr['1'])
-                leaf.add_features(state=dest_aa)
-            else:
-                leaf.add_features(reassigned={0})
-                leaf.add_features(rea=self.corr['0'])
-                leaf.add_features(state=ori_aa)
-
         self.ori_aa = ori_aa
         self.dest_aa = dest_aa
         self.ori_aa1 = aa_letters_3to1[ori_aa]
         self.dest_aa1 = aa_letters_3to1[dest_aa]
-        self.newick = tree.write(features=['name', 'dist', 'support', 'state'])
         self.mode = mode
-        self._bottomup(self.tree)
-        self._topdown(self.tree)
+
+        # leaf states, and count data of the leaves
+        self.leaf_rea = np.zeros(tree.size, dtype=bool)
+        self.leaf_rea[[tree.leaf_index[x] for x in reassigned if x in tree.leaf_index]] = True
+        self.has_data = np.zeros(tree.size, dtype=bool)
+        self.count = np.zeros(tree.size, dtype=np.int64)
+        self.filter_count = np.zeros(tree.size, dtype=np.int64)
+        self.lost = np.zeros(tree.size, dtype=bool)
+        # reconstruction, possibly shared with other reassignments
+        if recon is None:
+            recon = (BitsetRec(tree, self.leaf_rea[tree.leaves], mode), 0)
+        recon, row = recon
+        self.reassigned = recon.reassigned[row]
+        self.distances = recon.distances[row]
 
     def update_codon_data(codon_rea):
         """Update codon reassignment data (global and filtered)
         """
         self.codon_rea_global, self.codon_rea_filtered = codon_rea
 
+    def _node(self, node):
+        """Return the index of a node given as index, leaf name or ete3 node"""
+        if isinstance(node, str):
+            return self.atree.leaf_index[node]
+        if hasattr(node, 'name'):
+            return self.atree.leaf_index[node.name]
+        return node
+
+    def set_leaf_data(self, genome, count, filter_count, lost=True):
+        """Set the substitution counts of a leaf"""
+        i = self._node(genome)
+        self.has_data[i] = True
+        self.count[i] = count
+        self.filter_count[i] = filter_count
+        self.lost[i] = lost
+        self._tree = None
+
+    def set_lost(self, genome, lost):
+        """Set whether the reassignment is lost in a leaf"""
+        i = self._node(genome)
+        if self.has_data[i]:
+            self.lost[i] = lost
+            self._tree = None
+
+    def is_lost(self, genome):
+        """Return True if the leaf has count data and is marked as lost"""
+        i = self._node(genome)
+        return bool(self.has_data[i] and self.lost[i])
+
+    def get_leaf_data(self, genome):
+        """Return the (count, filter_count) of a leaf"""
+        i = self._node(genome)
+        return int(self.count[i]), int(self.filter_count[i])
+
+    def _rea_label(self, mask):
+        return "/".join([self.corr[str(r)] for r in (0, 1) if mask & (1 << r)])
+
+    @property
+    def tree(self):
+        """ete3 tree with the reconstruction as node features"""
+        if self._tree is None:
+            atree = self.atree
+            reassigned = [set(r for r in (0, 1) if m & (1 << r)) for m in self.reassigned]
+            rea = [None] * atree.size
+            state = [None] * atree.size
+            for i in atree.leaves:
+                state[i] = self.dest_aa if self.leaf_rea[i] else self.ori_aa
+            for i in (range(atree.size) if self.mode == "fitch" else atree.leaves):
+                rea[i] = self._rea_label(self.reassigned[i])
+            features = {'reassigned': reassigned, 'rea': rea, 'state': state}
+            for fname in ('count', 'filter_count', 'lost'):
+                values = getattr(self, fname)
+                features[fname] = [(values[i].item() if self.has_data[i] else None)
+                                   for i in range(atree.size)]
+            self._tree = atree.to_ete(features)
+        return self._tree
+
+    @property
+    def newick(self):
+        """Newick of the tree with the leaf states"""
+        return self.tree.write(features=['name', 'dist', 'support', 'state'])
+
     def write_tree(self, outfile):
         """Export newick to  a file"""
         with open(outfile, 'w') as OUT:
@@ -293,24 +633,26 @@ class SingleNaiveRec(object):
 
     def is_valid(self, thresh=1):
         """Naive function to test whether or not if the current reassignment is valid"""
-        tmptree = self.tree.copy()
-        for l in tmptree.traverse():
-            if not l.is_leaf():
-                l.del_feature('reassigned')
-                l.del_feature('rea')
-            elif (l.state == self.dest_aa and l.lost) or l.count < thresh:
-                l.add_features(reassigned={0})
-                l.add_features(rea=self.corr['0'])
-                l.add_features(state=self.ori_aa)
-            elif ('lost' in l.features and not l.lost) and l.state == self.ori_aa and l.count >= thresh:
-                l.add_features(reassigned={1})
-                l.add_features(rea=self.corr['1'])
-                l.add_features(state=self.dest_aa)
-        # At least one node with reassignment persist in the data
-        for node in tmptree:
-            if node.rea == self.dest_aa:
-                return True
-        return False
+        # At least one leaf with reassignment persist in the data :
+        # reassigned leaves without count data are kept as they are and
+        # leaves with enough counts that are not lost are reassigned
+        leaves = self.atree.leaves
+        has_data = self.has_data[leaves]
+        kept = has_data & ~self.lost[leaves] & (self.count[leaves] >= thresh)
+        return bool(np.any(kept | (~has_data & self.leaf_rea[leaves])))
+
+    def can_be_valid(self, thresh=1):
+        """Return False if the reassignment cannot be valid, whatever the
+        lost flags of the leaves"""
+        leaves = self.atree.leaves
+        has_data = self.has_data[leaves]
+        return bool(np.any((has_data & (self.count[leaves] >= thresh)) |
+                           (~has_data & self.leaf_rea[leaves])))
+
+    def get_leaf_candidates(self, thresh=1):
+        """Return the leaves whose lost flag can make the reassignment valid"""
+        leaves = self.atree.leaves
+        return [self.atree.names[i] for i in leaves[self.has_data[leaves] & (self.count[leaves] >= thresh)]]
 
     @classmethod
     def _fitch(clc, tree, corr):
@@ -331,35 +673,6 @@ class SingleNaiveRec(object):
                 node.add_features(
                     rea="/".join([corr[str(r)] for r in node.reassigned]))
 
-    @classmethod
-    def _dollo(clc, tree):
-        nodelist = tree.get_leaves()
-        for node in tree.traverse('postorder'):
-            if not node.is_leaf():
-                internal_grp = [max([next(iter(c.reassigned))
-                                     for c in n]) for n in node.get_children()]
-                if not node.is_root():
-                    internal_grp.append(max(
-                        [next(iter(c.reassigned)) for c in nodelist if c.name not in node.get_leaf_names()]))
-                if np.count_nonzero(internal_grp) >= 2:
-                    node.add_features(reassigned={1})
-                else:
-                    node.add_features(reassigned={0})
-
-    def _bottomup(self, tree):
-        if self.mode == "fitch":
-            self._fitch(tree, self.corr)
-        elif self.mode == "dollo":
-            self._dollo(tree)
-        else:
-            raise NotImplementedError(
-                "The method %s you asked for is not implemented" % self.mode)
-
-    def _topdown(self, tree):
-        """Fitch algorithm part 2 : top down"""
-        # Since it's not need, just pass
-        pass
-
     def is_reassigned(cls, node, strict=True):
         """ return True if a node has undergoned reassignment """
         if "reassigned" in node.features and (node.reassigned == {1} or (not strict and 1 in node.reassigned)):
@@ -368,25 +681,20 @@ class SingleNaiveRec(object):
 
     def get_species_list(self, limit_to_suspected=False):
         """Get the current species list for this tree"""
-        slist = set()
+        atree = self.atree
         if limit_to_suspected:
-            for node in self.tree.traverse():
-                if 'reassigned' in node.features and node.reassigned == {1}:
-                    slist.update(node.get_leaf_names())
-        else:
-            slist = set(self.tree.get_tree_root().get_leaf_names())
-        return slist
+            # leaves under at least one node reassigned to {1}
+            rea_nodes = np.flatnonzero(self.reassigned == self.DEST)
+            cover = np.zeros(atree.size + 1, dtype=np.intp)
+            np.add.at(cover, atree.first[rea_nodes], 1)
+            np.add.at(cover, rea_nodes + 1, -1)
+            under = np.cumsum(cover[:-1]) > 0
+            return set(atree.names[i] for i in atree.leaves[under[atree.leaves]])
+        return set(atree.get_leaf_names())
 
     def get_distance_to_rea_node(self, node):
         """Get the distance of node to the closest reassigned lca"""
-        cur_node = node
-        if isinstance(node, str):
-            cur_node = self.tree & node
-        dist = 0
-        while cur_node is not None and not self.is_reassigned(cur_node, strict=False):
-            dist += 1
-            cur_node = cur_node.up
-        return dist
+        return int(self.distances[self._node(node)])
 
     def has_codon_data(self):
         # base codon_data on filtered position only
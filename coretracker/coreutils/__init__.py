@@ -18,6 +18,7 @@ from . import utils
 from .utils import SequenceLoader, SequenceSet, ReaGenomeFinder
 from . import AncestralRecon
 from . import Faces
+from .codonusage import CodonUsage
 
 __all__ = ['utils', 'SequenceLoader', 'SequenceSet', 'CoreFile',
-           'ReaGenomeFinder', 'AncestralRecon', 'Faces']
+           'ReaGenomeFinder', 'AncestralRecon', 'Faces', 'CodonUsage']
@@ -0,0 +1,53 @@
+import numpy as np
+
+from .seqarray import CODONS, GAP_CODON, UNDEF_CODON, codon_index_matrix
+
+
+class CodonUsage(object):
+    """Codon usage table of a codon alignment.
+    counts is a (species x 64) matrix following the CODONS order, gaps and
+    undefined are the number of gap and undefined codons in each species"""
+
+    def __init__(self, counts, species, gaps=None, undefined=None):
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.species = list(species)
+        nspec = len(self.species)
+        self.gaps = np.zeros(nspec, dtype=np.int64) if gaps is None else np.asarray(gaps)
+        self.undefined = np.zeros(nspec, dtype=np.int64) if undefined is None else np.asarray(undefined)
+        self.spec_index = dict((s, i) for i, s in enumerate(self.species))
+
+    @classmethod
+    def from_alignment(clc, codon_alignment, ids=None, gap_char='-'):
+        """Count codons in each species of a codon alignment in one pass"""
+        index, species = codon_index_matrix(codon_alignment, ids, gap_char)
+        nspec = len(species)
+        defined = index >= 0
+        flat = (np.arange(nspec)[:, None] * len(CODONS) + index)[defined]
+        counts = np.bincount(flat, minlength=nspec * len(CODONS))
+        return clc(counts.reshape(nspec, len(CODONS)), species,
+                   np.sum(index == GAP_CODON, axis=1), np.sum(index == UNDEF_CODON, axis=1))
+
+    def __getitem__(self, spec):
+        """Return codon usage of a species as a dict"""
+        row = self.counts[self.spec_index[spec]]
+        return dict((CODONS[i], int(row[i])) for i in np.nonzero(row)[0])
+
+    def __len__(self):
+        return len(self.species)
+
+    def to_dict(self):
+        """Return codon usage of all species as a dict of dict"""
+        return dict((spec, self[spec]) for spec in self.species)
+
+    def save(self, outfile):
+        """Save the usage table in numpy compressed format"""
+        np.savez_compressed(outfile, counts=self.counts, species=np.asarray(self.species),
+                            codons=np.asarray(CODONS), gaps=self.gaps, undefined=self.undefined)
+
+    @classmethod
+    def load(clc, infile):
+        """Load a usage table saved with `save`"""
+        data = np.load(infile)
+        if list(data['codons']) != CODONS:
+            raise ValueError("Unexpected codon order in %s" % infile)
+        return clc(data['counts'], data['species'].tolist(), data['gaps'], data['undefined'])
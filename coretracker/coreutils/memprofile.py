@@ -0,0 +1,168 @@
+import gc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# object types reported in the per stage summary
+TRACKED_TYPES = ('SeqRecord', 'Seq', 'CodonSeq', 'MultipleSeqAlignment', 'Counter',
+                 'defaultdict', 'dict', 'list', 'set', 'ndarray', 'TreeNode')
+
+
+def get_rss():
+    """Return the current resident set size in bytes (0 if unknown)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        # ru_maxrss is in kilobytes on linux and bytes on mac
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == 'darwin' else maxrss * 1024
+    return 0
+
+
+def count_objects(typenames=TRACKED_TYPES):
+    """Count the objects tracked by the garbage collector, by type name"""
+    counts = Counter(type(obj).__name__ for obj in gc.get_objects())
+    if typenames:
+        return dict((t, counts.get(t, 0)) for t in typenames)
+    return dict(counts)
+
+
+def deep_sizeof(obj, max_objects=10000000):
+    """Approximate the memory used by an object and everything it references"""
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack and len(seen) < max_objects:
+        cur = stack.pop()
+        if id(cur) in seen or isinstance(cur, type):
+            continue
+        seen.add(id(cur))
+        # numpy arrays include their own buffer in getsizeof
+        size += sys.getsizeof(cur, 0)
+        stack.extend(gc.get_referents(cur))
+    return size
+
+
+class _RSSSampler(threading.Thread):
+    """Background thread that keeps the highest RSS seen"""
+
+    def __init__(self, interval):
+        super(_RSSSampler, self).__init__()
+        self.daemon = True
+        self.interval = interval
+        self.peak = get_rss()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.peak = max(self.peak, get_rss())
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.peak = max(self.peak, get_rss())
+        return self.peak
+
+
+class MemoryTracker(object):
+    """Per stage memory accounting.
+    mode can be None (disabled), 'rss' (RSS sampling only) or 'trace'
+    (RSS sampling, tracemalloc peak and top allocation sites and object counts)
+    """
+    modes = (None, 'rss', 'trace')
+
+    def __init__(self, mode=None, top=10, nframe=1, interval=0.05):
+        if mode not in self.modes:
+            raise ValueError("Memory profiling mode should be one of %s" %
+                             str(self.modes))
+        self.mode = mode
+        self.top = top
+        self.nframe = nframe
+        self.interval = interval
+        self.stages = []
+        self.sizes = {}
+        if self.mode == 'trace' and not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframe)
+
+    @property
+    def enabled(self):
+        return self.mode is not None
+
+    def _top_allocations(self, snapshot, previous):
+        """Return the allocation sites that grew the most during the stage"""
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, __file__)]
+        snapshot = snapshot.filter_traces(filters)
+        stats = snapshot.compare_to(previous.filter_traces(filters), 'lineno')
+        top = []
+        for stat in stats[:self.top]:
+            frame = stat.traceback[0]
+            top.append({'file': frame.filename, 'line': frame.lineno,
+                        'size': stat.size, 'size_diff': stat.size_diff,
+                        'count': stat.count, 'count_diff': stat.count_diff})
+        return top
+
+    @contextmanager
+    def stage(self, name):
+        """Context manager recording memory usage of a pipeline stage"""
+        if not self.enabled:
+            yield
+            return
+        record = {'stage': name, 'rss_start': get_rss()}
+        sampler = _RSSSampler(self.interval)
+        sampler.start()
+        tracing = self.mode == 'trace'
+        if tracing:
+            before = tracemalloc.take_snapshot()
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            record['traced_start'] = tracemalloc.get_traced_memory()[0]
+        tstart = time.time()
+        try:
+            yield
+        finally:
+            record['time'] = time.time() - tstart
+            record['rss_peak'] = sampler.stop()
+            record['rss_end'] = get_rss()
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                record['traced_end'] = current
+                record['traced_peak'] = peak
+                record['top_allocations'] = self._top_allocations(
+                    tracemalloc.take_snapshot(), before)
+                record['objects'] = count_objects()
+            self.stages.append(record)
+            logging.debug("Memory [%s] : rss peak %.1f MB, rss end %.1f MB" %
+                          (name, record['rss_peak'] / 1e6, record['rss_end'] / 1e6))
+
+    def record_size(self, name, obj):
+        """Record the deep size of a data structure (trace mode only)"""
+        if self.mode == 'trace':
+            self.sizes[name] = deep_sizeof(obj)
+
+    def report(self):
+        """Return the report as a dict"""
+        return {'mode': self.mode, 'stages': self.stages, 'sizes': self.sizes,
+                'rss_peak': max([s['rss_peak'] for s in self.stages] or [get_rss()])}
+
+    def save(self, outfile):
+        """Write the report in a json file"""
+        if self.enabled:
+            with open(outfile, 'w') as OUT:
+                json.dump(self.report(), OUT, indent=4)
+            if self.mode == 'trace':
+                tracemalloc.stop()
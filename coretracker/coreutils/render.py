@@ -0,0 +1,67 @@
+import logging
+import multiprocessing
+import traceback
+
+
+def _run_job(func, args, kwargs):
+    """Run a render job, errors are only logged"""
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logging.warning("Rendering with %s failed :\n%s" %
+                        (getattr(func, '__name__', func), traceback.format_exc()))
+
+
+def _render_worker(queue):
+    """Run the jobs of the queue until a None is received"""
+    for job in iter(queue.get, None):
+        _run_job(*job)
+
+
+class Renderer(object):
+    """Pool of processes making the figures of the reports.
+    Jobs (func, args, kwargs) are put in a queue and func should be a module
+    level function so that they can be pickled. The queue is inherited by
+    the processes forked after the pool is started (the report workers), so
+    they can submit jobs too. Without process, jobs are run right away, and
+    they are ignored if rendering is disabled"""
+
+    def __init__(self, nprocs=0, enabled=True):
+        self.enabled = enabled
+        self.queue = None
+        self.procs = []
+        if enabled and nprocs > 0:
+            ctx = multiprocessing.get_context('fork')
+            self.queue = ctx.Queue()
+            for i in range(nprocs):
+                proc = ctx.Process(target=_render_worker, args=(self.queue,))
+                proc.daemon = True
+                proc.start()
+                self.procs.append(proc)
+
+    def submit(self, func, *args, **kwargs):
+        """Render func(*args, **kwargs)"""
+        if not self.enabled:
+            return
+        if self.queue is None:
+            _run_job(func, args, kwargs)
+        else:
+            self.queue.put((func, args, kwargs))
+
+    def close(self):
+        """Wait for the submitted jobs and stop the processes"""
+        if self.queue is None:
+            return
+        for proc in self.procs:
+            self.queue.put(None)
+        for proc in self.procs:
+            proc.join()
+        self.queue.close()
+        self.queue = None
+        self.procs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,127 @@
+import json
+import os
+
+import numpy as np
+
+
+def _to_json(obj):
+    """json default for numpy values and sets"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError("%s is not JSON serializable" % type(obj).__name__)
+
+
+class JsonlRecords(object):
+    """Iterable over the records of a JSONL file. The file is read again,
+    one record at a time, each time the object is iterated"""
+
+    def __init__(self, path, decode=None):
+        self.path = path
+        self.decode = decode
+
+    def __iter__(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as IN:
+            for line in IN:
+                if line.strip():
+                    record = json.loads(line)
+                    yield self.decode(record) if self.decode else record
+
+
+class ResultSink(object):
+    """Write the evidence (alldata) and the predictions of each reassignment
+    as soon as they are computed, one JSON record per line, so that they do
+    not have to be kept in memory.
+    The offset of each evidence record is kept in an index (saved next to
+    the records) for random access, and close() writes a manifest with the
+    layout of reassignment.json"""
+
+    def __init__(self, outdir, name="reassignment"):
+        self.data_file = os.path.join(outdir, name + ".jsonl")
+        self.index_file = os.path.join(outdir, name + ".index.json")
+        self.manifest_file = os.path.join(outdir, name + ".json")
+        self.pred_file = os.path.join(outdir, "predictions.jsonl")
+        # index[aa2][aa1] = (offset, length) of the record in data_file
+        self.index = {}
+        self._data = open(self.data_file, 'wb')
+        self._pred = open(self.pred_file, 'w')
+
+    @property
+    def closed(self):
+        return self._data.closed
+
+    def add(self, aa1, aa2, data):
+        """Write the evidence of the reassignment aa2 to aa1"""
+        line = (json.dumps({'aa2': aa2, 'aa1': aa1, 'data': data},
+                           default=_to_json) + "\n").encode('utf-8')
+        self.index.setdefault(aa2, {})[aa1] = (self._data.tell(), len(line))
+        self._data.write(line)
+        self._data.flush()
+
+    def get(self, aa2, aa1):
+        """Read back the evidence of the reassignment aa2 to aa1"""
+        offset, length = self.index[aa2][aa1]
+        with open(self.data_file, 'rb') as IN:
+            IN.seek(offset)
+            return json.loads(IN.read(length).decode('utf-8'))['data']
+
+    def add_predictions(self, preds):
+        """Write the predictions of a reassignment : (X_labels, pred,
+        pred_prob, codvalid) as returned by the classification"""
+        X_labels, pred, pred_prob, codvalid = preds
+        self._pred.write(json.dumps({'labels': X_labels, 'pred': pred, 'prob': pred_prob,
+                                     'valid': codvalid}, default=_to_json) + "\n")
+        self._pred.flush()
+
+    @classmethod
+    def _decode_predictions(clc, record):
+        return (np.array(record['labels']), np.array(record['pred']),
+                np.array(record['prob']), record['valid'])
+
+    @property
+    def predictions(self):
+        """Iterable over the saved predictions, in the format of
+        add_predictions"""
+        return JsonlRecords(self.pred_file, self._decode_predictions)
+
+    def records(self):
+        """Iterate over the (aa2, aa1, evidence) saved"""
+        for record in JsonlRecords(self.data_file):
+            yield record['aa2'], record['aa1'], record['data']
+
+    def close(self, extra=None):
+        """Close the streams, save the index and write the manifest. extra
+        holds the other entries of the manifest (genes, genome, codons)"""
+        if self.closed:
+            return
+        self._data.close()
+        self._pred.close()
+        with open(self.index_file, 'w') as OUT:
+            json.dump(self.index, OUT)
+        self.write_manifest(extra)
+
+    def write_manifest(self, extra=None):
+        """Write the reassignment.json manifest, reading the evidence one
+        record at a time"""
+        extra = dict((k, v) for k, v in list((extra or {}).items()) if k != 'aa')
+        with open(self.data_file, 'rb') as IN, open(self.manifest_file, 'w') as OUT:
+            OUT.write('{"aa": {')
+            for i, aa2 in enumerate(sorted(self.index)):
+                OUT.write('%s%s: {' % (", " if i else "", json.dumps(aa2)))
+                for j, aa1 in enumerate(sorted(self.index[aa2])):
+                    offset, length = self.index[aa2][aa1]
+                    IN.seek(offset)
+                    data = json.loads(IN.read(length).decode('utf-8'))['data']
+                    OUT.write('%s%s: ' % (", " if j else "", json.dumps(aa1)))
+                    json.dump(data, OUT)
+                OUT.write('}')
+            OUT.write('}')
+            for k, v in list(extra.items()):
+                OUT.write(', %s: ' % json.dumps(k))
+                json.dump(v, OUT, default=_to_json)
+            OUT.write('}\n')
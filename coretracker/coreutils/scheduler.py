@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+
+import numpy as np
+from scipy.optimize import nnls
+
+
+class PairCostModel(object):
+    """Linear model of the time taken by a stage (analysis or report) for
+    each (aa1, aa2). The weights are fitted on the timings recorded in
+    previous runs, which are kept in a json file.
+    Features of a pair are [1, genomes, species, species * positions,
+    valid * genomes], see features"""
+
+    # weights used until enough timings are recorded
+    DEFAULT_WEIGHTS = {'analysis': [0., 1e-3, 1e-2, 1e-5, 0.],
+                       'report': [0., 1e-3, 1e-2, 1e-5, 1e-1]}
+    # number of timings kept per stage
+    MAX_SAMPLES = 5000
+
+    def __init__(self, timefile=None):
+        self.timefile = timefile
+        self.samples = {}
+        self.weights = {}
+        if timefile and os.path.exists(timefile):
+            try:
+                with open(timefile) as IN:
+                    self.samples = json.load(IN)
+            except ValueError:
+                logging.warning("Could not read the pair timings in %s" % timefile)
+        for stage in self.samples:
+            self.fit(stage)
+
+    @classmethod
+    def default_timefile(clc):
+        """Per-user file where the timings are kept between runs, whatever
+        their output directory"""
+        cachedir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(cachedir, 'coretracker', 'pair_timings.json')
+
+    @classmethod
+    def features(clc, ngenomes, nspecies, npositions, nvalid=0):
+        """Features of a pair : number of genomes, of reassigned species, of
+        positions where aa1 is the consensus and of predicted codons to
+        validate"""
+        return [1., ngenomes, nspecies, nspecies * npositions, nvalid * ngenomes]
+
+    def fit(self, stage):
+        """Fit the weights of a stage on its recorded timings"""
+        samples = self.samples.get(stage, [])
+        nfeat = len(self.DEFAULT_WEIGHTS[stage])
+        if len(samples) < 2 * nfeat:
+            self.weights.pop(stage, None)
+            return
+        A = np.array([x for x, t in samples], dtype=float)
+        b = np.array([t for x, t in samples], dtype=float)
+        # the columns are scaled so that the fit does not depend on the units
+        scale = np.abs(A).max(axis=0)
+        scale[scale == 0] = 1
+        weights, _ = nnls(A / scale, b)
+        self.weights[stage] = weights / scale
+
+    def estimate(self, stage, features):
+        """Estimated time (in s) of a pair"""
+        weights = self.weights.get(stage, self.DEFAULT_WEIGHTS[stage])
+        return float(np.dot(weights, features))
+
+    def order(self, stage, tasks, features):
+        """Sort tasks by decreasing estimated time, features holding the
+        features of each task"""
+        costs = [self.estimate(stage, x) for x in features]
+        order = sorted(range(len(tasks)), key=lambda i: -costs[i])
+        return [tasks[i] for i in order]
+
+    def record(self, stage, features, seconds):
+        """Record the time taken by a pair"""
+        self.samples.setdefault(stage, []).append([list(map(float, features)), seconds])
+
+    def save(self):
+        """Refit the model and save the most recent timings"""
+        for stage in self.samples:
+            self.samples[stage] = self.samples[stage][-self.MAX_SAMPLES:]
+            self.fit(stage)
+        if self.timefile:
+            try:
+                timedir = os.path.dirname(self.timefile)
+                if timedir and not os.path.isdir(timedir):
+                    os.makedirs(timedir)
+                with open(self.timefile, 'w') as OUT:
+                    json.dump(self.samples, OUT)
+            except (IOError, OSError) as e:
+                logging.warning("Could not save the pair timings in %s : %s" % (self.timefile, e))
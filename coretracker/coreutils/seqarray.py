@@ -0,0 +1,64 @@
+import itertools
+
+import numpy as np
+
+# codon order shared with the classifier (codon_identifier) and codonclust
+CODONS = ["".join(x) for x in itertools.product('ATGC', repeat=3)]
+CODON_INDEX = dict((c, i) for i, c in enumerate(CODONS))
+# negative codes used in codon index matrices
+GAP_CODON = -1
+UNDEF_CODON = -2
+
+_NUC_CODE = np.full(256, -1, dtype=np.int16)
+for _i, _nuc in enumerate('ATGC'):
+    _NUC_CODE[ord(_nuc)] = _i
+    _NUC_CODE[ord(_nuc.lower())] = _i
+_NUC_CODE[ord('U')] = _NUC_CODE[ord('u')] = _NUC_CODE[ord('T')]
+
+
+def _records_and_ids(records, ids=None):
+    """Return the records to encode in the requested order"""
+    if isinstance(records, dict):
+        if ids is None:
+            ids = list(records.keys())
+        return [records[x] for x in ids], list(ids)
+    records = list(records)
+    if ids is None:
+        return records, [rec.id for rec in records]
+    rec_dict = dict((rec.id, rec) for rec in records)
+    return [rec_dict[x] for x in ids], list(ids)
+
+
+def as_byte_matrix(records, ids=None):
+    """Return a (nseq, length) uint8 matrix and the list of ids from an
+    alignment (list/dict of SeqRecord or MultipleSeqAlignment)"""
+    records, ids = _records_and_ids(records, ids)
+    seqs = [str(rec.seq).encode('ascii') for rec in records]
+    if not seqs:
+        return np.zeros((0, 0), dtype=np.uint8), ids
+    length = len(seqs[0])
+    if any(len(s) != length for s in seqs):
+        raise ValueError("Sequences should have the same length")
+    mat = np.frombuffer(b"".join(seqs), dtype=np.uint8)
+    return mat.reshape(len(seqs), length), ids
+
+
+def as_byte_rows(records):
+    """Return a list of uint8 arrays, one for each sequence (no length check)"""
+    return [np.frombuffer(str(rec.seq).encode('ascii'), dtype=np.uint8) for rec in records]
+
+
+def codon_index_matrix(records, ids=None, gap_char='-'):
+    """Return a (nseq, ncodon) matrix of codon index (see CODONS) from a codon
+    alignment. Gap codons are set to GAP_CODON and any codon with an undefined
+    nucleotide to UNDEF_CODON"""
+    mat, ids = as_byte_matrix(records, ids)
+    nseq = mat.shape[0]
+    if mat.shape[1] % 3 != 0:
+        raise ValueError("Sequence length is not divisible by 3")
+    triplets = mat.reshape(nseq, -1, 3)
+    nuc = _NUC_CODE[triplets]
+    index = nuc[:, :, 0] * 16 + nuc[:, :, 1] * 4 + nuc[:, :, 2]
+    index[~np.all(nuc >= 0, axis=2)] = UNDEF_CODON
+    index[np.all(triplets == ord(gap_char), axis=2)] = GAP_CODON
+    return index, ids
@@ -0,0 +1,328 @@
+import json
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+import scipy.stats as ss
+
+from coretracker.FisherExact import binom_test, fisher_exact
+
+
+def rank_rows(values, mask=None):
+    """Rank each row of a 2D array independently (average rank for ties).
+    Only values where mask is True are ranked, the others get a rank of 0.
+    Return the rank matrix and the tie term sum(t**3 - t) of each row"""
+    values = np.asarray(values, dtype=np.float64)
+    if mask is None:
+        mask = np.ones(values.shape, dtype=bool)
+    nrow, ncol = values.shape
+    if ncol == 0:
+        return np.zeros(values.shape), np.zeros(nrow)
+    # masked values are sent to the end of each row
+    filled = np.where(mask, values, np.inf)
+    order = np.argsort(filled, axis=1, kind='mergesort')
+    svals = np.take_along_axis(filled, order, axis=1)
+    svalid = np.take_along_axis(mask, order, axis=1)
+    newgroup = np.ones(values.shape, dtype=bool)
+    newgroup[:, 1:] = (svals[:, 1:] != svals[:, :-1]) | (
+        svalid[:, 1:] != svalid[:, :-1])
+    # one group id per (row, tie group)
+    group = np.cumsum(newgroup.ravel()) - 1
+    ngroup = group[-1] + 1
+    position = np.tile(np.arange(1, ncol + 1, dtype=np.float64), nrow)
+    gsize = np.bincount(group, minlength=ngroup).astype(np.float64)
+    granks = np.bincount(group, weights=position, minlength=ngroup) / gsize
+    sranks = granks[group].reshape(nrow, ncol)
+    ranks = np.zeros(values.shape)
+    np.put_along_axis(ranks, order, np.where(svalid, sranks, 0), axis=1)
+    # tie term, computed once per group
+    gvalid = svalid.ravel()[newgroup.ravel()]
+    grow = np.repeat(np.arange(nrow), ncol)[newgroup.ravel()]
+    tsize = gsize[gvalid]
+    ties = np.bincount(grow[gvalid], weights=tsize**3 - tsize, minlength=nrow)
+    return ranks, ties
+
+
+def _flatten(x, y):
+    """Broadcast x and y and flatten all but the last axis"""
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                               np.asarray(y, dtype=np.float64))
+    return x.reshape(-1, x.shape[-1]), y.reshape(-1, y.shape[-1]), x.shape[:-1]
+
+
+def batched_wilcoxon(x, y, correction=True):
+    """Wilcoxon signed-rank test on the last axis of x and y.
+    Zero differences are discarded (zero_method='wilcox'), and the normal
+    approximation with tie correction is used, as in scipy.stats.wilcoxon.
+    Return the statistic and two-sided pvalue arrays"""
+    x, y, shape = _flatten(x, y)
+    d = x - y
+    nonzero = d != 0
+    count = nonzero.sum(axis=1).astype(np.float64)
+    ranks, ties = rank_rows(np.abs(d), nonzero)
+    r_plus = np.sum(ranks * (d > 0), axis=1)
+    r_minus = np.sum(ranks * (d < 0), axis=1)
+    T = np.minimum(r_plus, r_minus)
+    mn = count * (count + 1.) * 0.25
+    se = count * (count + 1.) * (2. * count + 1.) - 0.5 * ties
+    with np.errstate(divide='ignore', invalid='ignore'):
+        se = np.sqrt(se / 24)
+        z = T - mn
+        if correction:
+            z -= 0.5 * np.sign(T - mn)
+        z /= se
+        pval = 2. * ss.norm.sf(np.abs(z))
+    return T.reshape(shape), pval.reshape(shape)
+
+
+def batched_ttest_rel(x, y):
+    """Paired t-test on the last axis of x and y.
+    Return the statistic and two-sided pvalue arrays"""
+    x, y, shape = _flatten(x, y)
+    d = x - y
+    n = d.shape[1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.mean(d, axis=1) / np.sqrt(np.var(d, axis=1, ddof=1) / n)
+        pval = 2. * ss.t.sf(np.abs(t), n - 1)
+    return t.reshape(shape), pval.reshape(shape)
+
+
+def batched_mannwhitneyu(x, y, use_continuity=True):
+    """Mann-Whitney U test between the last axis of x and y.
+    As the old scipy.stats.mannwhitneyu default, the pvalue is one-sided and
+    the statistic is the smallest U. Rows where all values are identical get
+    a nan pvalue"""
+    x, y, shape = _flatten(x, y)
+    n1, n2 = x.shape[1], y.shape[1]
+    ranks, ties = rank_rows(np.concatenate([x, y], axis=1))
+    n = float(n1 + n2)
+    u1 = n1 * n2 + n1 * (n1 + 1) / 2. - np.sum(ranks[:, :n1], axis=1)
+    u2 = n1 * n2 - u1
+    tiecorr = 1. - ties / (n**3 - n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sd = np.sqrt(tiecorr * n1 * n2 * (n + 1) / 12.0)
+        sd[tiecorr == 0] = np.nan
+        meanrank = n1 * n2 / 2.0 + 0.5 * use_continuity
+        z = (np.maximum(u1, u2) - meanrank) / sd
+        pval = ss.norm.sf(np.abs(z))
+    return np.minimum(u1, u2).reshape(shape), pval.reshape(shape)
+
+
+def batched_paired_test(x, y, test='wilcoxon'):
+    """Run the same paired test ('wilcoxon', 'ttest' or 'mannwhitney') on
+    every row (last axis) of x and y"""
+    if test == 'wilcoxon':
+        return batched_wilcoxon(x, y, correction=True)
+    elif test == 'ttest':
+        return batched_ttest_rel(x, y)
+    return batched_mannwhitneyu(x, y, use_continuity=True)
+
+
+def _assign_clusters(data, centers):
+    """Return the index of the closest center of each point, data and
+    centers having shape (B, N, D) and (B, k, D)"""
+    d2 = np.sum((data[:, :, None, :] - centers[:, None, :, :])**2, axis=-1)
+    return np.argmin(d2, axis=2)
+
+
+def _kmeans_init(data, k, rs):
+    """k-means++ initialization of each dataset of a (B, N, D) batch"""
+    nbatch, npoints, _ = data.shape
+    rows = np.arange(nbatch)
+    centers = np.empty((nbatch, k, data.shape[2]))
+    centers[:, 0] = data[rows, rs.randint(npoints, size=nbatch)]
+    d2 = np.sum((data - centers[:, :1])**2, axis=-1)
+    for c in range(1, k):
+        # pick the next center with probability proportional to d2,
+        # uniformly if all the points are on the chosen centers
+        cum = np.cumsum(d2 + (d2.sum(axis=1, keepdims=True) == 0), axis=1)
+        target = rs.random_sample(nbatch) * cum[:, -1]
+        chosen = np.minimum(np.sum(cum <= target[:, None], axis=1), npoints - 1)
+        centers[:, c] = data[rows, chosen]
+        d2 = np.minimum(d2, np.sum((data - centers[:, c:c + 1])**2, axis=-1))
+    return centers
+
+
+def batched_kmeans(data, k=2, maxiter=100, tol=1e-4, seed=None, batch_size=None):
+    """Run k-means on every dataset of a (B, N, D) array at once.
+    Centers are initialized with k-means++ from a RandomState(seed), so
+    the result is deterministic for a given seed. If batch_size is smaller
+    than N, mini-batch k-means is used: centers are updated from batch_size
+    random points at each iteration. Iterations stop when no center moved
+    more than tol. Return the centers (B, k, D) and the labels (B, N)"""
+    data = np.asarray(data, dtype=np.float64)
+    rs = np.random.RandomState(seed)
+    nbatch, npoints, _ = data.shape
+    centers = _kmeans_init(data, k, rs)
+    minibatch = batch_size is not None and 0 < batch_size < npoints
+    seen = np.zeros((nbatch, k))
+    active = np.ones(nbatch, dtype=bool)
+    for _ in range(maxiter):
+        sample = data[:, rs.randint(npoints, size=batch_size)] if minibatch else data
+        members = _assign_clusters(sample, centers)[..., None] == np.arange(k)
+        size = members.sum(axis=1)
+        means = np.einsum('bnk,bnd->bkd', members, sample) / \
+            np.maximum(size, 1)[..., None]
+        if minibatch:
+            # per center learning rate (1 / number of points seen)
+            seen += size
+            rate = size / np.maximum(seen, 1)
+        else:
+            rate = (size > 0).astype(np.float64)
+        new = centers + rate[..., None] * (means - centers)
+        shift = np.sqrt(np.max(np.sum((new - centers)**2, axis=-1), axis=1))
+        centers[active] = new[active]
+        active &= shift > tol
+        if not active.any():
+            break
+    return centers, _assign_clusters(data, centers)
+
+
+class ContingencyTester(object):
+    """Contingency table tests with a bounded LRU cache of pvalues.
+    Tables are canonicalized by sorting their rows, since the pvalue of the
+    tests used does not depend on row order. r x 2 tables (r > 1) use the
+    mid-P Fisher exact test (the hybrid approximation of fexact for the
+    tables too large to be enumerated), with a fallback on chi2 if it fails (or
+    directly if the table total is larger than exact_max_total), and single
+    count tests use a binomial test. The cache can be saved and reloaded
+    between runs. A tester can be shared by several threads, and the
+    pvalues computed by a copy in another process can be merged back with
+    `collect` and `merge`"""
+
+    def __init__(self, maxsize=100000, cachefile=None, exact_max_total=None, attempt=3):
+        self.maxsize = maxsize
+        self.cachefile = cachefile
+        self.exact_max_total = exact_max_total
+        self.attempt = attempt
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.method_count = Counter()
+        # pvalues computed since the last collect, only kept once
+        # collect has been called
+        self.new_entries = None
+        self._lock = threading.Lock()
+        if cachefile and os.path.exists(cachefile):
+            self.load(cachefile)
+
+    @classmethod
+    def canonical(clc, table):
+        """Return a hashable representation of a table, with sorted rows"""
+        table = np.asarray(table)
+        if table.ndim == 1:
+            table = table[:, None]
+        return tuple(sorted(tuple(int(x) for x in row) for row in table))
+
+    def _get(self, key):
+        with self._lock:
+            pval = self.cache.get(key)
+            if pval is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return pval
+
+    def _set(self, key, pval, new=True):
+        with self._lock:
+            if new and self.new_entries is not None:
+                self.new_entries[key] = pval
+            self.cache[key] = pval
+            self.cache.move_to_end(key)
+            while self.maxsize and len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+
+    def _count(self, method):
+        with self._lock:
+            self.method_count[method] += 1
+
+    def _compute(self, table):
+        """Choose and run a test for a canonical table"""
+        obs = np.asarray(table, dtype=np.float64)
+        if self.exact_max_total is None or obs.sum() <= self.exact_max_total:
+            try:
+                pval = fisher_exact(obs, midP=True, hybrid=True,
+                                    attempt=self.attempt)
+                self._count('midP')
+                return pval
+            except Exception:
+                logging.debug(
+                    "**warning: %s using chi2 instead of FISHEREXACT" % str(table))
+        self._count('chi2')
+        return ss.chi2_contingency(obs)[1]
+
+    def test(self, table):
+        """Return the pvalue of the independance test of a r x 2 table"""
+        key = ('table', self.canonical(table))
+        pval = self._get(key)
+        if pval is None:
+            pval = float(self._compute(key[1]))
+            self._set(key, pval)
+        return pval
+
+    def binomial(self, obs, n, prob):
+        """Return the pvalue of a two-sided binomial test"""
+        key = ('binom', int(obs), int(n), float(prob))
+        pval = self._get(key)
+        if pval is None:
+            self._count('binom')
+            pval = float(binom_test(obs, n, prob))
+            self._set(key, pval)
+        return pval
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits * 1.0 / total if total else 0.0
+
+    def stats(self):
+        """Return the cache counters as a dict"""
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate,
+                'size': len(self.cache), 'methods': dict(self.method_count)}
+
+    def collect(self):
+        """Return the pvalues computed and the counters since the last call,
+        and reset them. The pvalues are only recorded after a first call"""
+        with self._lock:
+            collected = {'entries': self.new_entries or {}, 'hits': self.hits,
+                         'misses': self.misses, 'methods': self.method_count}
+            self.new_entries = {}
+            self.hits = self.misses = 0
+            self.method_count = Counter()
+        return collected
+
+    def merge(self, collected):
+        """Add the pvalues and counters returned by `collect` on another
+        tester"""
+        for key, pval in collected['entries'].items():
+            self._set(key, pval)
+        with self._lock:
+            self.hits += collected['hits']
+            self.misses += collected['misses']
+            self.method_count.update(collected['methods'])
+
+    def save(self, cachefile=None):
+        """Save the cached pvalues in a json file"""
+        cachefile = cachefile or self.cachefile
+        if cachefile:
+            with self._lock:
+                entries = [[key[0], key[1:], pval]
+                           for key, pval in self.cache.items()]
+            with open(cachefile, 'w') as OUT:
+                json.dump(entries, OUT)
+
+    def load(self, cachefile):
+        """Load pvalues saved with `save`"""
+        try:
+            with open(cachefile) as IN:
+                entries = json.load(IN)
+        except (IOError, ValueError) as e:
+            logging.warning("Could not load pvalue cache %s : %s" % (cachefile, e))
+            return
+        for kind, key, pval in entries:
+            if kind == 'table':
+                key = (tuple(tuple(row) for row in key[0]),)
+            self._set((kind,) + tuple(key), pval, new=False)
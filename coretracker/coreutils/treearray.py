@@ -0,0 +1,142 @@
+import numpy as np
+from ete3 import Tree
+
+
+class ArrayTree(object):
+    """Compact, array-backed copy of an ete3 tree.
+    Nodes are numbered in postorder : every child comes before its parent
+    and the descendants of node i are exactly the nodes first[i] to i"""
+
+    def __init__(self, tree):
+        nodes = list(tree.traverse("postorder"))
+        index = dict((id(node), i) for i, node in enumerate(nodes))
+        self.size = len(nodes)
+        self.root = self.size - 1
+        self.names = [node.name for node in nodes]
+        self.dist = np.array([node.dist for node in nodes], dtype=float)
+        self.support = np.array([node.support for node in nodes], dtype=float)
+
+        self.parent = np.full(self.size, -1, dtype=np.intp)
+        self.first = np.arange(self.size, dtype=np.intp)
+        nchild = np.zeros(self.size, dtype=np.intp)
+        children = []
+        for i, node in enumerate(nodes):
+            ch = [index[id(c)] for c in node.children]
+            nchild[i] = len(ch)
+            if ch:
+                self.parent[ch] = i
+                self.first[i] = min(self.first[c] for c in ch)
+            children.extend(ch)
+        # children of node i are child_idx[child_ptr[i]:child_ptr[i+1]]
+        self.child_ptr = np.concatenate([[0], np.cumsum(nchild)])
+        self.child_idx = np.array(children, dtype=np.intp)
+        self.is_leaf = nchild == 0
+        self.internal = np.flatnonzero(~self.is_leaf)
+        self.leaves = np.flatnonzero(self.is_leaf)
+        self.leaf_index = dict((self.names[i], i) for i in self.leaves)
+        self.postorder = np.arange(self.size, dtype=np.intp)
+        self.preorder = np.array([index[id(node)] for node in tree.traverse("preorder")],
+                                 dtype=np.intp)
+        self.depth = np.zeros(self.size, dtype=np.intp)
+        for i in self.preorder[1:]:
+            self.depth[i] = self.depth[self.parent[i]] + 1
+        # non root nodes grouped by depth, for top down passes
+        self.depth_levels = [np.flatnonzero(self.depth == d)
+                             for d in range(1, self.depth.max() + 1)]
+        # internal nodes grouped by height, so that a bottom up pass can
+        # process a whole level at once : (nodes, children, offsets)
+        self.height = np.zeros(self.size, dtype=np.intp)
+        for i in self.internal:
+            self.height[i] = self.height[self.children(i)].max() + 1
+        self.levels = []
+        for h in range(1, self.height[self.root] + 1):
+            level = self.internal[self.height[self.internal] == h]
+            nch = self.child_ptr[level + 1] - self.child_ptr[level]
+            children = np.concatenate([self.children(i) for i in level])
+            self.levels.append((level, children, np.concatenate([[0], np.cumsum(nch)[:-1]])))
+        # per-node feature arrays
+        self.features = {}
+
+    def __len__(self):
+        return len(self.leaves)
+
+    def __contains__(self, name):
+        return name in self.leaf_index
+
+    def children(self, i):
+        """Return the indexes of the children of node i"""
+        return self.child_idx[self.child_ptr[i]:self.child_ptr[i + 1]]
+
+    def subtree_leaves(self, i):
+        """Return the indexes of the leaves under node i"""
+        lo, hi = np.searchsorted(self.leaves, [self.first[i], i + 1])
+        return self.leaves[lo:hi]
+
+    def get_leaf_names(self, i=None):
+        """Return the leaf names under node i (the root by default)"""
+        if i is None:
+            i = self.root
+        return [self.names[x] for x in self.subtree_leaves(i)]
+
+    def subtree_sum(self, values):
+        """Sum values (one per node, or a (..., size) array) over the
+        subtree of every node"""
+        values = np.asarray(values)
+        csum = np.zeros(values.shape[:-1] + (self.size + 1,), dtype=np.result_type(values, np.int64))
+        np.cumsum(values, axis=-1, out=csum[..., 1:])
+        return csum[..., 1:] - csum[..., self.first]
+
+    def children_reduce(self, ufunc, values):
+        """Apply a ufunc reduction (np.add, np.bitwise_and, ...) over the
+        children of every internal node. values holds one value per node
+        on the last axis; the result is aligned with self.internal"""
+        values = np.asarray(values)
+        return ufunc.reduceat(values[..., self.child_idx],
+                              self.child_ptr[self.internal], axis=-1)
+
+    def bottom_up(self, values, merge):
+        """Fill the internal nodes of values (one value per node on the last
+        axis) level by level, from the leaves to the root.
+        merge(children_values, offsets) should return the value of each node
+        of the level, its children values being grouped by offsets on the
+        last axis as for ufunc.reduceat"""
+        for level, children, offsets in self.levels:
+            values[..., level] = merge(values[..., children], offsets)
+        return values
+
+    def top_down(self, values, update):
+        """Fill the non root nodes of values level by level, from the root
+        to the leaves. update(nodes, parent_values) should return the value
+        of the nodes"""
+        for level in self.depth_levels:
+            values[..., level] = update(level, values[..., self.parent[level]])
+        return values
+
+    def path_to_root(self, i):
+        """Yield node i and all its ancestors"""
+        while i >= 0:
+            yield i
+            i = self.parent[i]
+
+    def set_feature(self, name, values):
+        """Set a per-node feature array"""
+        values = np.asarray(values)
+        if values.shape[-1] != self.size:
+            raise ValueError("Feature %s should have a value per node" % name)
+        self.features[name] = values
+
+    def to_ete(self, features=None):
+        """Build an ete3 tree. features maps a feature name to a sequence of
+        per-node values, nodes with a None value do not get the feature"""
+        features = dict(self.features, **(features or {}))
+        nodes = [None] * self.size
+        for i in self.preorder:
+            node = Tree(name=self.names[i], dist=float(self.dist[i]),
+                        support=float(self.support[i]))
+            for fname, values in list(features.items()):
+                if values[i] is not None:
+                    node.add_feature(fname, values[i])
+            if self.parent[i] >= 0:
+                nodes[self.parent[i]].add_child(node)
+            nodes[i] = node
+        return nodes[self.root]
@@ -1,10 +1,12 @@
 
 
 import argparse
+import copy
 import glob
 import itertools
 import json
 import logging
+import multiprocessing
 import os
 import random
 import re
@@ -14,6 +16,7 @@ import sys
 import time
 import traceback
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from distutils import spawn
 from functools import partial
@@ -35,15 +38,21 @@ from Bio.Phylo.TreeConstruction import DistanceCalculator
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord, _RestrictedDict
 from ete3 import Tree
-from scipy.cluster.vq import kmeans2
 
-from .AncestralRecon import SingleNaiveRec, init_back_table
+from .AncestralRecon import BitsetRec, SingleNaiveRec, init_back_table
+from .codonusage import CodonUsage
 from .corefile import CoreFile
-from coretracker.FisherExact import fisher_exact
+from coretracker.FisherExact import binom_test
 from .Faces import LineFace, List90Face, PPieChartFace, SequenceFace
 from .letterconfig import *
 from .output import Output
 from .pdfutils import *
+from .render import Renderer
+from .resultsink import ResultSink
+from .scheduler import PairCostModel
+from .seqarray import CODON_INDEX, CODONS, as_byte_matrix, as_byte_rows, codon_index_matrix
+from .stats import ContingencyTester, batched_kmeans, batched_paired_test
+from .treearray import ArrayTree
 
 SEABORN = False
 try:
@@ -68,6 +77,8 @@ glob_purge = []
 hmmidpattern = re.compile("^\d+\|\w+")
 # define lowest pvalue
 eps = np.finfo(np.float).eps
+# shared cache of contingency test pvalues
+DEFAULT_TESTER = ContingencyTester()
 
 alpha = Alphabet.Gapped(IUPAC.protein)
 
@@ -412,18 +423,13 @@ class SequenceLoader:
         elif stop_checked:
             stop_removed = False
             core_dict = {}
-            gene_pos = list(stopmapping.values())[0]
-            start = 0
-            for i in range(len(gene_pos)):
+            segments = stop_segments(stopmapping)
+            for i in range(len(list(segments.values())[0])):
                 seq_rec_list = []
                 for seqrec in seqlist:
-                    s_rec = SeqRecord(seqrec.seq[start:stopmapping[seqrec.id][i]],
-                                      id=seqrec.id, name=seqrec.name,
-                                      description=seqrec.description,
-                                      features=seqrec.features[:],
-                                      annotations=seqrec.annotations.copy())
-                    seq_rec_list.append(s_rec)
-                start = stopmapping[seqrec.id][i] + 1
+                    start, end = segments[seqrec.id][i]
+                    seq_rec_list.append(SeqRecord(seqrec.seq[start:end], id=seqrec.id,
+                                                  name=seqrec.name, description=seqrec.description))
                 core_dict[str(i)] = seq_rec_list
 
             return core_dict, stop_removed
@@ -505,135 +511,209 @@ class CodonSeq(CodonSeq):
         return ('N' in codon.upper()) and self.enable_undef
 
 
+class CodonEvidence(object):
+    """Codon usage of an alignment, shared by all the CodonReaData.
+    For each species, it keeps the count of each codon at the positions of
+    each consensus amino acid (the observed amino acid being the codon
+    translation), the genes where each (consensus aa, codon) pair is found
+    and the amino acids mapped to each codon (see CodonReaData.get_score)"""
+
+    def __init__(self, alignment, consensus, codon_align_dict, dct, positions, genelimit, settings):
+        if not isinstance(codon_align_dict, dict):
+            codon_align_dict = SeqIO.to_dict(codon_align_dict)
+        consensus = str(consensus)
+        ncons = len(consensus)
+        self.species = list(codon_align_dict.keys())
+        self.spec_index = dict((x, i) for i, x in enumerate(self.species))
+        self.codon_aa = [dct.forward_table.get(c, None) for c in CODONS]
+        self.aa_codons = defaultdict(list)
+        for i, aa in enumerate(self.codon_aa):
+            if aa:
+                self.aa_codons[aa].append(i)
+        self.cons_letters = dict((x, i) for i, x in enumerate(sorted(set(consensus))))
+        cons = np.asarray([self.cons_letters[x] for x in consensus], dtype=np.int64)
+
+        # gene of each position (len(genelimit) if outside of all genes)
+        self.genes = [x[0] for x in genelimit]
+        ngene = max(len(self.genes), 1)
+        ends = np.maximum.accumulate([x[2] for x in genelimit]) if genelimit else np.zeros(0)
+        gene = np.searchsorted(ends, np.asarray(positions)[:ncons], side='left')
+
+        codons, _ = codon_index_matrix(codon_align_dict, self.species)
+        codons = codons[:, :ncons]
+        valid = (codons >= 0) & np.asarray(
+            [aa is not None for aa in self.codon_aa])[np.maximum(codons, 0)]
+
+        # amino acids mapped to the codons : the consensus or the alignment columns
+        self.cons_for_lik = settings.USE_CONSENSUS_FOR_LIKELIHOOD
+        if not self.cons_for_lik:
+            aligned, _ = as_byte_matrix(alignment)
+            self.map_letters = [chr(x) for x in np.unique(aligned)]
+            column_counts = np.stack([np.sum(aligned[:, :ncons] == ord(x), axis=0)
+                                      for x in self.map_letters], axis=1)
+            self.codon_map = np.zeros((len(self.species), len(CODONS), len(self.map_letters)),
+                                      dtype=np.int64)
+        self._scores = {}
+
+        nlet = len(self.cons_letters)
+        self.counts = np.zeros((len(self.species), nlet, len(CODONS)), dtype=np.int64)
+        self.gene_keys = []
+        for i in range(len(self.species)):
+            pos = np.flatnonzero(valid[i])
+            key = cons[pos] * len(CODONS) + codons[i, pos]
+            self.counts[i] = np.bincount(key, minlength=self.counts[i].size).reshape(
+                nlet, len(CODONS))
+            ingene = gene[pos] < len(self.genes)
+            self.gene_keys.append(np.unique(key[ingene] * ngene + gene[pos][ingene]))
+            if not self.cons_for_lik:
+                np.add.at(self.codon_map[i], codons[i, pos], column_counts[pos])
+        self.ngene = ngene
+        if self.cons_for_lik:
+            # (species, codon, consensus aa) co-occurrence
+            self.map_letters = sorted(self.cons_letters, key=self.cons_letters.get)
+            self.codon_map = self.counts.transpose(0, 2, 1)
+
+    def _as_counter(self, counts, codon_list):
+        return Counter(dict((CODONS[c], int(counts[c])) for c in codon_list if counts[c] > 0))
+
+    def codon_counts(self, spec, aa, cons=None, exclude=()):
+        """Return a Counter of the codons of aa used by spec at the positions
+        where the consensus is cons (all positions if cons is None, except
+        the ones where the consensus is in exclude)"""
+        ispec = self.spec_index.get(spec)
+        if ispec is None or aa not in self.aa_codons:
+            return Counter()
+        if cons is not None:
+            if cons not in self.cons_letters:
+                return Counter()
+            counts = self.counts[ispec, self.cons_letters[cons]]
+        else:
+            counts = self.counts[ispec].sum(axis=0)
+            for x in set(exclude):
+                if x in self.cons_letters:
+                    counts = counts - self.counts[ispec, self.cons_letters[x]]
+        return self._as_counter(counts, self.aa_codons[aa])
+
+    def codon_genes(self, spec, aa, cons=None):
+        """Return a dict with the list of genes where spec uses each codon of aa
+        at the positions where the consensus is cons (any position if None)"""
+        ispec = self.spec_index.get(spec)
+        if ispec is None or aa not in self.aa_codons:
+            return {}
+        keys = self.gene_keys[ispec]
+        gene = keys % self.ngene
+        codon = (keys // self.ngene) % len(CODONS)
+        mask = np.isin(codon, self.aa_codons[aa])
+        if cons is not None:
+            mask &= (keys // (self.ngene * len(CODONS))) == self.cons_letters.get(cons, -1)
+        genes = defaultdict(list)
+        for c, g in zip(codon[mask], gene[mask]):
+            if self.genes[g] not in genes[CODONS[c]]:
+                genes[CODONS[c]].append(self.genes[g])
+        return dict(genes)
+
+    def amino_map(self, spec, codon):
+        """Return a Counter of the amino acids mapped to a codon in spec"""
+        ispec = self.spec_index.get(spec)
+        if ispec is None or codon not in CODON_INDEX:
+            return Counter()
+        counts = self.codon_map[ispec, CODON_INDEX[codon]]
+        return Counter(dict((x, int(n)) for x, n in zip(self.map_letters, counts) if n > 0))
+
+    def telford_scores(self, submat):
+        """Return the Telford score of every (species, codon, target aa):
+        the mean substitution cost between the target aa and the amino acids
+        mapped to the codon (gaps excluded), inf if there are none. Also
+        return the index of the target aa on the last axis"""
+        if id(submat) not in self._scores:
+            matrix, letters = submat_array(submat)
+            used = [i for i, x in enumerate(self.map_letters) if x != '-']
+            unknown = [self.map_letters[i] for i in used if self.map_letters[i] not in letters
+                       and self.codon_map[..., i].any()]
+            if unknown:
+                raise KeyError("No substitution cost for %s" % ", ".join(unknown))
+            used = [i for i in used if self.map_letters[i] in letters]
+            counts = self.codon_map[..., used].astype(np.float64)
+            cost = matrix[[letters[self.map_letters[i]] for i in used]]
+            total = counts.sum(axis=-1, keepdims=True)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = np.where(total > 0, np.matmul(counts, cost) / total, np.inf)
+            self._scores[id(submat)] = (scores, letters)
+        return self._scores[id(submat)]
+
+
 class CodonReaData(object):
-    """A representation of a reassignment in a species"""
+    """A representation of a reassignment in a species.
+    This is a view of a CodonEvidence restricted to aa1 and the aa2 list,
+    the evidence is computed if it is not provided"""
 
-    def __init__(self, aas, alignment, consensus, codon_align_dict, dct, positions, genelimit, settings):
+    def __init__(self, aas, alignment, consensus, codon_align_dict, dct, positions, genelimit, settings, evidence=None):
 
         # change aa2 is a list now
         self.aa1, aareas = aas
         self.aa2_list = list(aareas.keys())
-        self.codon_alignment = codon_align_dict
         self.dct = dct
         self.back_table = init_back_table(dct)
-
-        self.alignment = alignment
-        if not isinstance(self.codon_alignment, dict):
-            self.codon_alignment = SeqIO.to_dict(self.codon_alignment)
-        self.consensus = consensus
-        # self.rea_codons = defaultdict(partial(defaultdict, Counter))
-        self.reacodons = makehash(1, Counter)
-        self.usedcodons = makehash(1, Counter)
-        self.mixtecodon = makehash(1, Counter)
-        # find codon usage in the sequence
         self.settings = settings
         self.subsmat = settings.SUBMAT
-        self.cons_for_lik = settings.USE_CONSENSUS_FOR_LIKELIHOOD
-
-        self.specs_amino_count = makehash(1, Counter)  # this one is ok
-        self.positions = positions
-        self.genelimit = genelimit
-        self.t_genelimit = len(genelimit)
-        self.codons_distribution = makehash(2, set)
-        self.total_codons_distribution = makehash(2, set)
-        self.codon_map_in_genome = makehash(1, Counter)
-
-        self._spec_codon_usage()
-
-    def _spec_codon_usage(self):
-        """Check codon usage in each species"""
-        for i, aa in enumerate(self.consensus):
-            for spec in list(self.codon_alignment.keys()):
-                spec_codon = self.codon_alignment[spec].seq.get_codon(i)
-                spec_aa = self.dct.forward_table.get(spec_codon, None)
-                cur_pos = self.positions[i]
-                if(spec_aa):
-                    self.specs_amino_count[spec][spec_aa].update([spec_codon])
-                    aa_set_list = aa
-                    if not self.cons_for_lik:
-                        aa_set_list = self.alignment[:, i]
-                    self.codon_map_in_genome[spec][
-                        spec_codon].update(aa_set_list)
-
-                    # only check amino acid that are suspected
-                    if spec_aa in self.aa2_list:
-                        lim_start = 0
-                        while lim_start < self.t_genelimit and cur_pos > self.genelimit[lim_start][2]:
-                            lim_start += 1
-
-                        if lim_start < self.t_genelimit:
-                            self.total_codons_distribution[spec][spec_aa][
-                                spec_codon].add(self.genelimit[lim_start][0])
-                        # potential reassignment counter
-                        # species use aa2 while aa1 is prevalent
-                        if aa == self.aa1:
-                            self.reacodons[spec][spec_aa].update([spec_codon])
-                            if lim_start < self.t_genelimit:
-                                self.codons_distribution[spec][spec_aa][
-                                    spec_codon].add(self.genelimit[lim_start][0])
-
-                        # species use aa2 with aa2 being the prevalent aa
-                        elif aa == spec_aa:
-                            self.usedcodons[spec][spec_aa].update([spec_codon])
-
-                        # other position where aa2 is used in species
-                        # this mean, species use aa2, while we don't care about
-                        # the major aa
-                        else:
-                            self.mixtecodon[spec][spec_aa].update([spec_codon])
+        if evidence is None:
+            evidence = CodonEvidence(alignment, consensus, codon_align_dict,
+                                     dct, positions, genelimit, settings)
+        self.evidence = evidence
 
     def get_score(self, spec, aa_ori, aa_rea):
         """Get Telford score for each codon"""
-        codon_score = {}
-        for codon in self.back_table[aa_ori]:
-            amino_counters = self.codon_map_in_genome[spec][codon]
-            total = 0.0
-            numerator = 0
-            for k, v in list(amino_counters.items()):
-                if k != '-':
-                    total += v
-                    try:
-                        cost = self.subsmat[(aa_rea, k)]
-                    except:
-                        cost = self.subsmat[(k, aa_rea)]
-                    numerator += cost * v
-
-            if total > 0:
-                codon_score[codon] = numerator / total
-            else:
-                codon_score[codon] = np.inf
-        return codon_score
+        scores, letters = self.evidence.telford_scores(self.subsmat)
+        ispec = self.evidence.spec_index.get(spec)
+        if ispec is None:
+            return dict((codon, np.inf) for codon in self.back_table[aa_ori])
+        scores = scores[ispec, :, letters[aa_rea]]
+        return dict((codon, float(scores[CODON_INDEX[codon]])) for codon in self.back_table[aa_ori])
 
     def __getitem__(self, key):
         return self.get_reacodons(key)
 
     def get_reacodons(self, specie, aa):
         """Get the list of rea codons"""
-        return self.reacodons[specie][aa]
+        # species use aa2 while aa1 is prevalent
+        if aa not in self.aa2_list:
+            return Counter()
+        return self.evidence.codon_counts(specie, aa, cons=self.aa1)
 
     def get_mixtecodons(self, specie, aa):
         """Get the list of mixte codons"""
-        return self.mixtecodon[specie][aa]
+        # other position where aa2 is used in species
+        if aa not in self.aa2_list:
+            return Counter()
+        return self.evidence.codon_counts(specie, aa, exclude=(self.aa1, aa))
 
     def get_usedcodons(self, specie, aa):
         """Get the list of normally used codons"""
-        return self.usedcodons[specie][aa]
+        # species use aa2 with aa2 being the prevalent aa
+        if aa not in self.aa2_list or aa == self.aa1:
+            return Counter()
+        return self.evidence.codon_counts(specie, aa, cons=aa)
 
     def get_aa_usage(self, specie, aa):
         """Get aa usage in a specific genome"""
-        return self.specs_amino_count[specie][aa]
+        return self.evidence.codon_counts(specie, aa)
 
     def get_all_aas_usage(self, specie):
         """Get all aa usage in a specific genome"""
-        return self.specs_amino_count[specie]
+        usage = dict((aa, self.get_aa_usage(specie, aa)) for aa in self.evidence.aa_codons)
+        return dict((aa, c) for aa, c in usage.items() if c)
 
     def get_rea_aa_codon_distribution(self, specie, aa):
         """Get codon distribution in potentially reassigned positions"""
-        return dict((k, list(v)) for k, v in list(self.codons_distribution[specie][aa].items()))
+        if aa not in self.aa2_list:
+            return {}
+        return self.evidence.codon_genes(specie, aa, cons=self.aa1)
 
     def get_total_rea_aa_codon_distribution(self, specie, aa):
         """Get total codon distribution"""
-        return dict((k, list(v)) for k, v in list(self.total_codons_distribution[specie][aa].items()))
+        if aa not in self.aa2_list:
+            return {}
+        return self.evidence.codon_genes(specie, aa)
 
 
 class SequenceSet(object):
@@ -650,6 +730,7 @@ class SequenceSet(object):
         self.phylotree = phylotree
         self.common_genome = []
         self.core = None
+        self._codon_usage = None
         self.restrict_to_common()
         # self.compute_current_mat()
         self.codon_align()
@@ -738,6 +819,7 @@ class SequenceSet(object):
         alphabet = get_codon_alphabet(self.codontable, gap_char=gap_char)
         if self.common_genome is None:
             self.restrict_to_common()
+        self._codon_usage = None
         # build codon alignment and return it
         codon_aln = []
         all_undef_codon = {}
@@ -830,6 +912,26 @@ class SequenceSet(object):
         self.fcodon_alignment = next(r)
         return self.codon_alignment, self.fcodon_alignment
 
+    def for_genetic_code(self, table_num):
+        """Return a SequenceSet sharing the protein alignments and filtering
+        of this one, with the codon alignment rebuilt for another genetic code"""
+        if CodonTable.unambiguous_dna_by_id[abs(table_num)].id == self.codontable.id:
+            return self
+        seqset = copy.copy(self)
+        seqset.codontable = CodonTable.unambiguous_dna_by_id[abs(table_num)]
+        # codon_align replace entries of both dict
+        seqset.dna_dict = dict(self.dna_dict)
+        seqset.prot_dict = dict(self.prot_dict)
+        seqset.codon_align()
+        return seqset
+
+    def get_codon_usage(self):
+        """Get the codon usage table (species x codons) of the codon alignment.
+        The table is computed once and cached"""
+        if self._codon_usage is None:
+            self._codon_usage = CodonUsage.from_alignment(self.codon_alignment)
+        return self._codon_usage
+
     def prot_filtering(self, id_thresh=None, gap_thresh=None, ic_thresh=None, rmcnst=True):
         """Filter protein alignment"""
         current_alignment = self.prot_align
@@ -1036,6 +1138,44 @@ class ReaGenomeFinder:
         self.settings = settings
         self.interesting_case = []
         self.reassignment_mapper = makehash()
+        self.ctester = ContingencyTester(getattr(settings, 'STAT_CACHE_SIZE', 100000),
+                                         getattr(settings, 'STAT_CACHE_FILE', None))
+        # thread pool of the contingency tests, see run_independance_tests
+        self.stat_pool = None
+        # number of (aa1, aa2) evaluated, pruned before the evidence and kept
+        self.pair_stats = Counter()
+        # optional ResultSink where the evidence of each reassignment is
+        # written instead of being kept in reassignment_mapper
+        self.sink = None
+        # data shared by the (aa1, aa2) of the current analysis
+        self._analysis = None
+        # figures of the reports, rendered right away unless a Renderer
+        # with processes is set
+        self.renderer = Renderer(0, getattr(settings, 'RENDER', True))
+        # time taken by each (aa1, aa2), to dispatch the heaviest first
+        timefile = getattr(settings, 'PAIR_TIMINGS_FILE', None) or PairCostModel.default_timefile()
+        self.cost_model = PairCostModel(timefile)
+
+    def for_genetic_code(self, table_num, outdir=None):
+        """Return a ReaGenomeFinder using another reference genetic code.
+        Results that do not depend on the genetic code (distances, consensus,
+        suspected species and candidate reassignments) are shared with this
+        instance, only the codon alignment is rebuilt"""
+        settings = copy.copy(self.settings)
+        settings.GENETIC_CODE = table_num
+        if outdir:
+            if not os.path.exists(outdir):
+                os.makedirs(outdir)
+            settings.OUTDIR = outdir
+        reafinder = ReaGenomeFinder(
+            self.seqset.for_genetic_code(table_num), settings)
+        for attr in ('global_paired_distance', 'filtered_paired_distance', 'global_consensus',
+                     'filtered_consensus', 'seq_names', 'sim_json', 'aa_sim_json', 'aa_paired_distance',
+                     'aa_count_per_spec', 'total_aa_count', 'suspected_species', 'aa2aa_rea', 'ctester',
+                     'renderer'):
+            if hasattr(self, attr):
+                setattr(reafinder, attr, getattr(self, attr))
+        return reafinder
 
     def update_reas(self, codon, cible_aa, speclist, codon_align, codonpos, filt_pos, genelim):
         """Update the list of codons reassignment and position"""
@@ -1156,60 +1296,69 @@ class ReaGenomeFinder:
 
     def get_suspect_by_stat(self, aa2suspect_dist, seq_num, use_similarity=1, test='wilcoxon', confd=0.05):
         """Use a statistic test to find suspected species"""
-        for aa in list(aa2suspect_dist.keys()):
-            tmp_list = aa2suspect_dist[aa]
-            for seq, val in list(tmp_list.items()):
-                val = np.asarray(val)
-                rank, pval = self.get_paired_test(
-                    val[:, 0], val[:, 1], use_similarity, test)
-                if pval <= confd:
-                    self.suspected_species[aa][seq] = pval
+        aalist = list(aa2suspect_dist.keys())
+        if not aalist:
+            return
+        # (aa, species, paired species, (global, filtered)) array
+        # each species is compared to all the other species
+        dist = np.asarray([[aa2suspect_dist[aa][seq] for seq in self.seq_names]
+                           for aa in aalist], dtype=np.float64)
+        rank, pval = self.get_batched_paired_test(
+            dist[..., 0], dist[..., 1], use_similarity, test)
+        for i, j in zip(*np.nonzero(pval <= confd)):
+            self.suspected_species[aalist[i]][self.seq_names[j]] = pval[i, j]
 
     def get_suspect_by_clustering(self, aa2suspect_dist, number_seq, use_similarity=1):
         """Get list of suspected genome using clustering"""
-
-        def get_cluster(cluster_list):
-            """Perform kmean in order to find clusters"""
-            features = np.asarray(list(cluster_list.values()))
-            return kmeans2(features, 2, iter=100)
-
-        logging.debug('Clustering chosen, labels for each species :')
-        for aa in list(aa2suspect_dist.keys()):
-            aafilt2dict = self.seqset.aa_filt_prot_align[aa_letters_1to3[aa]]
-            tmp_list = aa2suspect_dist[aa]
-            cluster_list = {}
-            aa_set = set([])
-            for seq, val in list(tmp_list.items()):
-                val = np.mean(val, axis=0)
-                if (val[0] > val[1] and use_similarity) or (val[0] < val[1] and not use_similarity):
-                    aa_set.add(seq)
-                aa_freq = np.mean([x == aa for x in aafilt2dict[seq]])
-                cluster_list[seq] = np.append(val, aa_freq)
-
-            centroid, labels = get_cluster(cluster_list)
-            logging.debug("======> Amino acid %s :" % aa_letters_1to3[aa])
-            for index, elem in enumerate(cluster_list):
-                logging.debug("%s\t%s\t%d" %
-                              (elem, cluster_list[elem], labels[index]))
-
-            lab1 = set(np.asarray(list(cluster_list.keys()))[labels == 1])
-            lab2 = set(np.asarray(list(cluster_list.keys()))[labels == 0])
-            size1 = aa_set.intersection(lab1)
-            size2 = aa_set.intersection(lab2)
-            lab = lab1 if len(size1) > len(size2) else lab2
-            for specie in lab:
-                self.suspected_species[aa][specie] = 1
+        aalist = list(aa2suspect_dist.keys())
+        if not aalist or len(self.seq_names) < 2:
+            return
+        # (aa, species, paired species, (global, filtered)) array
+        dist = np.asarray([[aa2suspect_dist[aa][seq] for seq in self.seq_names]
+                           for aa in aalist], dtype=np.float64)
+        mdist = dist.mean(axis=2)
+        if use_similarity:
+            closer = mdist[..., 0] > mdist[..., 1]
+        else:
+            closer = mdist[..., 0] < mdist[..., 1]
+        # frequency of each aa in its filtered alignment
+        aa_freq = np.zeros(closer.shape)
+        for i, aa in enumerate(aalist):
+            counts = count_matrix(
+                self.seqset.aa_filt_prot_align[aa_letters_1to3[aa]], self.seq_names)
+            aa_freq[i] = counts[:, ord(aa)] / \
+                np.maximum(counts.sum(axis=1), 1).astype(np.float64)
+        # (aa, species, features) array, clustered for all aa at once
+        features = np.concatenate([mdist, aa_freq[..., None]], axis=2)
+        centroid, labels = batched_kmeans(features, 2, maxiter=self.settings.CLUSTER_MAXITER,
+                                          tol=self.settings.CLUSTER_TOL,
+                                          seed=self.settings.CLUSTER_SEED,
+                                          batch_size=self.settings.CLUSTER_BATCH_SIZE)
+
+        for i, aa in enumerate(aalist):
+            # the suspected cluster is the one with the most species
+            # closer to each other with this aa
+            size1 = np.sum(closer[i] & (labels[i] == 1))
+            size0 = np.sum(closer[i] & (labels[i] == 0))
+            lab = 1 if size1 > size0 else 0
+            suspected = np.flatnonzero(labels[i] == lab)
+            logging.debug("Clustering of %s : %d suspected species, centroids %s" %
+                          (aa_letters_1to3[aa], len(suspected), str(centroid[i].tolist())))
+            for j in suspected:
+                self.suspected_species[aa][self.seq_names[j]] = 1
 
     @classmethod
     def get_paired_test(clc, y1, y2, use_similarity, test="wilcoxon"):
         """Return a paired-test pvalue for the hypothesis u(y1)=u(y2)"""
-        if test == 'wilcoxon':
-            r, pval = ss.wilcoxon(y1, y2, correction=True)
-        elif test == 'ttest':
-            r, pval = ss.ttest_rel(y1, y2)
-        else:
-            r, pval = ss.mannwhitneyu(y1, y2, use_continuity=True)
+        r, pval = clc.get_batched_paired_test(
+            np.asarray(y1)[None], np.asarray(y2)[None], use_similarity, test)
+        return r[0], pval[0]
 
+    @classmethod
+    def get_batched_paired_test(clc, y1, y2, use_similarity, test="wilcoxon"):
+        """Return the paired-test pvalues for the hypothesis u(y1)=u(y2) on
+        the last axis of y1 and y2"""
+        r, pval = batched_paired_test(y1, y2, test)
         if use_similarity:
             return r, pval / 2.0
         else:
@@ -1226,9 +1375,11 @@ class ReaGenomeFinder:
         return self.aa_count_per_spec
 
     def get_prob_thresh(self, c1, c2, l, prob):
-        """Get virtual prob threshold. This is temp"""
-        logodd = np.log((c1 * c2) / (prob * (l**2)))
-        return np.exp(logodd) / (1 + np.exp(logodd))
+        """Get virtual prob threshold. This is temp.
+        Arguments can be numpy arrays"""
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            logodd = np.log((c1 * c2) / (prob * (l**2)))
+            return np.exp(logodd) / (1 + np.exp(logodd))
 
     def set_rea_mapper(self):
         """Set common values of reassignment_mapper for all reassignment"""
@@ -1243,38 +1394,49 @@ class ReaGenomeFinder:
         # TODO :  CHANGE THIS FUNCTION TO A MORE REALISTIC ONE
         aa_count_spec = self.get_aa_count_in_alignment()
         aa_count_cons = Counter(self.filtered_consensus)
+        species = list(self.seqset.common_genome)
+        # letter count matrices (species x letters) of the filtered alignment,
+        # of each amino acid filtered alignment and of the consensus
+        filt_counts = count_matrix(
+            SeqIO.to_dict(self.seqset.filt_prot_align), species)
+        aa_counts = dict((aa, count_matrix(self.seqset.aa_filt_prot_align[aa_letters_1to3[aa]], species))
+                         for aa in self.suspected_species)
+        cons_counts = count_matrix({0: self.filtered_consensus}, [0])[0]
+        # only keep the letters that are found (usually the 20 aa and X)
+        used = cons_counts + filt_counts.sum(axis=0)
+        for counts in aa_counts.values():
+            used += counts.sum(axis=0)
+        used[ord('-')] = 0
+        cols = np.flatnonzero(used)
+        letters = [chr(x) for x in cols]
+        filt_counts, cons_counts = filt_counts[:, cols], cons_counts[cols]
+        excluded = np.array([x in self.settings.EXCLUDE_AA_FROM for x in letters], dtype=bool)
+
+        filt_size = filt_counts.sum(axis=1)
+        cons_size = sum([aa_count_cons[x] for x in list(aa_count_spec.keys()) if x not in ('-', 'X')])
+        cur_aa_c2 = filt_counts + cons_counts
         for aa, suspect in list(self.suspected_species.items()):
-            aa_alignment = self.seqset.aa_filt_prot_align[aa_letters_1to3[aa]]
-            suspected_list = sorted(suspect.keys())
-            for spec in self.seqset.common_genome:
-                spec_aa_counter = Counter(aa_alignment[spec])
-                for (cur_aa, aacounter) in spec_aa_counter.most_common():
-                    aa_c1 = aa_count_spec[spec][aa] + aa_count_cons[aa]
-                    cur_aa_c2 = aa_count_spec[spec][
-                        cur_aa] + aa_count_cons[cur_aa]
-                    filt_size = sum([aa_count_spec[spec][x]
-                                     for x in list(aa_count_spec[spec].keys()) if x != '-'])
-                    cons_size = sum(
-                        [aa_count_cons[x] for x in list(aa_count_spec.keys()) if x not in ('-', 'X')])
-                    tot = sum([spec_aa_counter[x]
-                               for x in list(spec_aa_counter.keys()) if x != '-'])
-                    prob = spec_aa_counter[cur_aa] / tot if tot > 0 else 0
-                    if prob > 0 and cur_aa != '-' and cur_aa != aa and cur_aa not in self.settings.EXCLUDE_AA_FROM:
-
-                        sc = self.get_prob_thresh(
-                            aa_c1 + aa_count_cons[aa], cur_aa_c2, filt_size + cons_size, prob)
-                        # print '---------------------------------------------'
-                        # print cur_aa_c2, aa_c1, filt_size, spec_aa_counter[cur_aa], tot
-                        # print '%s : %s ==> %s = %f (%d)' %(spec, cur_aa, aa, sc, aacounter)
-                        # our list of suspected is the genome that either pass sc test
-                        # or were suspected with a total count for amino acid
-                        was_suspected = (spec in suspected_list)
-                        if sc < self.confd or (was_suspected and aa_count_spec[spec][cur_aa] > 1):
-                            try:
-                                self.aa2aa_rea[aa][cur_aa].add(spec)
-                            except KeyError:
-                                self.aa2aa_rea[aa] = defaultdict(set)
-                                self.aa2aa_rea[aa][cur_aa].add(spec)
+            spec_aa_counts = aa_counts[aa][:, cols]
+            tot = spec_aa_counts.sum(axis=1)
+            prob = spec_aa_counts / np.maximum(tot, 1)[:, None]
+            candidates = (prob > 0) & ~excluded
+            aa_c1 = np.zeros(len(species)) + aa_count_cons[aa]
+            if aa in letters:
+                candidates[:, letters.index(aa)] = False
+                aa_c1 += filt_counts[:, letters.index(aa)]
+            sc = self.get_prob_thresh((aa_c1 + aa_count_cons[aa])[:, None], cur_aa_c2,
+                                      (filt_size + cons_size)[:, None], prob)
+            # our list of suspected is the genome that either pass sc test
+            # or were suspected with a total count for amino acid
+            was_suspected = np.array([spec in suspect for spec in species], dtype=bool)
+            passed = candidates & ((sc < self.confd) |
+                                   (was_suspected[:, None] & (filt_counts > 1)))
+            for i, j in zip(*np.nonzero(passed)):
+                try:
+                    self.aa2aa_rea[aa][letters[j]].add(species[i])
+                except KeyError:
+                    self.aa2aa_rea[aa] = defaultdict(set)
+                    self.aa2aa_rea[aa][letters[j]].add(species[i])
 
     def get_expected_prob_per_species(self, genome, aa1, aa2, use_cost=False, use_align=False, l=0.8):
         """Get expected prob for binomial test"""
@@ -1292,26 +1454,13 @@ class ReaGenomeFinder:
         if not use_cost:
             return exp_prob
         else:
-            try:
-                cost = self.settings.SUBMAT[(aa1, aa2)]
-            except:
-                cost = self.settings.SUBMAT[(aa2, aa1)]
+            matrix, letters = submat_array(self.settings.SUBMAT)
+            cost = matrix[letters[aa1], letters[aa2]]
             return exp_prob * np.exp(cost * l)
 
     def get_codon_usage(self):
         """Get Codon usage from species"""
-        codons_align, _ = self.seqset.get_codon_alignment()
-        spec_data = {}
-        codons_align = SeqIO.to_dict(codons_align)
-        for (spec, codalign) in list(codons_align.items()):
-            cseq = str(codalign.seq)
-            spec_data[spec] = Counter([cseq[x:x + 3]
-                                       for x in range(0, len(cseq), 3)])
-        try:
-            del spec_data['---']
-        except:
-            pass
-        return spec_data
+        return self.seqset.get_codon_usage().to_dict()
 
     def save_json(self):
         """Save result into a json file"""
@@ -1319,8 +1468,12 @@ class ReaGenomeFinder:
             json.dump(self.aa_sim_json, outfile1, indent=4)
         with open(os.path.join(self.settings.OUTDIR, "similarity.json"), "w") as outfile2:
             json.dump(self.sim_json, outfile2, indent=4)
-        with open(os.path.join(self.settings.OUTDIR, "reassignment.json"), "w") as outfile3:
-            json.dump(self.reassignment_mapper, outfile3, indent=4)
+        if self.sink is not None:
+            # the manifest is written from the streamed evidence
+            self.sink.close(self.reassignment_mapper)
+        else:
+            with open(os.path.join(self.settings.OUTDIR, "reassignment.json"), "w") as outfile3:
+                json.dump(self.reassignment_mapper, outfile3, indent=4)
 
     def save_predictions(self, preds, outfile):
         """Save all prediction in the root folder"""
@@ -1360,118 +1513,382 @@ class ReaGenomeFinder:
                     OUT.write("\t%s\t%s\n" % (spec_with_rea[0].ljust(
                         max_spec_len), "\t".join(spec_with_rea[1:])))
 
-    def save_all(self, predictions, savecodon=False):
-        """Save everything"""
+    def open_sink(self, outdir=None):
+        """Stream the evidence of each reassignment to a ResultSink in
+        outdir (OUTDIR by default) instead of keeping it in memory"""
+        self.sink = ResultSink(outdir or self.settings.OUTDIR)
+        return self.sink
+
+    def save_all(self, predictions=None, savecodon=False, savealign=True):
+        """Save everything. The predictions are read from the sink if they
+        are not given"""
+        if predictions is None:
+            predictions = self.sink.predictions if self.sink is not None else []
         if savecodon:
-            self.reassignment_mapper['codons'] = self.get_codon_usage()
+            codon_usage = self.seqset.get_codon_usage()
+            self.reassignment_mapper['codons'] = codon_usage.to_dict()
+            codon_usage.save(os.path.join(self.settings.OUTDIR, "codons.npz"))
         self.save_json()
-        id_filtfile = os.path.join(
-            self.settings.OUTDIR, "filt_alignment.fasta")
-        ic_filtfile = os.path.join(self.settings.OUTDIR, "ic_filt.fasta")
-        gap_filtfile = os.path.join(self.settings.OUTDIR, "gap_filt.fasta")
-        ori_al = os.path.join(self.settings.OUTDIR, "ori_alignment.fasta")
-        newick = os.path.join(self.settings.OUTDIR, "tree.nwk")
-        self.seqset.write_data(ori_alignment=ori_al,
-                               id_filtered=id_filtfile, gap_filtered=gap_filtfile, ic_filtered=ic_filtfile, tree=newick)
+        if savealign:
+            self.save_alignments()
         self.save_predictions(predictions, os.path.join(
             self.settings.OUTDIR, "predictions.txt"))
 
+    def save_alignments(self, outdir=None):
+        """Save the filtered alignments and the tree"""
+        outdir = outdir or self.settings.OUTDIR
+        id_filtfile = os.path.join(outdir, "filt_alignment.fasta")
+        ic_filtfile = os.path.join(outdir, "ic_filt.fasta")
+        gap_filtfile = os.path.join(outdir, "gap_filt.fasta")
+        ori_al = os.path.join(outdir, "ori_alignment.fasta")
+        newick = os.path.join(outdir, "tree.nwk")
+        self.seqset.write_data(ori_alignment=ori_al,
+                               id_filtered=id_filtfile, gap_filtered=gap_filtfile, ic_filtered=ic_filtfile, tree=newick)
+
+    def set_substitution_counts(self):
+        """Count once, for each species, the (consensus aa, observed aa) pairs
+        of the global and of the filtered alignment"""
+        self.subs_species = dict((x, i) for i, x in enumerate(self.seq_names))
+        self.subs_counts = {
+            'global': substitution_counts(self.seqset.prot_dict, self.seq_names,
+                                          self.global_consensus),
+            # the aa filtered alignments use upper case consensus
+            'filtered': substitution_counts(SeqIO.to_dict(self.seqset.filt_prot_align),
+                                            self.seq_names, self.filtered_consensus, upper=True)
+        }
+
+    def get_substitution_count(self, genome, cons_aa, aa, aligntype='global'):
+        """Return the number of positions where the consensus is cons_aa
+        and the sequence of genome is aa, in the global or filtered alignment"""
+        counts, letters = self.subs_counts[aligntype]
+        try:
+            return int(counts[self.subs_species[genome], letters[cons_aa], letters[aa]])
+        except KeyError:
+            return 0
+
+    def prepare_analysis(self, codon_align, fcodon_align):
+        """Compute the data shared by all the (aa1, aa2) of the analysis and
+        return the list of (aa1, aa2) to evaluate"""
+        self.set_substitution_counts()
+
+        # codon usage of the global and filtered alignments, shared by all aa1
+        gevidence = CodonEvidence(self.seqset.prot_align, self.global_consensus, codon_align,
+                                  self.seqset.codontable, self.seqset.position, self.seqset.gene_limits, self.settings)
+        fevidence = CodonEvidence(self.seqset.filt_prot_align, self.filtered_consensus, fcodon_align,
+                                  self.seqset.codontable, self.seqset.filt_position, self.seqset.gene_limits, self.settings)
+        # the species tree and the reconstruction of all the reassignments
+        # are shared by all (aa1, aa2)
+        atree = ArrayTree(self.seqset.phylotree)
+        pairs = [(aa1, aa2) for aa1, aarea in list(self.aa2aa_rea.items()) for aa2 in aarea]
+        recon = BitsetRec.from_species(atree, [self.aa2aa_rea[aa1][aa2] for aa1, aa2 in pairs])
+        # number of positions where each aa is the consensus, for the cost
+        # of each (aa1, aa2)
+        positions = Counter(str(self.global_consensus)) + \
+            Counter(str(self.filtered_consensus).upper())
+        self._analysis = {'align': (codon_align, fcodon_align), 'evidence': (gevidence, fevidence),
+                          'atree': atree, 'recon': recon, 'codon_rea': {}, 'positions': positions,
+                          'pairs': dict((x, i) for i, x in enumerate(pairs))}
+        return pairs
+
+    def pair_cost_features(self, aa1, aa2, nvalid=0):
+        """Features of the cost model for the reassignment aa2 to aa1, nvalid
+        being the number of predicted codons to validate"""
+        return PairCostModel.features(len(self._analysis['atree']), len(self.aa2aa_rea[aa1][aa2]),
+                                      self._analysis['positions'][aa1], nvalid)
+
+    def get_codon_rea(self, aa1):
+        """Return the (global, filtered) CodonReaData of aa1 for the current
+        analysis"""
+        cache = self._analysis['codon_rea']
+        if aa1 not in cache:
+            codon_align, fcodon_align = self._analysis['align']
+            gevidence, fevidence = self._analysis['evidence']
+            aarea = self.aa2aa_rea[aa1]
+            # these are views of the shared evidence, cheap to keep
+            cache[aa1] = (CodonReaData((aa1, aarea), self.seqset.prot_align, self.global_consensus, codon_align,
+                                       self.seqset.codontable, self.seqset.position, self.seqset.gene_limits,
+                                       self.settings, evidence=gevidence),
+                          CodonReaData((aa1, aarea), self.seqset.filt_prot_align, self.filtered_consensus, fcodon_align,
+                                       self.seqset.codontable, self.seqset.filt_position, self.seqset.gene_limits,
+                                       self.settings, evidence=fevidence))
+        return cache[aa1]
+
+    def _pair_tree(self, aa1, aa2):
+        """SingleNaiveRec of the reassignment aa2 to aa1, without leaf data"""
+        return SingleNaiveRec(self._analysis['atree'], self.aa2aa_rea[aa1][aa2], aa_letters_1to3[aa2],
+                              aa_letters_1to3[aa1], self.seqset.codontable, self.get_codon_rea(aa1),
+                              recon=(self._analysis['recon'], self._analysis['pairs'][(aa1, aa2)]))
+
+    def analyse_pair(self, aa1, aa2):
+        """Evaluate the reassignment aa2 to aa1. Return (fitch, alldata), or
+        None if the reassignment is not kept"""
+        gcodon_rea, fcodon_rea = self.get_codon_rea(aa1)
+        # logging.debug("%s to %s" % (aa2, aa1))
+        self.pair_stats['pairs'] += 1
+        fitch = self._pair_tree(aa1, aa2)
+        slist = fitch.get_species_list(
+            self.settings.LIMIT_TO_SUSPECTED_SPECIES)
+        # first phase : counts and lost flags, which decide whether
+        # the reassignment is valid
+        for genome in slist:
+            fitch.set_leaf_data(genome, self.get_substitution_count(genome, aa1, aa2, 'global'),
+                                self.get_substitution_count(genome, aa1, aa2, 'filtered'))
+        tested = {}
+        if not self.settings.SHOW_ALL:
+            if not fitch.can_be_valid(self.settings.COUNT_THRESHOLD):
+                self.pair_stats['pruned_by_count'] += 1
+                return None
+            # only the genomes with enough counts can validate it
+            tested = self.run_lost_tests(fitch, aa1, aa2, (gcodon_rea, fcodon_rea),
+                                         fitch.get_leaf_candidates(self.settings.COUNT_THRESHOLD))
+            if not fitch.is_valid(self.settings.COUNT_THRESHOLD):
+                self.pair_stats['pruned_by_test'] += 1
+                return None
+
+        # second phase : evidence of all genomes
+        tested.update(self.run_lost_tests(fitch, aa1, aa2, (gcodon_rea, fcodon_rea),
+                                          [x for x in slist if x not in tested]))
+        alldata = {}
+        for genome in slist:
+            pval = tested[genome]
+            count, filter_count = fitch.get_leaf_data(genome)
+            # filtered codon infos
+            freacodon = fcodon_rea.get_reacodons(genome, aa2)
+            fusedcodon = fcodon_rea.get_usedcodons(genome, aa2)
+            fmixtecodon = fcodon_rea.get_mixtecodons(genome, aa2)
+            # global codon infos
+            greacodon = gcodon_rea.get_reacodons(genome, aa2)
+            gusedcodon = gcodon_rea.get_usedcodons(genome, aa2)
+            gmixtecodon = gcodon_rea.get_mixtecodons(genome, aa2)
+
+            gdata = {}
+            g_rea_dist = gcodon_rea.get_rea_aa_codon_distribution(
+                genome, aa2)
+            g_total_rea_dist = gcodon_rea.get_total_rea_aa_codon_distribution(
+                genome, aa2)
+            gdata['global'] = {'rea_codon': greacodon, 'used_codon': gusedcodon, 'mixte_codon': gmixtecodon,
+                               'count': count, 'rea_distribution': g_rea_dist, 'total_rea_distribution': g_total_rea_dist}
+
+            f_rea_dist = fcodon_rea.get_rea_aa_codon_distribution(
+                genome, aa2)
+            f_total_rea_dist = fcodon_rea.get_total_rea_aa_codon_distribution(
+                genome, aa2)
+            gdata['filtered'] = {'rea_codon': freacodon, 'used_codon': fusedcodon, 'mixte_codon': fmixtecodon,
+                                 'count': filter_count, 'rea_distribution': f_rea_dist, 'total_rea_distribution': f_total_rea_dist}
+            gdata['suspected'] = self.suspected_species[
+                aa1].get(genome, 0)
+            gdata['score'] = {'global': gcodon_rea.get_score(
+                genome, aa2, aa1), 'filtered': fcodon_rea.get_score(genome, aa2, aa1)}
+
+            gdata['lost'] = {'pval': pval,
+                             'lost': 1 if fitch.is_lost(genome) else 0}
+            gdata['fitch'] = fitch.get_distance_to_rea_node(genome)
+            gdata['codons'] = {'global': gcodon_rea.get_aa_usage(
+                genome, aa2), 'filtered': fcodon_rea.get_aa_usage(genome, aa2)}
+            alldata[genome] = gdata
+
+        if(fitch.is_valid(self.settings.COUNT_THRESHOLD) or self.settings.SHOW_ALL):
+            return fitch, alldata
+        return None
+
+    def restore_pair(self, aa1, aa2, alldata):
+        """Rebuild the SingleNaiveRec of a reassignment kept by the analysis
+        from its evidence, without running the tests again"""
+        fitch = self._pair_tree(aa1, aa2)
+        for genome, gdata in list(alldata.items()):
+            fitch.set_leaf_data(genome, gdata['global']['count'], gdata['filtered']['count'],
+                                lost=bool(gdata['lost']['lost']))
+        return fitch
+
+    def get_pair_data(self, aa1, aa2):
+        """Return the evidence of a reassignment kept by the analysis"""
+        if self.sink is not None:
+            return self.sink.get(aa2, aa1)
+        return self.reassignment_mapper['aa'][aa2][aa1]
+
+    def keep_pair(self, aa1, aa2, alldata):
+        """Save the evidence of a kept reassignment"""
+        self.pair_stats['kept'] += 1
+        if self.sink is not None:
+            self.sink.add(aa1, aa2, alldata)
+        else:
+            self.reassignment_mapper['aa'][aa2][aa1] = alldata
+        self.interesting_case.append("%s to %s" % (aa2, aa1))
+
+    def finish_analysis(self):
+        """Stop the thread pool of the tests and save the pvalue cache"""
+        if self.stat_pool is not None:
+            self.stat_pool.shutdown()
+            self.stat_pool = None
+        logging.debug("Contingency test cache : %s" % self.ctester.stats())
+        logging.debug("Reassignment pairs : %s" % dict(self.pair_stats))
+        self.ctester.save()
+        self.cost_model.save()
+
     def run_analysis(self, codon_align, fcodon_align):
         """ Run the filtering analysis of the current dataset in sequenceset"""
-
-        for aa1, aarea in list(self.aa2aa_rea.items()):
-            aa_alignment = self.seqset.aa_filt_prot_align[aa_letters_1to3[aa1]]
-            gcodon_rea = CodonReaData((aa1, aarea), self.seqset.prot_align, self.global_consensus, codon_align,
-                                      self.seqset.codontable, self.seqset.position, self.seqset.gene_limits, self.settings)
-            fcodon_rea = CodonReaData((aa1, aarea), self.seqset.filt_prot_align, self.filtered_consensus, fcodon_align,
-                                      self.seqset.codontable, self.seqset.filt_position, self.seqset.gene_limits, self.settings)
-
-            for aa2, species in list(aarea.items()):
-                # logging.debug("%s to %s" % (aa2, aa1))
-                counts = []
-                t = self.seqset.phylotree.copy("newick")
-                fitch = SingleNaiveRec(t, species, aa_letters_1to3[aa2], aa_letters_1to3[
-                    aa1], self.seqset.codontable, (gcodon_rea, fcodon_rea))
-                slist = fitch.get_species_list(
-                    self.settings.LIMIT_TO_SUSPECTED_SPECIES)
-                alldata = {}
-                for genome in slist:
-                    rec = self.seqset.prot_dict[genome]
-                    leaf = fitch.tree & genome
-                    filt_count = 0
-                    try:
-                        filt_count = len(
-                            [y for y in aa_alignment[genome] if y != '-' and y == aa2])
-                    except Exception:
-                        # wtver happen, do nothing
-                        pass
-                    leaf.add_features(count=0)
-                    leaf.add_features(filter_count=filt_count)
-                    leaf.add_features(lost=True)
-                    for pos in range(len(self.global_consensus)):
-                        if self.global_consensus[pos] == aa1 and rec[pos] == aa2:
-                            leaf.count += 1
-
-                    # filtered codon infos
-                    freacodon = fcodon_rea.get_reacodons(genome, aa2)
-                    fusedcodon = fcodon_rea.get_usedcodons(genome, aa2)
-                    fmixtecodon = fcodon_rea.get_mixtecodons(genome, aa2)
-                    # global codon infos
-                    greacodon = gcodon_rea.get_reacodons(genome, aa2)
-                    gusedcodon = gcodon_rea.get_usedcodons(genome, aa2)
-                    gmixtecodon = gcodon_rea.get_mixtecodons(genome, aa2)
-
-                    # settings parameters
-                    reacodon, usedcodon, mcodon = freacodon, fusedcodon, fmixtecodon
-                    if self.settings.USE_GLOBAL:
-                        reacodon, usedcodon, mcodon = greacodon, gusedcodon, gmixtecodon
-
-                    eprob = None
-                    if len(list(reacodon.values())) == 1 or len(list(usedcodon.values())) == 1:
-                        eprob = self.get_expected_prob_per_species(genome, aa2, aa1,
-                                                                   use_cost=True, use_align=True)
-                        # print("%s | %s to %s : %f"%(genome, aa2, aa1, eprob))
-                        assert (
-                            eprob - 1 < 0), "Strange value for eprob %f" % eprob
-                    fisher_passed, pval = independance_test(
-                        reacodon, usedcodon, genome, confd=self.confd, expct_prob=eprob)
-                    # print "%s\t%s\t%s ==> %s" %(aa2, aa1, genome,
-                    # str(column_comparision) )
-                    # if('lost' in leaf.features and fisher_passed and
-                    # leaf.count > self.settings.COUNT_THRESHOLD
-                    if('lost' in leaf.features and fisher_passed):
-                        leaf.lost = False
-
-                    gdata = {}
-                    g_rea_dist = gcodon_rea.get_rea_aa_codon_distribution(
-                        genome, aa2)
-                    g_total_rea_dist = gcodon_rea.get_total_rea_aa_codon_distribution(
-                        genome, aa2)
-                    gdata['global'] = {'rea_codon': greacodon, 'used_codon': gusedcodon, 'mixte_codon': gmixtecodon,
-                                       'count': leaf.count, 'rea_distribution': g_rea_dist, 'total_rea_distribution': g_total_rea_dist}
-
-                    f_rea_dist = fcodon_rea.get_rea_aa_codon_distribution(
-                        genome, aa2)
-                    f_total_rea_dist = fcodon_rea.get_total_rea_aa_codon_distribution(
-                        genome, aa2)
-                    gdata['filtered'] = {'rea_codon': freacodon, 'used_codon': fusedcodon, 'mixte_codon': fmixtecodon,
-                                         'count': leaf.filter_count, 'rea_distribution': f_rea_dist, 'total_rea_distribution': f_total_rea_dist}
-                    gdata['suspected'] = self.suspected_species[
-                        aa1].get(genome, 0)
-                    gdata['score'] = {'global': gcodon_rea.get_score(
-                        genome, aa2, aa1), 'filtered': fcodon_rea.get_score(genome, aa2, aa1)}
-
-                    gdata['lost'] = {'pval': pval,
-                                     'lost': 1 if leaf.lost else 0}
-                    gdata['fitch'] = fitch.get_distance_to_rea_node(leaf)
-                    gdata['codons'] = {'global': gcodon_rea.get_aa_usage(
-                        genome, aa2), 'filtered': fcodon_rea.get_aa_usage(genome, aa2)}
-                    alldata[genome] = gdata
-
-                if(fitch.is_valid(self.settings.COUNT_THRESHOLD) or self.settings.SHOW_ALL):
-                    self.reassignment_mapper['aa'][aa2][aa1] = alldata
-                    self.interesting_case.append("%s to %s" % (aa2, aa1))
-                    yield (self, fitch, alldata)
+        for aa1, aa2 in self.prepare_analysis(codon_align, fcodon_align):
+            start = time.time()
+            res = self.analyse_pair(aa1, aa2)
+            self.cost_model.record('analysis', self.pair_cost_features(aa1, aa2), time.time() - start)
+            if res is not None:
+                fitch, alldata = res
+                self.keep_pair(aa1, aa2, alldata)
+                yield (self, fitch, alldata)
+        self.finish_analysis()
+
+    def run_parallel_analysis(self, codon_align, fcodon_align, nprocs, callback=None):
+        """Run the analysis with the (aa1, aa2) evaluated in a pool of nprocs
+        processes. The workers are forked once the shared data are computed,
+        so each task is only an (aa1, aa2) pair. callback((self, fitch,
+        alldata)) is called in the worker and (aa1, aa2, alldata, result of
+        callback) is yielded for each kept reassignment.
+        The pairs are dispatched from the heaviest to the lightest according
+        to cost_model, each worker taking the next pair when it is done"""
+        pairs = self.prepare_analysis(codon_align, fcodon_align)
+        pairs = self.cost_model.order('analysis', pairs, [self.pair_cost_features(*x) for x in pairs])
+        for aa1, aa2, stats, tests, alldata, output, seconds in _imap_forked(self, callback, _run_pair_task, pairs, nprocs):
+            self.cost_model.record('analysis', self.pair_cost_features(aa1, aa2), seconds)
+            self.pair_stats.update(stats)
+            # the pvalues computed by the worker go to the parent cache
+            self.ctester.merge(tests)
+            if alldata is not None:
+                self.keep_pair(aa1, aa2, alldata)
+                yield aa1, aa2, alldata, output
+        self.finish_analysis()
+
+    def run_reports(self, tasks, report, nprocs=0, nvalid=None):
+        """Call report((self, fitch, alldata), prediction) for each
+        ((aa1, aa2), prediction) in tasks, once the analysis is done, and
+        yield the results. The reports are made in a pool of nprocs forked
+        processes if nprocs > 0, the heaviest first. nvalid is the number of
+        predicted codons to validate for each task, used by cost_model.
+        The data shared by the pairs of the analysis are released at the end"""
+        features = dict((pair, self.pair_cost_features(pair[0], pair[1], nvalid[i] if nvalid else 0))
+                        for i, (pair, prediction) in enumerate(tasks))
+        try:
+            if nprocs > 0:
+                tasks = self.cost_model.order('report', tasks, [features[x[0]] for x in tasks])
+                results = _imap_forked(self, report, _run_report_task, tasks, nprocs)
+            else:
+                results = (_report_task(self, report, task) for task in tasks)
+            for pair, seconds, output in results:
+                self.cost_model.record('report', features[pair], seconds)
+                yield output
+        finally:
+            self._analysis = None
+            self.cost_model.save()
+
+    def run_lost_tests(self, fitch, aa1, aa2, codon_rea, genomes):
+        """Test whether the reassignment aa2 to aa1 is lost in each genome
+        and update the lost flags of fitch. Return the pvalue per genome"""
+        # settings parameters
+        codon_rea = codon_rea[0] if self.settings.USE_GLOBAL else codon_rea[1]
+        tests = []
+        for genome in genomes:
+            reacodon = codon_rea.get_reacodons(genome, aa2)
+            usedcodon = codon_rea.get_usedcodons(genome, aa2)
+
+            eprob = None
+            if len(list(reacodon.values())) == 1 or len(list(usedcodon.values())) == 1:
+                eprob = self.get_expected_prob_per_species(genome, aa2, aa1,
+                                                           use_cost=True, use_align=True)
+                # print("%s | %s to %s : %f"%(genome, aa2, aa1, eprob))
+                assert (
+                    eprob - 1 < 0), "Strange value for eprob %f" % eprob
+            tests.append((reacodon, usedcodon, genome, eprob))
+
+        # the contingency tests of all genomes are run together
+        results = self.run_independance_tests(tests)
+        pvals = {}
+        for (reacodon, usedcodon, genome, eprob), (fisher_passed, pval) in zip(tests, results):
+            # if('lost' in leaf.features and fisher_passed and
+            # leaf.count > self.settings.COUNT_THRESHOLD
+            if fisher_passed:
+                fitch.set_lost(genome, False)
+            pvals[genome] = pval
+        return pvals
+
+    def run_independance_tests(self, tests):
+        """Run independance_test on a list of (rea, ori, genome, expct_prob).
+        The tests are run in a thread pool if STAT_THREADS > 1"""
+        def run_test(args):
+            rea, ori, genome, eprob = args
+            return independance_test(rea, ori, genome, confd=self.confd,
+                                     expct_prob=eprob, tester=self.ctester)
+
+        nthreads = getattr(self.settings, 'STAT_THREADS', 1)
+        if nthreads <= 1 or len(tests) < 2:
+            return [run_test(x) for x in tests]
+        if self.stat_pool is None:
+            self.stat_pool = ThreadPoolExecutor(nthreads)
+        return list(self.stat_pool.map(run_test, tests))
+
+
+# state of the worker processes of run_parallel_analysis
+_PAIR_WORKER = {}
+
+
+def _imap_forked(reafinder, callback, func, tasks, nprocs):
+    """Yield func(task) for each task, as they complete, from a pool of
+    nprocs forked processes sharing reafinder and callback"""
+    pool = multiprocessing.get_context('fork').Pool(
+        nprocs, initializer=_init_pair_worker, initargs=(reafinder, callback))
+    try:
+        for output in pool.imap_unordered(func, tasks):
+            yield output
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def _init_pair_worker(reafinder, callback):
+    """Keep the ReaGenomeFinder and the callback in the worker. They are
+    inherited from the parent when the worker is forked, not pickled"""
+    # the thread pool belongs to the parent, the workers only read the sink
+    reafinder.stat_pool = None
+    # only the pvalues computed by the worker are sent back to the parent
+    reafinder.ctester.collect()
+    _PAIR_WORKER['reafinder'] = reafinder
+    _PAIR_WORKER['callback'] = callback
+
+
+def _run_pair_task(pair):
+    """Evaluate an (aa1, aa2) in a worker of run_parallel_analysis and
+    return (aa1, aa2, pair_stats, collected tests, alldata, result of the
+    callback, time)"""
+    reafinder = _PAIR_WORKER['reafinder']
+    callback = _PAIR_WORKER['callback']
+    reafinder.pair_stats = Counter()
+    aa1, aa2 = pair
+    start = time.time()
+    res = reafinder.analyse_pair(aa1, aa2)
+    if res is None:
+        return (aa1, aa2, reafinder.pair_stats, reafinder.ctester.collect(),
+                None, None, time.time() - start)
+    fitch, alldata = res
+    output = callback((reafinder, fitch, alldata)) if callback else None
+    return (aa1, aa2, reafinder.pair_stats, reafinder.ctester.collect(),
+            alldata, output, time.time() - start)
+
+
+def _report_task(reafinder, report, task):
+    """Report a reassignment kept by the analysis, task being ((aa1, aa2),
+    prediction). Return ((aa1, aa2), time, result of report)"""
+    (aa1, aa2), prediction = task
+    start = time.time()
+    alldata = reafinder.get_pair_data(aa1, aa2)
+    fitch = reafinder.restore_pair(aa1, aa2, alldata)
+    output = report((reafinder, fitch, alldata), prediction)
+    return (aa1, aa2), time.time() - start, output
+
+
+def _run_report_task(task):
+    """_report_task in a worker of ReaGenomeFinder.run_reports"""
+    return _report_task(_PAIR_WORKER['reafinder'], _PAIR_WORKER['callback'], task)
 
 
 def executeCMD(cmd, prog):
@@ -1520,25 +1937,31 @@ def convert_tree_to_mafft(tree, seq_order, output, scale, dist_thresh=1e-10):
 
 def check_stop(seq_list, is_aligned, stop='*'):
     """ Check all position for stop in the protein sequences"""
-    result_map = {}
-    for seq in seq_list:
-        last_pos = len(seq.seq) - 1
-        result_map[seq.id] = [pos for pos,
-                              char in enumerate(seq.seq) if char == stop]
-    result = list(result_map.values())
-    length_list = sorted([len(x) for x in result])
-    length = length_list[-1]
+    stop = ord(stop)
     if is_aligned:
-        result = np.array([r + [None] * (length - len(r)) for r in result])
-        first_stops = result[0]
-        position_match = np.all(result == first_stops, axis=0)
-        if not position_match:
-            return False, False, result_map
-        elif np.all(position_match):
-            return True, True, result_map
-        return False, True, result_map
+        stop_mat = as_byte_matrix(seq_list)[0] == stop
+        has_stop = bool(stop_mat.any())
+        rows = stop_mat
+        # same layout in all sequences
+        uniform = bool(np.all(stop_mat == stop_mat[0]))
     else:
-        return np.all(np.asarray(length_list) == length), length != 0, result_map
+        rows = [row == stop for row in as_byte_rows(seq_list)]
+        has_stop = any(row.any() for row in rows)
+        # same number of stop in all sequences
+        uniform = len(set(int(row.sum()) for row in rows)) <= 1
+    result_map = dict((seq.id, np.nonzero(row)[0].tolist())
+                      for seq, row in zip(seq_list, rows))
+    return uniform and has_stop, has_stop, result_map
+
+
+def stop_segments(stopmapping):
+    """Return for each sequence the (start, end) index ranges delimited by its
+    stop positions. The stop itself is excluded from each range"""
+    segments = {}
+    for seqid, stops in list(stopmapping.items()):
+        starts = [0] + [pos + 1 for pos in stops[:-1]]
+        segments[seqid] = list(zip(starts, stops))
+    return segments
 
 
 def purge_directory(dirname):
@@ -1606,8 +2029,10 @@ def remove_gap_only_columns(alignfile, curformat):
     return fastafile
 
 
-def independance_test(rea, ori, genome, confd=0.05, expct_prob=0.5):
+def independance_test(rea, ori, genome, confd=0.05, expct_prob=0.5, tester=None):
     """Perform a Fisher's Exact test"""
+    if tester is None:
+        tester = DEFAULT_TESTER
     codon_list = set(rea.keys())
     codon_list.update(list(ori.keys()))
     codon_list = [x for x in codon_list if not (
@@ -1620,13 +2045,8 @@ def independance_test(rea, ori, genome, confd=0.05, expct_prob=0.5):
         for i in range(nelmt):
             obs[i, 0] = rea.get(codon_list[i], 0)
             obs[i, 1] = ori.get(codon_list[i], 0)
-        try:
-            pval = fisher_exact(obs, midP=True, attempt=3)
-            # fallback to chi2 test if fisher is impossible
-        except:
-            logging.debug(
-                "**warning: %s (%s, %s) using chi2 instead of FISHEREXACT" % (genome, ori, rea))
-            c, pval, dof, t = ss.chi2_contingency(obs)
+        # mid-P fisher test, with a fallback to chi2 if fisher is impossible
+        pval = tester.test(obs)
         return pval <= confd, pval
 
     # strangely, codon is used only in rea column
@@ -1640,7 +2060,7 @@ def independance_test(rea, ori, genome, confd=0.05, expct_prob=0.5):
             # (rea.values()[0] + ori.values()[0])
         # return rea.values()[0] >= ori.values()[0], fpval / tot_size
         n = list(rea.values())[0] + list(ori.values())[0]  # ignoring mixcodon ??
-        pval = onevalbinomtest(list(rea.values())[0], n, expct_prob)
+        pval = tester.binomial(list(rea.values())[0], n, expct_prob)
         return pval <= confd, pval
     # In this case, the codon is neither in the rea column nor in the
     # second column, strange result
@@ -1648,9 +2068,74 @@ def independance_test(rea, ori, genome, confd=0.05, expct_prob=0.5):
         return False, 1
 
 
+_SUBMAT_ARRAYS = {}
+
+
+def submat_array(submat):
+    """Compile a substitution matrix dict (with one (a, b) key per pair, as
+    in Bio.SubsMat.MatrixInfo) into a symmetric array.
+    Return the array and the index of each letter. The result is cached"""
+    if id(submat) not in _SUBMAT_ARRAYS:
+        letters = sorted(set(itertools.chain.from_iterable(submat.keys())))
+        letters = dict((x, i) for i, x in enumerate(letters))
+        matrix = np.zeros((len(letters), len(letters)))
+        for (a, b), cost in submat.items():
+            matrix[letters[a], letters[b]] = matrix[letters[b], letters[a]] = cost
+        # keep a reference to submat so that its id is not reused
+        _SUBMAT_ARRAYS[id(submat)] = (submat, matrix, letters)
+    return _SUBMAT_ARRAYS[id(submat)][1:]
+
+
+def count_matrix(seqs, names):
+    """Return a len(names) x 256 matrix with the count of each (ascii)
+    letter in the sequence (string or SeqRecord) of each name in seqs.
+    Names that are not in seqs get a row of zeros"""
+    counts = np.zeros((len(names), 256), dtype=np.int64)
+    for i, name in enumerate(names):
+        seq = seqs.get(name)
+        if seq is not None:
+            seq = str(getattr(seq, 'seq', seq)).encode()
+            counts[i] = np.bincount(np.frombuffer(seq, dtype=np.uint8), minlength=256)
+    return counts
+
+
+def substitution_counts(seqs, names, consensus, upper=False):
+    """Count, for each name, the positions of its aligned sequence in seqs
+    where the consensus has letter c and the sequence letter a.
+    Return a (len(names), nletters, nletters) array indexed by [name, c, a]
+    and the dict mapping each letter to its index. If upper is True, the
+    consensus letters are converted to upper case"""
+    consensus = str(consensus)
+    if upper:
+        consensus = consensus.upper()
+    codes = {}
+    for name in names:
+        seq = seqs.get(name)
+        if seq is not None:
+            codes[name] = np.frombuffer(
+                str(getattr(seq, 'seq', seq)).encode(), dtype=np.uint8)
+    cons = np.frombuffer(consensus.encode(), dtype=np.uint8)
+    used = np.zeros(256, dtype=bool)
+    used[cons] = True
+    for seq in codes.values():
+        used[seq] = True
+    letters = dict((chr(x), i) for i, x in enumerate(np.flatnonzero(used)))
+    lookup = np.zeros(256, dtype=np.int64)
+    lookup[used] = np.arange(len(letters))
+    nlet = len(letters)
+    counts = np.zeros((len(names), nlet, nlet), dtype=np.int64)
+    cons = lookup[cons] * nlet
+    for i, name in enumerate(names):
+        if name in codes:
+            size = min(len(cons), len(codes[name]))
+            counts[i] = np.bincount(cons[:size] + lookup[codes[name][:size]],
+                                    minlength=nlet * nlet).reshape(nlet, nlet)
+    return counts, letters
+
+
 def onevalbinomtest(obs, n, prob):
     """Return a binomial test given success and prob"""
-    return ss.binom_test(obs, n, prob)
+    return binom_test(obs, n, prob)
 
 
 def chi2_is_possible(obs):
@@ -1757,9 +2242,10 @@ def compute_ic_content(alignment):
     return ic_vector.tolist()
 
 
-def check_gain(codon, cible_aa, speclist, tree, codontable, codon_alignment,
+def check_gain(codon, cible_aa, speclist, dollo, codontable, codon_alignment,
                scoring_method="identity", alignment=None, ic_cont=None, method="wilcoxon", spec_filter=True):
-    """Check if there is an actuall gain in global sequence quality after applying reassignment"""
+    """Check if there is an actuall gain in global sequence quality after applying reassignment.
+    dollo is the BitsetRec (dollo mode) of the reassigned species"""
     if not isinstance(codon_alignment, dict):
         codon_alignment = SeqIO.to_dict(codon_alignment)
 
@@ -1800,7 +2286,8 @@ def check_gain(codon, cible_aa, speclist, tree, codontable, codon_alignment,
         alignment, _ = translate(codon_alignment, codontable)
 
     if spec_filter:
-        SingleNaiveRec._dollo(tree)
+        atree = dollo.atree
+        reassigned = dollo.reassigned[0]
         fcod_aln, f_aln = extract_alignment(
             codon_alignment, alignment, speclist)
         fake_rea = set([])
@@ -1809,10 +2296,10 @@ def check_gain(codon, cible_aa, speclist, tree, codontable, codon_alignment,
             # either we get all sister here
             # or all node under the same predicted reassignment
             # which could take too long
-            cur_par = (tree & spec).up
-            while cur_par.up is not None and cur_par.reassigned != {1}:
-                cur_par = cur_par.up
-            spec_sis = [x.name for x in cur_par if x.name in speclist]
+            cur_par = atree.parent[atree.leaf_index[spec]]
+            while atree.parent[cur_par] >= 0 and reassigned[cur_par] != SingleNaiveRec.DEST:
+                cur_par = atree.parent[cur_par]
+            spec_sis = [x for x in atree.get_leaf_names(cur_par) if x in speclist]
             cur_recs = []
             cur_recs_al = []
             codchange = {}
@@ -1880,218 +2367,233 @@ def get_report(fitchtree, gdata, reafinder, codon_align, prediction, output="",
     """ Render tree to a pdf"""
 
     settings = reafinder.settings
+    renderer = reafinder.renderer
     OUTDIR = purge_directory(os.path.join(settings.OUTDIR, fitchtree.ori_aa +
                                           "_to_" + fitchtree.dest_aa))
     c_rea = get_rea_genome_list(prediction[1], prediction[3])
     if not output:
         output = os.path.join(OUTDIR, "Codon_data." + settings.IMAGE_FORMAT)
-    if(GRAPHICAL_ACCESS):
-        ts = TreeStyle()
-        ts.show_leaf_name = False
-        ts.show_branch_length = False
-        ts.show_branch_support = False
-
-        rea_style = NodeStyle()
-        rea_style["shape"] = "square"
-        rea_style["size"] = 7
-        rea_style["fgcolor"] = "crimson"
-        rea_style["hz_line_type"] = 0
-
-        other_style = NodeStyle()
-        other_style["shape"] = "circle"
-        other_style["size"] = 7
-        other_style["fgcolor"] = "seagreen"
-        other_style["node_bgcolor"] = "crimson"
-        other_style["hz_line_type"] = 0
-
-        prob_lost = NodeStyle()
-        prob_lost["hz_line_type"] = 1
-        prob_lost["hz_line_color"] = "#cccccc"
-
-        default_style = NodeStyle()
-        default_style["size"] = 0
-        default_style["fgcolor"] = "black"
-        show_n = settings.ADD_NUMBER_PIE
-
-        def layout(node):
-
-            get_suffix = lambda x: x if settings.ADD_LABEL_TO_LEAF else ""
-            faces.add_face_to_node(
-                AttrFace("rea", fsize=10), node, column=0, position="branch-right")
+    if GRAPHICAL_ACCESS and renderer.enabled:
+        # only the data shown on the tree are sent to the renderer
+        leaf_data = {}
+        for genome, data in list(gdata.items()):
+            leaf_data[genome] = dict((dtype, dict((k, data[dtype][k]) for k in ('rea_codon', 'used_codon', 'mixte_codon')))
+                                     for dtype in ('filtered', 'global'))
+            leaf_data[genome]['lost'] = data['lost']
+        renderer.submit(render_reassignment_tree, fitchtree.tree, leaf_data, fitchtree.colors, c_rea,
+                        fitchtree.ori_aa, fitchtree.dest_aa, fitchtree.has_codon_data(), settings, output,
+                        dpi=settings.RENDER_DPI, pie_size=pie_size)
+        glob_purge.append(output)
 
-            has_count, has_fcount = 0, 0
-            if node.is_leaf() and ('count' in node.features):
-                faces.add_face_to_node(AttrFace(
-                    "count", fsize=6, fgcolor="firebrick"), node, column=0, position="branch-bottom")
-                has_count = node.count
+    rkp, data_var, codvalid = None, None, {}
+    if settings.VALIDATION:
+        # now get sequence retranslation improvement
+        table = fitchtree.dct.forward_table
+        # add the gap to codon_table
+        table['---'] = '-'
+        table['...'] = '.'
+        data_present, data_var, rkp, codvalid = codon_adjust_improve(
+            fitchtree, reafinder, codon_align, table, prediction, outdir=OUTDIR)
+
+    # get report output
+    rep_out = os.path.join(OUTDIR, "Report_" +
+                           fitchtree.ori_aa + "_to_" + fitchtree.dest_aa)
+    # glob_purge.append(rep_out)
+    renderer.submit(pdf_format_data, fitchtree.ori_aa1, fitchtree.dest_aa1, gdata, prediction,
+                    codvalid, 'filtered', rep_out + ".pdf", settings.VALIDATION)
+
+    return data_var, OUTDIR, rkp, codvalid
+
+
+def render_reassignment_tree(tree, leaf_data, colors, c_rea, ori_aa, dest_aa, codon_data, settings,
+                             output, dpi=800, pie_size=45):
+    """Render the tree of a reassignment with the codon usage of each genome.
+    leaf_data holds the codon counts and the lost test of each genome, as in
+    the evidence of the reassignment"""
+    ts = TreeStyle()
+    ts.show_leaf_name = False
+    ts.show_branch_length = False
+    ts.show_branch_support = False
+
+    rea_style = NodeStyle()
+    rea_style["shape"] = "square"
+    rea_style["size"] = 7
+    rea_style["fgcolor"] = "crimson"
+    rea_style["hz_line_type"] = 0
+
+    other_style = NodeStyle()
+    other_style["shape"] = "circle"
+    other_style["size"] = 7
+    other_style["fgcolor"] = "seagreen"
+    other_style["node_bgcolor"] = "crimson"
+    other_style["hz_line_type"] = 0
+
+    prob_lost = NodeStyle()
+    prob_lost["hz_line_type"] = 1
+    prob_lost["hz_line_color"] = "#cccccc"
+
+    default_style = NodeStyle()
+    default_style["size"] = 0
+    default_style["fgcolor"] = "black"
+    show_n = settings.ADD_NUMBER_PIE
 
-            if node.is_leaf() and ('filter_count' in node.features):
-                faces.add_face_to_node(AttrFace(
-                    "filter_count", fsize=6, fgcolor="indigo"), node, column=0, position="branch-top")
-                has_fcount = node.filter_count
+    def layout(node):
 
-            if node.is_leaf():
-                if not (has_fcount or has_count):
-                    faces.add_face_to_node(
-                        AttrFace("name", text_suffix=get_suffix("_B")), node, 0, position="aligned")
+        get_suffix = lambda x: x if settings.ADD_LABEL_TO_LEAF else ""
+        faces.add_face_to_node(
+            AttrFace("rea", fsize=10), node, column=0, position="branch-right")
 
-                else:
-                    # if lost in node.features, then node is already a leaf
-                    # color change only concern leaf with count
-                    if(c_rea.get(node.name, False)):
-                        # Reassigned and passed fisher test
-                        if 'lost' in node.features and not node.lost:
-                            faces.add_face_to_node(AttrFace("name", fgcolor="#ff1111",
-                                                            text_suffix=get_suffix("_R")), node, column=0, position="aligned")
-                        # Reassigned and failed fisher test
-                        else:
-                            faces.add_face_to_node(AttrFace("name", fgcolor="#fc8d59",
-                                                            text_suffix=get_suffix("_O")), node, column=0, position="aligned")
-
-                    elif 'lost' in node.features and not node.lost:
-                        faces.add_face_to_node(AttrFace("name", fgcolor="#1a9850",
-                                                        text_suffix=get_suffix("_G")), node, column=0, position="aligned")
+        has_count, has_fcount = 0, 0
+        if node.is_leaf() and ('count' in node.features):
+            faces.add_face_to_node(AttrFace(
+                "count", fsize=6, fgcolor="firebrick"), node, column=0, position="branch-bottom")
+            has_count = node.count
+
+        if node.is_leaf() and ('filter_count' in node.features):
+            faces.add_face_to_node(AttrFace(
+                "filter_count", fsize=6, fgcolor="indigo"), node, column=0, position="branch-top")
+            has_fcount = node.filter_count
+
+        if node.is_leaf():
+            if not (has_fcount or has_count):
+                faces.add_face_to_node(
+                    AttrFace("name", text_suffix=get_suffix("_B")), node, 0, position="aligned")
+
+            else:
+                # if lost in node.features, then node is already a leaf
+                # color change only concern leaf with count
+                if(c_rea.get(node.name, False)):
+                    # Reassigned and passed fisher test
+                    if 'lost' in node.features and not node.lost:
+                        faces.add_face_to_node(AttrFace("name", fgcolor="#ff1111",
+                                                        text_suffix=get_suffix("_R")), node, column=0, position="aligned")
+                    # Reassigned and failed fisher test
                     else:
-                        faces.add_face_to_node(
-                            AttrFace("name", text_suffix=get_suffix("_B")), node, 0, position="aligned")
+                        faces.add_face_to_node(AttrFace("name", fgcolor="#fc8d59",
+                                                        text_suffix=get_suffix("_O")), node, column=0, position="aligned")
 
-            if(fitchtree.has_codon_data() and node.is_leaf()):
-                spec_codonrea_f = gdata[node.name]['filtered']['rea_codon']
-                spec_codonused_f = gdata[node.name]['filtered']['used_codon']
+                elif 'lost' in node.features and not node.lost:
+                    faces.add_face_to_node(AttrFace("name", fgcolor="#1a9850",
+                                                    text_suffix=get_suffix("_G")), node, column=0, position="aligned")
+                else:
+                    faces.add_face_to_node(
+                        AttrFace("name", text_suffix=get_suffix("_B")), node, 0, position="aligned")
 
-                # add data
-                faces.add_face_to_node(PPieChartFace(list(spec_codonrea_f.values()), pie_size, pie_size, show_label=show_n,
-                                                     colors=[fitchtree.colors[k] for k in list(spec_codonrea_f.keys())]),
-                                       node, column=1, position="aligned")
+        if(codon_data and node.is_leaf()):
+            spec_codonrea_f = leaf_data[node.name]['filtered']['rea_codon']
+            spec_codonused_f = leaf_data[node.name]['filtered']['used_codon']
 
-                faces.add_face_to_node(PPieChartFace(list(spec_codonused_f.values()), pie_size, pie_size, show_label=show_n,
-                                                     colors=[fitchtree.colors[k] for k in list(spec_codonused_f.keys())]),
-                                       node, column=2, position="aligned")
+            # add data
+            faces.add_face_to_node(PPieChartFace(list(spec_codonrea_f.values()), pie_size, pie_size, show_label=show_n,
+                                                 colors=[colors[k] for k in list(spec_codonrea_f.keys())]),
+                                   node, column=1, position="aligned")
 
-                next_column = 3
+            faces.add_face_to_node(PPieChartFace(list(spec_codonused_f.values()), pie_size, pie_size, show_label=show_n,
+                                                 colors=[colors[k] for k in list(spec_codonused_f.keys())]),
+                                   node, column=2, position="aligned")
 
-                if(settings.SHOW_MIXTE_CODONS):
-                    spec_mixtecodon_f = gdata[node.name][
-                        'filtered']['mixte_codon']
-                    faces.add_face_to_node(PPieChartFace(list(spec_mixtecodon_f.values()), pie_size, pie_size, show_label=show_n,
-                                                         colors=[fitchtree.colors[k] for k in list(spec_mixtecodon_f.keys())]),
-                                           node, column=3, position="aligned")
-                    next_column = 4
-
-                if(settings.SHOW_GLOBAL_CODON_DATA):
-                    spec_codonrea_g = gdata[node.name]['global']['rea_codon']
-                    spec_codonused_g = gdata[node.name]['global']['used_codon']
-
-                    # add separator
-                    faces.add_face_to_node(LineFace(
-                        pie_size, pie_size, None), node, column=next_column, position="aligned")
-
-                    faces.add_face_to_node(PPieChartFace(list(spec_codonrea_g.values()), pie_size, pie_size, show_label=show_n,
-                                                         colors=[fitchtree.colors[k] for k in list(spec_codonrea_g.keys())]),
-                                           node, column=next_column + 1, position="aligned")
-
-                    faces.add_face_to_node(PPieChartFace(list(spec_codonused_g.values()), pie_size, pie_size, show_label=show_n,
-                                                         colors=[fitchtree.colors[k] for k in list(spec_codonused_g.keys())]),
-                                           node, column=next_column + 2, position="aligned")
-
-                    next_column += 3
-                    if(settings.SHOW_MIXTE_CODONS):
-                        spec_mixtecodon_g = gdata[node.name][
-                            'global']['mixte_codon']
-                        faces.add_face_to_node(PPieChartFace(list(spec_mixtecodon_g.values()), pie_size, pie_size, show_label=show_n,
-                                                             colors=[fitchtree.colors[k] for k in list(spec_mixtecodon_g.keys())]),
-                                               node, column=next_column, position="aligned")
-                        next_column += 1
+            next_column = 3
 
+            if(settings.SHOW_MIXTE_CODONS):
+                spec_mixtecodon_f = leaf_data[node.name][
+                    'filtered']['mixte_codon']
+                faces.add_face_to_node(PPieChartFace(list(spec_mixtecodon_f.values()), pie_size, pie_size, show_label=show_n,
+                                                     colors=[colors[k] for k in list(spec_mixtecodon_f.keys())]),
+                                       node, column=3, position="aligned")
+                next_column = 4
+
+            if(settings.SHOW_GLOBAL_CODON_DATA):
+                spec_codonrea_g = leaf_data[node.name]['global']['rea_codon']
+                spec_codonused_g = leaf_data[node.name]['global']['used_codon']
+
+                # add separator
                 faces.add_face_to_node(LineFace(
                     pie_size, pie_size, None), node, column=next_column, position="aligned")
 
-                faces.add_face_to_node(TextFace("{:.2e}".format(gdata[node.name]['lost']['pval']), fsize=10, fgcolor="#000"),
+                faces.add_face_to_node(PPieChartFace(list(spec_codonrea_g.values()), pie_size, pie_size, show_label=show_n,
+                                                     colors=[colors[k] for k in list(spec_codonrea_g.keys())]),
                                        node, column=next_column + 1, position="aligned")
 
-        ts.layout_fn = layout
-
-        # header declaration
-        h1 = TextFace(fitchtree.dest_aa, fsize=10, fgcolor="#aa0000")
-        h2 = TextFace(fitchtree.ori_aa, fsize=10, fgcolor="#aa0000")
-        h3 = TextFace(fitchtree.ori_aa + " O.", fsize=10, fgcolor="#aa0000")
-        h1g = TextFace(fitchtree.dest_aa, fsize=10, fgcolor="#aa0000")
-        h2g = TextFace(fitchtree.ori_aa, fsize=10, fgcolor="#aa0000")
-        h3g = TextFace(fitchtree.ori_aa + " O.", fsize=10, fgcolor="#aa0000")
-        # center vertically and horizontally
-        h1.vt_align, h2.vt_align, h3.vt_align = 1, 1, 1
-        h1.hz_align, h2.hz_align, h3.hz_align = 1, 1, 2
-        h1g.hz_align, h2g.hz_align, h3g.hz_align = 1, 1, 1
-        h1g.hz_align, h2g.hz_align, h3g.hz_align = 1, 1, 2
-
-        ts.aligned_header.add_face(h1, column=1)
-        ts.aligned_header.add_face(h2, column=2)
-        next_column = 3
-        if(settings.SHOW_MIXTE_CODONS):
-            ts.aligned_header.add_face(h3, column=3)
-            next_column = 4
-
-        if settings.SHOW_GLOBAL_CODON_DATA:
-            ts.aligned_header.add_face(h1g, column=next_column + 1)
-            ts.aligned_header.add_face(h2g, column=next_column + 2)
-            next_column += 3
-            if(settings.SHOW_MIXTE_CODONS):
-                ts.aligned_header.add_face(h3g, column=next_column)
-                next_column += 1
-
-        f_pval_h = TextFace("FE. pval", fsize=10, fgcolor="#aa0000")
-        f_pval_h.vt_align = 1
-        f_pval_h.hz_align = 1
-        ts.aligned_header.add_face(f_pval_h, column=next_column + 1)
-
-        ts.title.add_face(TextFace(fitchtree.ori_aa + " --> " +
-                                   fitchtree.dest_aa, fsize=14), column=0)
-        if(fitchtree.has_codon_data()):
-            for cod, col in list(fitchtree.colors.items()):
-                ts.legend.add_face(CircleFace(
-                    (pie_size / 3), col), column=0)
-                ts.legend.add_face(
-                    TextFace("  " + cod + " ", fsize=8), column=0)
-            ts.legend_position = 4
-
-        # Apply node style
-        for n in fitchtree.tree.traverse():
-            n.set_style(default_style)
-            if n.reassigned == {1}:
-                n.set_style(rea_style)
-            elif len(n.reassigned) > 1:
-                n.set_style(other_style)
-            if 'lost' in n.features and n.lost:
-                n.set_style(prob_lost)
-
-        fitchtree.tree.render(output, dpi=800, tree_style=ts)
-        glob_purge.append(output)
-
-        rkp, data_var, codvalid = None, None, {}
-        if settings.VALIDATION:
-            # now get sequence retranslation improvement
-            table = fitchtree.dct.forward_table
-            # add the gap to codon_table
-            table['---'] = '-'
-            table['...'] = '.'
-            data_present, data_var, rkp, codvalid = codon_adjust_improve(
-                fitchtree, reafinder, codon_align, table, prediction, outdir=OUTDIR)
+                faces.add_face_to_node(PPieChartFace(list(spec_codonused_g.values()), pie_size, pie_size, show_label=show_n,
+                                                     colors=[colors[k] for k in list(spec_codonused_g.keys())]),
+                                       node, column=next_column + 2, position="aligned")
 
-        # get report output
-        rep_out = os.path.join(OUTDIR, "Report_" +
-                               fitchtree.ori_aa + "_to_" + fitchtree.dest_aa)
-        # glob_purge.append(rep_out)
-        pdf_format_data(fitchtree.ori_aa1, fitchtree.dest_aa1, gdata, prediction,
-                        codvalid, 'filtered', rep_out + ".pdf", settings.VALIDATION)
+                next_column += 3
+                if(settings.SHOW_MIXTE_CODONS):
+                    spec_mixtecodon_g = leaf_data[node.name][
+                        'global']['mixte_codon']
+                    faces.add_face_to_node(PPieChartFace(list(spec_mixtecodon_g.values()), pie_size, pie_size, show_label=show_n,
+                                                         colors=[colors[k] for k in list(spec_mixtecodon_g.keys())]),
+                                           node, column=next_column, position="aligned")
+                    next_column += 1
 
-        return data_var, OUTDIR, rkp, codvalid
+            faces.add_face_to_node(LineFace(
+                pie_size, pie_size, None), node, column=next_column, position="aligned")
 
+            faces.add_face_to_node(TextFace("{:.2e}".format(leaf_data[node.name]['lost']['pval']), fsize=10, fgcolor="#000"),
+                                   node, column=next_column + 1, position="aligned")
 
-def format_tree(tree, codon, cible, alignment, SP_score, ic_contents, pos=[],
-                limits=(None, None, None), dtype="aa", codontable={}, codon_col={}, colors=None):
-    """Format the rendering of tree data for alignment"""
-    t = tree.copy('newick')
+    ts.layout_fn = layout
 
+    # header declaration
+    h1 = TextFace(dest_aa, fsize=10, fgcolor="#aa0000")
+    h2 = TextFace(ori_aa, fsize=10, fgcolor="#aa0000")
+    h3 = TextFace(ori_aa + " O.", fsize=10, fgcolor="#aa0000")
+    h1g = TextFace(dest_aa, fsize=10, fgcolor="#aa0000")
+    h2g = TextFace(ori_aa, fsize=10, fgcolor="#aa0000")
+    h3g = TextFace(ori_aa + " O.", fsize=10, fgcolor="#aa0000")
+    # center vertically and horizontally
+    h1.vt_align, h2.vt_align, h3.vt_align = 1, 1, 1
+    h1.hz_align, h2.hz_align, h3.hz_align = 1, 1, 2
+    h1g.hz_align, h2g.hz_align, h3g.hz_align = 1, 1, 1
+    h1g.hz_align, h2g.hz_align, h3g.hz_align = 1, 1, 2
+
+    ts.aligned_header.add_face(h1, column=1)
+    ts.aligned_header.add_face(h2, column=2)
+    next_column = 3
+    if(settings.SHOW_MIXTE_CODONS):
+        ts.aligned_header.add_face(h3, column=3)
+        next_column = 4
+
+    if settings.SHOW_GLOBAL_CODON_DATA:
+        ts.aligned_header.add_face(h1g, column=next_column + 1)
+        ts.aligned_header.add_face(h2g, column=next_column + 2)
+        next_column += 3
+        if(settings.SHOW_MIXTE_CODONS):
+            ts.aligned_header.add_face(h3g, column=next_column)
+            next_column += 1
+
+    f_pval_h = TextFace("FE. pval", fsize=10, fgcolor="#aa0000")
+    f_pval_h.vt_align = 1
+    f_pval_h.hz_align = 1
+    ts.aligned_header.add_face(f_pval_h, column=next_column + 1)
+
+    ts.title.add_face(TextFace(ori_aa + " --> " +
+                               dest_aa, fsize=14), column=0)
+    if(codon_data):
+        for cod, col in list(colors.items()):
+            ts.legend.add_face(CircleFace(
+                (pie_size / 3), col), column=0)
+            ts.legend.add_face(
+                TextFace("  " + cod + " ", fsize=8), column=0)
+        ts.legend_position = 4
+
+    # Apply node style
+    for n in tree.traverse():
+        n.set_style(default_style)
+        if n.reassigned == {1}:
+            n.set_style(rea_style)
+        elif len(n.reassigned) > 1:
+            n.set_style(other_style)
+        if 'lost' in n.features and n.lost:
+            n.set_style(prob_lost)
+
+    tree.render(output, dpi=dpi, tree_style=ts)
+
+
+def get_leaf_sequences(tree, alignment, pos=[], limits=(None, None, None), dtype="aa"):
+    """Return the sequence of each leaf in alignment, restricted to the
+    positions pos and split by gene if pos is given"""
     gpos, limiter, start_holder = limits
 
     def _get_genes(seq, jump=1):
@@ -2107,11 +2609,27 @@ def format_tree(tree, codon, cible, alignment, SP_score, ic_contents, pos=[],
                 ppos = l
         return gseq
 
-    for node in t:
+    sequences = {}
+    for node in tree:
         node_seq = alignment[node.name].seq.tostring()
         if pos:
             node_seq = _get_genes(node_seq, 2 * (dtype == "codon") + 1)
-        node.add_feature('sequence', node_seq)
+        sequences[node.name] = node_seq
+    return sequences
+
+
+def format_tree(tree, codon, cible, alignment, SP_score, ic_contents, pos=[],
+                limits=(None, None, None), dtype="aa", codontable={}, codon_col={}, colors=None, sequences=None):
+    """Format the rendering of tree data for alignment. The leaf sequences
+    are read from alignment, unless they are given by sequences
+    (see get_leaf_sequences)"""
+    t = tree.copy('newick')
+
+    gpos, limiter, start_holder = limits
+    if sequences is None:
+        sequences = get_leaf_sequences(t, alignment, pos, limits, dtype)
+    for node in t:
+        node.add_feature('sequence', sequences[node.name])
 
     ts = TreeStyle()
     ts.branch_vertical_margin = 15
@@ -2200,6 +2718,16 @@ def format_tree(tree, codon, cible, alignment, SP_score, ic_contents, pos=[],
     return t, ts
 
 
+def render_alignment_tree(tree, codon, cible, sequences, SP_score, ic_contents, pos, limits, output,
+                          dpi=800, title=None, **kwargs):
+    """Render the leaf sequences on the tree, see format_tree"""
+    t, ts = format_tree(tree, codon, cible, None, SP_score, ic_contents, pos, limits,
+                        sequences=sequences, **kwargs)
+    if title:
+        ts.title.add_face(TextFace(title, fsize=14), column=0)
+    t.render(output, dpi=dpi, tree_style=ts)
+
+
 def identify_position_with_codon(fcodal, codon, spec_to_check):
     """Get all positions where a codon is used"""
     positions = []
@@ -2258,17 +2786,19 @@ def codon_adjust_improve(fitchtree, reafinder, codon_align, codontable, predicti
     X_data, X_labels, pred_prob, pred = prediction
     true_codon_set = get_codon_set_and_genome(pred, X_labels, 1)
     settings = reafinder.settings
+    renderer = reafinder.renderer
     genelimit = reafinder.seqset.gene_limits
     filt_position = reafinder.seqset.filt_position
     sc_meth = settings.MATRIX
     method = settings.MODE if settings.MODE in [
         'wilcoxon', 'mannwhitney', 'ttest'] else 'wilcoxon'
     outputs = []
-    violinout = None
     data_var = {}
     ori_al = None
     ic = None
     tree = fitchtree.tree.copy("newick-extended")
+    # Dollo reconstruction of the reassigned species, for check_gain
+    dollo = BitsetRec(fitchtree.atree, fitchtree.leaf_rea[fitchtree.atree.leaves], "dollo")
     rea_pos_keeper = defaultdict(dict)
     codvalid = {}
 
@@ -2306,7 +2836,7 @@ def codon_adjust_improve(fitchtree, reafinder, codon_align, codontable, predicti
             # pos = identify_position_with_codon(codon_align, codon, speclist)
             # check_gain is called only on filtered alignment
             # maybe it's a better idea to call it on the original alignmnt
-            score_improve, alsp, alic, als, pos, speclist = check_gain(codon, cible_aa, speclist, tree, codontable,
+            score_improve, alsp, alic, als, pos, speclist = check_gain(codon, cible_aa, speclist, dollo, codontable,
                                                                        codon_align, scoring_method=sc_meth,
                                                                        alignment=ori_al, ic_cont=ic, method=method)
             if not speclist:
@@ -2325,42 +2855,42 @@ def codon_adjust_improve(fitchtree, reafinder, codon_align, codontable, predicti
             sp, cor_sp = alsp
             ic, cor_ic = alic
             ori_al, new_al = als
-            violinout, viout = violin_plot({'Original': sp, 'Corrected': cor_sp},
-                                           os.path.join(
-                                               outdir, "%s_violin" % codon),
-                                           score_improve, codon, fitchtree.dest_aa, imformat=settings.IMAGE_FORMAT)
             tmpvalid = dict((x, 'crimson') for x in speclist)
-            ori_t, ori_ts = format_tree(
-                tree, codon, cible_aa, ori_al, sp, ic, pos, limits, colors=tmpvalid)
-            rea_t, rea_ts = format_tree(
-                tree, codon, cible_aa, new_al, cor_sp, cor_ic, pos, limits, colors=tmpvalid)
-            cod_t, cod_ts = format_tree(tree, codon, cible_aa, codon_align, None, None, pos, limits,
-                                        codontable=codontable, dtype="codon", codon_col=fitchtree.colors, colors=tmpvalid)
-
-            cod_ts.title.add_face(TextFace(
-                "Prediction validation for " + codon + " to " + fitchtree.dest_aa, fsize=14), column=0)
-
+            viout = (codon, fitchtree.dest_aa, score_improve)
             logging.debug('{} --> {} : {:.2e}'.format(*viout))
 
             codvalid[codon] = (tmpvalid, viout[-1] < reafinder.confd)
 
-            cod_out = os.path.join(outdir, "%s_codons.%s" %
-                                   (codon, settings.IMAGE_FORMAT))
-            ori_out = os.path.join(outdir, "%s_ori.%s" %
-                                   (codon, settings.IMAGE_FORMAT))
-            rea_out = os.path.join(outdir, "%s_rea.%s" %
-                                   (codon, settings.IMAGE_FORMAT))
-
-            ori_t.render(ori_out, dpi=800, tree_style=ori_ts)
-            rea_t.render(rea_out, dpi=800, tree_style=rea_ts)
-            cod_t.render(cod_out, dpi=800, tree_style=cod_ts)
+            if renderer.enabled:
+                violinout = os.path.join(outdir, "%s_violin" % codon)
+                renderer.submit(violin_plot, {'Original': sp, 'Corrected': cor_sp}, violinout,
+                                score_improve, codon, fitchtree.dest_aa, imformat=settings.IMAGE_FORMAT)
+                glob_purge.append(violinout + "." + settings.IMAGE_FORMAT)
+
+            if GRAPHICAL_ACCESS and renderer.enabled:
+                cod_out = os.path.join(outdir, "%s_codons.%s" %
+                                       (codon, settings.IMAGE_FORMAT))
+                ori_out = os.path.join(outdir, "%s_ori.%s" %
+                                       (codon, settings.IMAGE_FORMAT))
+                rea_out = os.path.join(outdir, "%s_rea.%s" %
+                                       (codon, settings.IMAGE_FORMAT))
+                # the renderer only gets the sequences at the positions shown
+                renderer.submit(render_alignment_tree, tree, codon, cible_aa,
+                                get_leaf_sequences(tree, ori_al, pos, limits), sp, ic, pos, limits,
+                                ori_out, dpi=settings.RENDER_DPI, colors=tmpvalid)
+                renderer.submit(render_alignment_tree, tree, codon, cible_aa,
+                                get_leaf_sequences(tree, new_al, pos, limits), cor_sp, cor_ic, pos, limits,
+                                rea_out, dpi=settings.RENDER_DPI, colors=tmpvalid)
+                renderer.submit(render_alignment_tree, tree, codon, cible_aa,
+                                get_leaf_sequences(tree, codon_align, pos, limits, dtype="codon"), None, None,
+                                pos, limits, cod_out, dpi=settings.RENDER_DPI,
+                                title="Prediction validation for " + codon + " to " + fitchtree.dest_aa,
+                                codontable=codontable, dtype="codon", codon_col=fitchtree.colors, colors=tmpvalid)
+                glob_purge.append(cod_out)
+                glob_purge.append(rea_out)
+                glob_purge.append(ori_out)
 
             data_var[codon] = score_improve
-
-            glob_purge.append(cod_out)
-            glob_purge.append(rea_out)
-            glob_purge.append(ori_out)
-            glob_purge.append(violinout)
             outputs.append(True)
 
     return len(outputs) > 0, data_var, rea_pos_keeper, codvalid
@@ -12,16 +12,30 @@ AA_MAJORITY_THRESH = 0.5
 
 # Mode to compute suspected species
 # possible values : count, wilcoxon, mannwhitney, kmean, ttest
-# kmean does not work well, use wilcoxon
+# kmean is faster but usually less accurate, prefer wilcoxon
 MODE = 'wilcoxon'
 
+# Clustering parameters of the kmean mode :
+# random seed (the result is deterministic for a given seed),
+# maximum number of iterations, convergence tolerance on the
+# centers, and number of species used at each iteration
+# (mini-batch k-means, None to use all the species)
+CLUSTER_SEED = 12345
+CLUSTER_MAXITER = 100
+CLUSTER_TOL = 1e-4
+CLUSTER_BATCH_SIZE = None
+
 # Distance matrice :
 # possible values :  identity or any of the biopython available matrices
 # see https://web.archive.org/web/19991014010917/http://www.embl-heidelberg.de/~vogt/matrices/mlist1.html
 MATRIX = 'blosum62'
 
 # Do not attempt to filter results by limiting
-# analysis to more likely reassignment
+# analysis to more likely reassignment.
+# When False (default), the reassignments that cannot be valid (not enough
+# substitutions, or lost in every genome according to the contingency
+# tests) are discarded before the evidence of all genomes is computed, and
+# are not reported. Set to True to report them, as previous versions did
 SHOW_ALL = False
 
 # Limit prediction to suspected species for each reassignment
@@ -76,6 +90,33 @@ CONF = 0.05
 # codon start range
 STARTDIST = 20
 
+# Maximum number of contingency test pvalues kept in memory
+STAT_CACHE_SIZE = 100000
+
+# Json file used to keep the contingency test pvalues between runs
+# None to disable
+STAT_CACHE_FILE = None
+
+# Number of threads used to run the contingency tests of each
+# reassignment (1 to run them sequentially)
+STAT_THREADS = 1
+
+# Json file where the time taken by each reassignment is kept, to
+# dispatch the heaviest first in later runs.
+# None to use coretracker/pair_timings.json in the user cache directory
+# ($XDG_CACHE_HOME or ~/.cache), shared by all the runs
+PAIR_TIMINGS_FILE = None
+
+# Whether or not the figures of the reports should be rendered
+RENDER = True
+
+# Number of processes rendering the figures while the analysis runs
+# (0 to render them right away)
+RENDER_PROCS = 1
+
+# Resolution of the rendered trees
+RENDER_DPI = 800
+
 # Learning model to use for prediction
 MODEL_TYPE = '3'
 
@@ -66,6 +66,13 @@ class Settings():
             'HMMLOOP', parameters.HMMLOOP)
         # choose algorithm for computing the suspected species
         self.MODE = kwargs.get('MODE', parameters.MODE)
+        # clustering parameters of the kmean mode
+        self.CLUSTER_SEED = kwargs.get('CLUSTER_SEED', parameters.CLUSTER_SEED)
+        self.CLUSTER_MAXITER = kwargs.get(
+            'CLUSTER_MAXITER', parameters.CLUSTER_MAXITER)
+        self.CLUSTER_TOL = kwargs.get('CLUSTER_TOL', parameters.CLUSTER_TOL)
+        self.CLUSTER_BATCH_SIZE = kwargs.get(
+            'CLUSTER_BATCH_SIZE', parameters.CLUSTER_BATCH_SIZE)
 
         # choose matrix to compute substitution, default is blosum62
         self.MATRIX = kwargs.get('MATRIX', parameters.MATRIX)
@@ -79,7 +86,23 @@ class Settings():
         # alpha to use , default is 0.05
         self.CONF = kwargs.get('CONF', parameters.CONF)
         self.STARTDIST = kwargs.get('STARTDIST', parameters.STARTDIST)
-        self.SHOW_ALL = kwargs.get('SHOW_ALL', parameters.STARTDIST)
+        # maximum number of cached pvalues of contingency tests
+        self.STAT_CACHE_SIZE = kwargs.get(
+            'STAT_CACHE_SIZE', parameters.STAT_CACHE_SIZE)
+        # json file where the pvalue cache is kept between runs
+        self.STAT_CACHE_FILE = kwargs.get(
+            'STAT_CACHE_FILE', parameters.STAT_CACHE_FILE)
+        # number of threads used for the contingency tests
+        self.STAT_THREADS = kwargs.get('STAT_THREADS', parameters.STAT_THREADS)
+        # json file of the time taken by each reassignment
+        self.PAIR_TIMINGS_FILE = kwargs.get(
+            'PAIR_TIMINGS_FILE', parameters.PAIR_TIMINGS_FILE)
+        # whether the figures are rendered, number of rendering processes
+        # and resolution of the trees
+        self.RENDER = kwargs.get('RENDER', parameters.RENDER)
+        self.RENDER_PROCS = kwargs.get('RENDER_PROCS', parameters.RENDER_PROCS)
+        self.RENDER_DPI = kwargs.get('RENDER_DPI', parameters.RENDER_DPI)
+        self.SHOW_ALL = kwargs.get('SHOW_ALL', parameters.SHOW_ALL)
         # output format. Should be pdf for the moment
         self.IMAGE_FORMAT = "pdf"
         # The following are the binaries setting for HMMER package
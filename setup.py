@@ -25,17 +25,12 @@ sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), "pyt
 def configuration(top_path=''):
     fexact_sources = [
         'coretracker/FisherExact/statlib/fexact.pyf',
-        'coretracker/FisherExact/statlib/FEXACT.F90',
-        'coretracker/FisherExact/statlib/prterr.f'
+        'coretracker/FisherExact/statlib/FEXACT.F90'
     ]
 
     fexact = Ext(name='coretracker.FisherExact.statlib.fexact', sources=[
                  os.path.join(top_path, x) for x in fexact_sources])
-    asa159 = Ext(name='coretracker.FisherExact.statlib.asa159', sources=[
-                 os.path.join(top_path, 'coretracker/FisherExact/statlib', 'asa159.f90')])
-    asa205 = Ext(name='coretracker.FisherExact.statlib.asa205', sources=[
-                 os.path.join(top_path, 'coretracker/FisherExact/statlib', 'asa205.f90')])
-    return [fexact, asa205, asa159]
+    return [fexact]
 
 
 def setup_package():
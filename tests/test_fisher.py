@@ -0,0 +1,80 @@
+import itertools
+import unittest
+
+import numpy as np
+from scipy.special import gammaln
+
+from coretracker.FisherExact import fisher_exact
+
+
+def _tables(rows, cols):
+    """Enumerate all the tables with the given margins"""
+    if len(rows) == 1:
+        yield [list(cols)]
+        return
+    ranges = [range(min(rows[0], c) + 1) for c in cols[:-1]]
+    for head in itertools.product(*ranges):
+        last = rows[0] - sum(head)
+        if 0 <= last <= cols[-1]:
+            row = list(head) + [last]
+            rest = [c - x for c, x in zip(cols, row)]
+            for sub in _tables(rows[1:], rest):
+                yield [row] + sub
+
+
+def _brute_pval(c, midP=False, reltol=1e-7):
+    """Fisher exact test p-value by complete enumeration of the tables"""
+    c = np.asarray(c)
+    rows, cols = c.sum(axis=1), c.sum(axis=0)
+    const = gammaln(rows + 1).sum() + gammaln(cols + 1).sum() - \
+        gammaln(c.sum() + 1)
+    logps = const - gammaln(
+        np.array(list(_tables(list(rows), list(cols)))) + 1).sum(axis=(1, 2))
+    logpobs = const - gammaln(c + 1).sum()
+    pval = np.exp(logps[logps <= logpobs + abs(logpobs) * reltol]).sum()
+    if midP:
+        pval -= 0.5 * np.exp(logpobs)
+    return pval
+
+
+class FisherExactTest(unittest.TestCase):
+
+    def setUp(self):
+        rs = np.random.RandomState(2)
+        self.tables = [rs.randint(0, hi, shape) for shape, hi in
+                       [((3, 3), 8), ((4, 3), 5), ((5, 3), 4), ((3, 4), 6)]
+                       for _ in range(5)]
+
+    def test_brute_force(self):
+        for c in self.tables:
+            for midP in (False, True):
+                self.assertTrue(np.isclose(fisher_exact(c, midP=midP),
+                                           _brute_pval(c, midP), rtol=1e-6),
+                                "%s, midP=%s" % (c.tolist(), midP))
+
+    def test_midp_r_x_2(self):
+        rs = np.random.RandomState(3)
+        for nr, hi in [(2, 30), (3, 25), (4, 15), (6, 6)]:
+            for _ in range(5):
+                c = rs.randint(0, hi, (nr, 2))
+                pval = _brute_pval(c, midP=True)
+                self.assertTrue(np.isclose(fisher_exact(c, midP=True), pval,
+                                           rtol=1e-6), c.tolist())
+                self.assertTrue(np.isclose(fisher_exact(c.T, midP=True), pval,
+                                           rtol=1e-6), c.tolist())
+
+    def test_r_value(self):
+        # fisher.test(matrix(c(8, 1, 2, 5, 12, 2), nrow=2)) in R
+        pval = fisher_exact([[8, 2, 12], [1, 5, 2]])
+        self.assertAlmostEqual(pval, 0.01183, places=5)
+
+    def test_workspace_retry(self):
+        # needs a past path lengths table larger than workspace * 500, the
+        # value agrees with a simulation of 10^5 tables (0.2186)
+        c = [[7, 14, 8], [18, 13, 15], [9, 13, 8], [23, 17, 22], [24, 21, 9]]
+        pval = fisher_exact(c, workspace=300, attempt=3)
+        self.assertTrue(np.isclose(pval, 0.2174209305, rtol=1e-6))
+
+
+if __name__ == '__main__':
+    unittest.main()